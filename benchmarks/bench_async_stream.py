@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+# Measures how long it takes for a decoded code to reach a coroutine.
+#
+# callback:       frame decoded on a thread, code delivered by the decode
+#                 callback and passed to the event loop by the callback.
+# stream thread:  frame decoded on a thread, code delivered by
+#                 `protocols.stream`.
+# stream send:    frame decoded on the event loop using `DecodeStream.send`.
+#
+# The time it takes to decode the frame is part of every number.
+#
+# python benchmarks/bench_async_stream.py [iterations]
+
+from __future__ import print_function
+import os
+import sys
+import time
+import asyncio
+import threading
+
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+)
+
+from pyIRDecoder import protocols  # NOQA
+
+
+FRAMES = [
+    protocols.NEC.encode(1, 2, 3).original_rlc,
+    protocols.NEC.encode(1, 2, 4).original_rlc
+]
+
+
+def report(label, latencies):
+    latencies = sorted(latencies)
+    count = len(latencies)
+
+    print(
+        '{0:15s} mean {1:8.1f}us  p50 {2:8.1f}us  p99 {3:8.1f}us'.format(
+            label,
+            sum(latencies) / count * 1000000,
+            latencies[count // 2] * 1000000,
+            latencies[int(count * 0.99)] * 1000000
+        )
+    )
+
+
+def produce(iterations, start_times, ack):
+    for i in range(iterations):
+        ack.clear()
+        start_times.append(time.perf_counter())
+        protocols.decode(FRAMES[i % 2][:])
+        ack.wait()
+
+
+async def bench_callback(iterations):
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    start_times = []
+    ack = threading.Event()
+
+    def callback(code):
+        loop.call_soon_threadsafe(queue.put_nowait, code)
+
+    protocols.bind_callback(callback)
+    thread = threading.Thread(
+        target=produce,
+        args=(iterations, start_times, ack)
+    )
+    thread.start()
+
+    latencies = []
+    for _ in range(iterations):
+        await queue.get()
+        latencies.append(time.perf_counter() - start_times[len(latencies)])
+        ack.set()
+
+    thread.join()
+    protocols.unbind_callback()
+    return latencies
+
+
+async def bench_stream_thread(iterations):
+    start_times = []
+    ack = threading.Event()
+    latencies = []
+
+    async with protocols.stream() as stream:
+        thread = threading.Thread(
+            target=produce,
+            args=(iterations, start_times, ack)
+        )
+        thread.start()
+
+        async for event in stream:
+            if event.released:
+                continue
+
+            latencies.append(
+                time.perf_counter() - start_times[len(latencies)]
+            )
+            ack.set()
+
+            if len(latencies) == iterations:
+                break
+
+        thread.join()
+
+    return latencies
+
+
+async def bench_stream_send(iterations):
+    latencies = []
+
+    async with protocols.stream() as stream:
+        for i in range(iterations):
+            start = time.perf_counter()
+            await stream.send(FRAMES[i % 2][:])
+
+            async for event in stream:
+                if not event.released:
+                    break
+
+            latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print('iterations:', iterations)
+    print()
+
+    for label, bench in (
+        ('callback', bench_callback),
+        ('stream thread', bench_stream_thread),
+        ('stream send', bench_stream_send)
+    ):
+        # noinspection PyProtectedMember
+        protocols._reset_state()
+        report(label, asyncio.run(bench(iterations)))
+
+    protocols.close()
+
+
+if __name__ == '__main__':
+    main()
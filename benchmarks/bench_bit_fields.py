@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+# Builds the parameters of decoded frames for protocols that have a lot of
+# fields. It is done once pulling each field out of a list of bits, the way
+# the bits used to be stored, and once with shift and mask on the bits
+# packed into an int. The best of 5 runs gets printed.
+#
+# python benchmarks/bench_bit_fields.py [passes]
+
+from __future__ import print_function
+import os
+import sys
+import time
+import random
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from pyIRDecoder import protocols, code_wrapper, integer_wrapper  # NOQA
+
+
+DECODERS = ('NEC48', 'Kaseikyo56', 'Fujitsu128')
+
+
+def load_codes(count, seed=0):
+    rnd = random.Random(seed)
+    codes = []
+
+    for name in DECODERS:
+        decoder = getattr(protocols, name)
+
+        for _ in range(count):
+            params = list(
+                rnd.randint(min_val, max_val)
+                for _, min_val, max_val in decoder.encode_parameters
+            )
+            code = decoder.encode(*params)
+            code = decoder.decode(code.normalized_rlc[0], decoder.frequency)
+            decoder.reset(code)
+
+            # noinspection PyProtectedMember
+            wrapper = code._code
+            wrapper.bit_list = wrapper.bits
+            # noinspection PyProtectedMember
+            codes.append((wrapper, decoder._parameters))
+
+    return codes
+
+
+def _get_value(self, start_bit, stop_bit):
+    bits = self.bit_list[start_bit: stop_bit + 1]
+
+    res = 0
+
+    if self._encoding.startswith('lsb'):
+        for i, item in enumerate(bits):
+            res |= item << i
+    else:
+        for i, item in enumerate(bits):
+            res |= item << ~i + len(bits)
+
+    return integer_wrapper.IntegerWrapper(
+        res,
+        stop_bit - start_bit + 1,
+        self._bursts,
+        self._encoding
+    )
+
+
+def build_params(codes, passes):
+    # best of 5 runs, a single run is easily thrown off by whatever else
+    # is running
+    durations = []
+
+    for _ in range(5):
+        start = time.perf_counter()
+
+        for _ in range(passes):
+            for wrapper, parameters in codes:
+                params = {}
+                for name, start_bit, stop_bit in parameters:
+                    params[name] = wrapper.get_value(start_bit, stop_bit)
+
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def main():
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    codes = load_codes(20)
+    count = len(codes) * passes
+
+    print('frames:', len(codes))
+    print('passes:', passes)
+    print()
+
+    get_value = code_wrapper.CodeWrapper.get_value
+
+    code_wrapper.CodeWrapper.get_value = _get_value
+    try:
+        build_params(codes, 1)
+        bit_list = build_params(codes, passes)
+    finally:
+        code_wrapper.CodeWrapper.get_value = get_value
+
+    build_params(codes, 1)
+    packed = build_params(codes, passes)
+
+    for label, duration in (
+        ('bit list:', bit_list),
+        ('packed int:', packed)
+    ):
+        print(
+            '{0:12s} {1:8.3f}s {2:8.2f}us/frame'.format(
+                label,
+                duration,
+                duration / count * 1000000
+            )
+        )
+
+    print()
+    print('speedup: x{0:.2f}'.format(bit_list / packed))
+
+    protocols.close()
+
+
+if __name__ == '__main__':
+    main()
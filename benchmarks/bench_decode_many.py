@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+# Compares decoding a corpus of frames one frame at a time using
+# `protocols.decode` against `protocols.decode_many` with an increasing
+# number of processes.
+#
+# python benchmarks/bench_decode_many.py [number of frames]
+
+from __future__ import print_function
+import os
+import sys
+import time
+import random
+
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+)
+
+from pyIRDecoder import protocols  # NOQA
+
+
+DECODERS = [
+    'NEC', 'RC5', 'RC6', 'Sony12', 'Sony20', 'JVC', 'Panasonic', 'Samsung36'
+]
+
+
+def build_corpus(count, seed=0):
+    rnd = random.Random(seed)
+    frames = []
+
+    while len(frames) < count:
+        decoder = getattr(protocols, rnd.choice(DECODERS))
+        params = list(
+            rnd.randint(min_val, max_val)
+            for _, min_val, max_val in decoder.encode_parameters
+        )
+        code = decoder.encode(*params)
+
+        frames.append(
+            list(
+                int(item * rnd.uniform(0.95, 1.05))
+                for item in code.original_rlc
+            )
+        )
+
+    return frames
+
+
+def bench_sequential(frames):
+    start = time.perf_counter()
+
+    for data in frames:
+        # noinspection PyProtectedMember
+        protocols._reset_state()
+        try:
+            protocols.decode(data[:])
+        except Exception:  # NOQA
+            pass
+
+    return time.perf_counter() - start
+
+
+def bench_decode_many(frames, workers):
+    start = time.perf_counter()
+    for _ in protocols.decode_many(frames, workers=workers):
+        pass
+
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    frames = build_corpus(count)
+
+    print('frames:', count)
+    print('cpus:', os.cpu_count())
+    print()
+
+    duration = bench_sequential(frames)
+    print(
+        'sequential:   {0:8.2f}s {1:10.0f} frames/s'.format(
+            duration,
+            count / duration
+        )
+    )
+
+    workers = 1
+    baseline = None
+    while workers <= (os.cpu_count() or 1):
+        duration = bench_decode_many(frames, workers)
+        if baseline is None:
+            baseline = duration
+
+        print(
+            'workers {0:3d}:  {1:8.2f}s {2:10.0f} frames/s  x{3:.2f}'.format(
+                workers,
+                duration,
+                count / duration,
+                baseline / duration
+            )
+        )
+        workers *= 2
+
+    protocols.close()
+
+
+if __name__ == '__main__':
+    main()
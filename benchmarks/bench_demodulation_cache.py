@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+# Encodes random codes for every decoder that shares its spec with another
+# decoder and decodes them with the dispatcher. It is done once with every
+# decoder matching and parsing the frame on its own and once with the
+# decoders of a group sharing what the first one of them got out of the
+# frame. The best of 5 runs gets printed along with the groups.
+#
+# python benchmarks/bench_demodulation_cache.py [passes]
+
+from __future__ import print_function
+import os
+import sys
+import time
+import random
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from pyIRDecoder import protocols, IRException  # NOQA
+from pyIRDecoder.demodulation_cache import DemodulationCache  # NOQA
+
+
+def load_frames(count, seed=0):
+    rnd = random.Random(seed)
+    frames = []
+
+    for group in protocols.demodulation_groups:
+        for name in group:
+            decoder = getattr(protocols, name)
+
+            for _ in range(count):
+                params = list(
+                    rnd.randint(min_val, max_val)
+                    for _, min_val, max_val in decoder.encode_parameters
+                )
+                try:
+                    code = decoder.encode(*params)
+                except (IRException, TypeError, ValueError):
+                    continue
+
+                frames.append(
+                    (list(code.normalized_rlc[0]), decoder.frequency)
+                )
+
+    return frames
+
+
+def decode_all(frames, passes):
+    # best of 5 runs, a single run is easily thrown off by whatever else
+    # is running
+    durations = []
+
+    for _ in range(5):
+        start = time.perf_counter()
+
+        for _ in range(passes):
+            for frame, frequency in frames:
+                # noinspection PyProtectedMember
+                protocols._reset_state()
+                try:
+                    protocols.decode(frame, frequency)
+                except Exception:  # NOQA
+                    pass
+
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def main():
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    frames = load_frames(5)
+    count = len(frames) * passes
+
+    print('groups:')
+    for group in protocols.demodulation_groups:
+        print('   ', ', '.join(group))
+
+    print()
+    print('frames:', len(frames))
+    print('passes:', passes)
+    print()
+
+    protocols.demodulation_cache = None
+    decode_all(frames, 1)
+    separate = decode_all(frames, passes)
+
+    cache = DemodulationCache()
+    protocols.demodulation_cache = cache
+    decode_all(frames, 1)
+    cache.reset_counts()
+    shared = decode_all(frames, passes)
+
+    for label, duration in (
+        ('separate:', separate),
+        ('shared:', shared)
+    ):
+        print(
+            '{0:10s} {1:8.3f}s {2:8.1f}us/frame'.format(
+                label,
+                duration,
+                duration / count * 1000000
+            )
+        )
+
+    print()
+    print('cache hits:', cache.hits, 'misses:', cache.misses)
+    print('speedup: x{0:.2f}'.format(separate / shared))
+
+    protocols.close()
+
+
+if __name__ == '__main__':
+    main()
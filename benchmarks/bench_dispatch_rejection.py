@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+# Decodes every frame in the test_protocols test modules with the
+# dispatcher. It is done once the way it was done before, where every
+# decoder that turns a frame away raises an error that has its message put
+# together right away, and once with the decoders turning frames away
+# without raising anything. The timing tree the dispatcher uses cuts down
+# the number of decoders a frame gets handed to so the same gets done
+# handing every frame to every decoder as well.
+#
+# python benchmarks/bench_dispatch_rejection.py [passes]
+
+from __future__ import print_function
+import os
+import sys
+import glob
+import time
+import importlib
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from pyIRDecoder import protocols, protocol_base, IRException  # NOQA
+
+
+def load_frames():
+    frames = []
+
+    pattern = os.path.join(ROOT, 'test_protocols', 'test_*.py')
+    for path in sorted(glob.glob(pattern)):
+        module = importlib.import_module(
+            'test_protocols.' + os.path.basename(path)[:-3]
+        )
+        decoder = getattr(module, 'protocol', None)
+        if decoder is None:
+            continue
+
+        for value in vars(module).values():
+            if not isinstance(value, type) or not hasattr(value, 'rlc'):
+                continue
+
+            for rlc in value.rlc:
+                if rlc and isinstance(rlc[0], list):
+                    frames.extend((frame, decoder.frequency) for frame in rlc)
+                else:
+                    frames.append((rlc, decoder.frequency))
+
+    return frames
+
+
+def _reject(_, __):
+    return None
+
+
+def _exception_init(self, *args):
+    self._args = args
+    # formatted right away like it used to be
+    str(self)
+
+
+def decode_all(frames, passes):
+    start = time.perf_counter()
+
+    for _ in range(passes):
+        for frame, frequency in frames:
+            # noinspection PyProtectedMember
+            protocols._reset_state()
+            try:
+                protocols.decode(frame[:], frequency)
+            except Exception:  # NOQA
+                pass
+
+    return time.perf_counter() - start
+
+
+def decode_every_decoder(frames, passes):
+    # Universal takes any frame, the dispatcher only hands it the frames
+    # nothing else decoded
+    decoders = list(
+        decoder for decoder in protocols
+        if decoder.name != 'Universal'
+    )
+    start = time.perf_counter()
+
+    for _ in range(passes):
+        for frame, frequency in frames:
+            for decoder in decoders:
+                decoder._last_code = None
+
+                if decoder._reject(frame) is not None:
+                    continue
+
+                try:
+                    decoder.decode(frame[:], frequency)
+                except Exception:  # NOQA
+                    pass
+
+    return time.perf_counter() - start
+
+
+def run(func, frames, passes):
+    reject = protocol_base.IrProtocolBase._reject
+    exception_init = IRException.__init__
+
+    protocol_base.IrProtocolBase._reject = _reject
+    IRException.__init__ = _exception_init
+    try:
+        func(frames, 1)
+        raised = func(frames, passes)
+    finally:
+        protocol_base.IrProtocolBase._reject = reject
+        IRException.__init__ = exception_init
+
+    func(frames, 1)
+    rejected = func(frames, passes)
+
+    count = len(frames) * passes
+
+    for label, duration in (
+        ('raised:', raised),
+        ('rejected:', rejected)
+    ):
+        print(
+            '{0:10s} {1:8.3f}s {2:8.1f}us/frame'.format(
+                label,
+                duration,
+                duration / count * 1000000
+            )
+        )
+
+    print()
+    print('speedup: x{0:.2f}'.format(raised / rejected))
+    print()
+
+
+def main():
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    frames = load_frames()
+
+    print('frames:', len(frames))
+    print('passes:', passes)
+    print()
+
+    print('dispatcher:')
+    run(decode_all, frames, passes)
+
+    print('every decoder:')
+    run(decode_every_decoder, frames, passes)
+
+    protocols.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+# Hands frames of the RC6 and NEC families to every decoder of those
+# families that declares constant or inverted fields. Most of the decoders
+# are able to parse the stream of a frame that belongs to one of the others
+# and then have to turn it away on those fields. It is done once checking
+# the fields on the IRCode after it has been built, the way the decoders
+# used to, and once with the masks on the packed bitstream. The best of 5
+# runs gets printed.
+#
+# python benchmarks/bench_field_checks.py [passes]
+
+from __future__ import print_function
+import os
+import sys
+import time
+import random
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from pyIRDecoder import (  # NOQA
+    protocols,
+    protocol_base,
+    IRException,
+    DecodeError
+)
+
+
+DECODERS = (
+    'RC6',
+    'RC6620',
+    'RC6632',
+    'RC6M16',
+    'RC6M28',
+    'RC6M32',
+    'RC6M56',
+    'MCE',
+    'NEC',
+    'NECx',
+    'Pioneer',
+    'NEC48',
+)
+
+
+def load_frames(count, seed=0):
+    rnd = random.Random(seed)
+    frames = []
+
+    for name in DECODERS:
+        decoder = getattr(protocols, name)
+
+        for _ in range(count):
+            params = list(
+                rnd.randint(min_val, max_val)
+                for _, min_val, max_val in decoder.encode_parameters
+            )
+            try:
+                code = decoder.encode(*params)
+            except IRException:
+                continue
+
+            frames.append((list(code.normalized_rlc[0]), decoder.frequency))
+
+    return frames
+
+
+def _decode(self, data, frequency=0):
+    code = _base_decode(self, data, frequency)
+
+    # noinspection PyProtectedMember
+    wrapper = code._code
+    fields = {}
+    for name, start, stop in self._parameters:
+        fields[name] = wrapper.get_value(start, stop)
+
+    for name, value in self._constant_fields:
+        if fields[name] != value:
+            raise DecodeError('Checksum failed')
+
+    for name, other in self._inverted_fields:
+        if fields[name] != fields[other][True:len(fields[other]):0]:
+            raise DecodeError('Checksum failed')
+
+    return code
+
+
+_base_decode = protocol_base.IrProtocolBase.decode
+
+
+def decode_all(decoders, frames, passes):
+    # best of 5 runs, a single run is easily thrown off by whatever else
+    # is running
+    durations = []
+
+    for _ in range(5):
+        start = time.perf_counter()
+
+        for _ in range(passes):
+            for data, frequency in frames:
+                for decoder in decoders:
+                    try:
+                        code = decoder.decode(data, frequency)
+                    except IRException:
+                        continue
+
+                    decoder.reset(code)
+
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def main():
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    decoders = [getattr(protocols, name) for name in DECODERS]
+    frames = load_frames(20)
+    count = len(frames) * len(decoders) * passes
+
+    print('frames:', len(frames))
+    print('decoders:', len(decoders))
+    print('passes:', passes)
+    print()
+
+    get_field_checks = protocol_base.IrProtocolBase._get_field_checks
+
+    protocol_base.IrProtocolBase._get_field_checks = lambda self: None
+    protocol_base.IrProtocolBase.decode = _decode
+    try:
+        decode_all(decoders, frames, 1)
+        ircode = decode_all(decoders, frames, passes)
+    finally:
+        protocol_base.IrProtocolBase._get_field_checks = get_field_checks
+        protocol_base.IrProtocolBase.decode = _base_decode
+
+    decode_all(decoders, frames, 1)
+    masks = decode_all(decoders, frames, passes)
+
+    for label, duration in (
+        ('IRCode:', ircode),
+        ('bitmask:', masks)
+    ):
+        print(
+            '{0:12s} {1:8.3f}s {2:8.2f}us/decode'.format(
+                label,
+                duration,
+                duration / count * 1000000
+            )
+        )
+
+    print()
+    print('speedup: x{0:.2f}'.format(ircode / masks))
+
+    protocols.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+# Encodes codes with random parameters for protocols that work out their
+# checksums with the bit operations of IntegerWrapper and decodes them
+# again. It is done once with the bit operations going over one bit at a
+# time, the way IntegerWrapper used to, and once with the masks and the
+# byte tables. The best of 5 runs gets printed.
+#
+# python benchmarks/bench_integer_wrapper.py [passes]
+
+from __future__ import print_function
+import os
+import sys
+import time
+import random
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from pyIRDecoder import protocols, IRException  # NOQA
+from pyIRDecoder.integer_wrapper import IntegerWrapper  # NOQA
+
+
+PARAMETERS = {
+    'XMP': (
+        ('device', 0, 255),
+        ('sub_device', 0, 255),
+        ('function', 0, 65535),
+        ('oem', 0, 255),
+    ),
+    # the codes of the remote
+    'Sky': (
+        ('device', 0, 0),
+        ('function', 0, 255),
+    ),
+}
+
+DECODERS = ('XMP', 'Sky', 'Epson', 'Somfy')
+
+
+def _mask_bits(value, num_bits):
+    val = 0
+    for i in range(num_bits):
+        val |= ((value >> i) & 1) << i
+
+    return val
+
+
+# noinspection PyProtectedMember
+def _init(self, value, num_bits=None, timings=None, encoding=None):
+    if isinstance(value, IntegerWrapper):
+        if num_bits is None:
+            num_bits = value.num_bits
+            value = int(value)
+        else:
+            value = int(value)
+            if value >= 0:
+                value = _mask_bits(value, num_bits)
+    else:
+        if num_bits is None:
+            if value == 0:
+                num_bits = 1
+            else:
+                num_bits = value.bit_length()
+        else:
+            if value >= 0:
+                value = _mask_bits(value, num_bits)
+
+    self._num_bits = num_bits
+    self._value = value
+    self._timings = timings
+    self.encoding = encoding
+
+
+# noinspection PyProtectedMember
+def _getitem(self, item):
+    if not isinstance(item, slice):
+        if isinstance(item, IntegerWrapper):
+            item = int(item)
+
+        return list(self)[item]
+
+    if (
+            item.stop is not None is not item.step and
+            item.step != 0 <= item.stop
+    ):
+        val = IntegerWrapper(0)
+        for i in range(item.step, item.step + item.stop + 1):
+            val |= ((self >> i) & 0x1) << (i - item.step)
+
+        val = IntegerWrapper(val, item.stop, self._timings, self.encoding)
+
+    elif item.stop is not None and item.stop > 0:
+        val = IntegerWrapper(0)
+        for i in range(item.stop):
+            val |= ((self >> i) & 0x1) << i
+
+        val = IntegerWrapper(val, item.stop, self._timings, self.encoding)
+
+    elif item.stop is not None and item.stop < 0:
+        val = IntegerWrapper(0)
+        if item.step is not None and item.step > 0:
+            for i in range(item.step, item.step - item.stop + 1):
+                val |= ((self >> i) & 0x1) << (i - item.step)
+        else:
+            for i in range(-item.stop):
+                val |= ((self >> i) & 0x1) << i
+
+        val = reversed(
+            IntegerWrapper(val, -item.stop, self._timings, self.encoding)
+        )
+
+    elif item.stop is None and item.step is not None:
+        val = IntegerWrapper(0)
+        for i in range(item.step, len(self), 1):
+            val |= ((self >> i) & 0x1) << i
+
+        val = IntegerWrapper(
+            val,
+            len(self) - item.step,
+            self._timings,
+            self.encoding
+        )
+    else:
+        val = self
+
+    if item.start is True:
+        return val.invert_bits()
+
+    if item.start is not None:
+        if item.start < 0:
+            return item.start == ~val
+        else:
+            return item.start == val
+
+    return val
+
+
+# noinspection PyProtectedMember
+def _iter(self):
+    for i in range(self._num_bits):
+        yield int((self >> i) & 1)
+
+
+# noinspection PyProtectedMember
+def _reverse_bit_order(self, num_bits=None):
+    if num_bits is None:
+        num_bits = self._num_bits
+    elif isinstance(num_bits, IntegerWrapper):
+        num_bits = int(num_bits)
+
+    val = 0
+
+    for i in range(num_bits):
+        val |= (int(self >> i) & 1) << (~i + num_bits)
+
+    return IntegerWrapper(val, num_bits, self._timings, self.encoding)
+
+
+# noinspection PyProtectedMember
+def _invert_bits(self, num_bits=None):
+    if num_bits is None:
+        num_bits = self._num_bits
+    elif isinstance(num_bits, IntegerWrapper):
+        num_bits = int(num_bits)
+
+    val = 0
+
+    for i in range(num_bits):
+        val |= (1 - (int(self >> i) & 1)) << i
+
+    return IntegerWrapper(val, num_bits, self._timings, self.encoding)
+
+
+# noinspection PyProtectedMember
+def _num_one_bits(self):
+    count = 0
+
+    for i in range(self._num_bits):
+        count += self._value >> i & 1
+
+    return IntegerWrapper(
+        count,
+        timings=self._timings,
+        encoding=self.encoding
+    )
+
+
+def _bits(self):
+    bits = []
+    for bit in self:
+        bits.insert(0, bit)
+
+    return bits
+
+
+BIT_LOOPS = dict(
+    __init__=_init,
+    __getitem__=_getitem,
+    __iter__=_iter,
+    __reversed__=_reverse_bit_order,
+    reverse_bit_order=_reverse_bit_order,
+    invert_bits=_invert_bits,
+    num_one_bits=property(_num_one_bits),
+    bits=property(_bits),
+)
+
+
+def load_codes(count, seed=0):
+    rnd = random.Random(seed)
+    codes = []
+
+    for name in DECODERS:
+        decoder = getattr(protocols, name)
+        parameters = PARAMETERS.get(name, decoder.encode_parameters)
+
+        for _ in range(count):
+            params = dict(
+                (param, rnd.randint(min_val, max_val))
+                for param, min_val, max_val in parameters
+            )
+            codes.append((decoder, params))
+
+    return codes
+
+
+def encode_all(codes, passes):
+    # best of 5 runs, a single run is easily thrown off by whatever else
+    # is running
+    durations = []
+
+    for _ in range(5):
+        start = time.perf_counter()
+
+        for _ in range(passes):
+            for decoder, params in codes:
+                try:
+                    code = decoder.encode(**params)
+                    code = decoder.decode(
+                        code.normalized_rlc[0],
+                        decoder.frequency
+                    )
+                except IRException:
+                    continue
+
+                decoder.reset(code)
+
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def main():
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    codes = load_codes(50)
+    count = len(codes) * passes
+
+    print('decoders:', ', '.join(DECODERS))
+    print('codes:', len(codes))
+    print('passes:', passes)
+    print()
+
+    methods = dict(
+        (name, IntegerWrapper.__dict__[name]) for name in BIT_LOOPS
+    )
+
+    for name, method in BIT_LOOPS.items():
+        setattr(IntegerWrapper, name, method)
+    try:
+        encode_all(codes, 1)
+        loops = encode_all(codes, passes)
+    finally:
+        for name, method in methods.items():
+            setattr(IntegerWrapper, name, method)
+
+    encode_all(codes, 1)
+    tables = encode_all(codes, passes)
+
+    for label, duration in (
+        ('bit loops:', loops),
+        ('tables:', tables)
+    ):
+        print(
+            '{0:12s} {1:8.3f}s {2:8.2f}us/code'.format(
+                label,
+                duration,
+                duration / count * 1000000
+            )
+        )
+
+    print()
+    print('speedup: x{0:.2f}'.format(loops / tables))
+
+    protocols.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+# Builds the codes for frames of a handful of protocols from streams that
+# have already been parsed, the last step of decoding a frame, and measures
+# how long it takes and how much memory the codes hold on to. The frames
+# also get decoded from start to finish to see what it does to the whole.
+# It is done once with codes that make their repeat timer and callbacks when
+# they are built, the way IRCode used to, and once with the slotted IRCode
+# that makes them the first time they are needed. The best of 5 runs gets
+# printed.
+#
+# python benchmarks/bench_ircode.py [passes]
+
+from __future__ import print_function
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from pyIRDecoder import protocols, protocol_base, IRException  # NOQA
+from pyIRDecoder.ir_code import IRCode  # NOQA
+
+
+DECODERS = (
+    'NEC',
+    'RC5',
+    'RC6',
+    'Sony12',
+    'Samsung36',
+    'Denon',
+)
+
+
+class _EagerIRCode(IRCode):
+    # no __slots__ so the instances get a __dict__ like they used to
+
+    def __init__(self, *args, **kwargs):
+        IRCode.__init__(self, *args, **kwargs)
+        # noinspection PyStatementEffect
+        self.repeat_timer
+        self._get_callbacks()
+
+
+def load_frames(count, seed=0):
+    rnd = random.Random(seed)
+    frames = []
+
+    for name in DECODERS:
+        decoder = getattr(protocols, name)
+
+        for _ in range(count):
+            params = list(
+                rnd.randint(min_val, max_val)
+                for _, min_val, max_val in decoder.encode_parameters
+            )
+            try:
+                code = decoder.encode(*params)
+            except IRException:
+                continue
+
+            frames.append((decoder, list(code.normalized_rlc[0])))
+
+    return frames
+
+
+def load_parsed(frames):
+    parsed = []
+
+    for decoder, data in frames:
+        code = decoder.decode(data, decoder.frequency)
+        decoder.reset(code)
+        # noinspection PyProtectedMember
+        wrapper = code._code
+
+        params = dict(frequency=decoder.frequency)
+        # noinspection PyProtectedMember
+        for name, start, stop in decoder._parameters:
+            params[name] = wrapper.get_value(start, stop)
+
+        parsed.append((decoder, wrapper.original_code, list(wrapper), params))
+
+    return parsed
+
+
+def build_all(parsed, passes):
+    durations = []
+
+    for _ in range(5):
+        start = time.perf_counter()
+
+        for _ in range(passes):
+            for decoder, original_code, normalized_code, params in parsed:
+                protocol_base.IRCode(
+                    decoder,
+                    original_code,
+                    normalized_code,
+                    params
+                )
+
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def decode_all(frames, passes):
+    # best of 5 runs, a single run is easily thrown off by whatever else
+    # is running
+    durations = []
+
+    for _ in range(5):
+        start = time.perf_counter()
+
+        for _ in range(passes):
+            for decoder, data in frames:
+                code = decoder.decode(data, decoder.frequency)
+                decoder.reset(code)
+
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def measure_memory(parsed):
+    codes = []
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+
+    for decoder, original_code, normalized_code, params in parsed:
+        codes.append(
+            protocol_base.IRCode(
+                decoder,
+                original_code,
+                normalized_code,
+                params
+            )
+        )
+
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    return size / len(codes)
+
+
+def run(frames, parsed, passes):
+    build_all(parsed, 1)
+    build = build_all(parsed, passes)
+    decode_all(frames, 1)
+    decode = decode_all(frames, passes)
+    size = measure_memory(parsed)
+    return build, decode, size
+
+
+def main():
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    frames = load_frames(50)
+    parsed = load_parsed(frames)
+    count = len(frames) * passes
+
+    print('frames:', len(frames))
+    print('passes:', passes)
+    print()
+
+    protocol_base.IRCode = _EagerIRCode
+    try:
+        eager = run(frames, parsed, passes)
+    finally:
+        protocol_base.IRCode = IRCode
+
+    lazy = run(frames, parsed, passes)
+
+    for label, (build, decode, size) in (
+        ('eager:', eager),
+        ('slots:', lazy)
+    ):
+        print(
+            '{0:8s} {1:8.2f}us/code {2:8.2f}us/decode '
+            '{3:8.0f} bytes/code'.format(
+                label,
+                build / count * 1000000,
+                decode / count * 1000000,
+                size
+            )
+        )
+
+    print()
+    print('build speedup: x{0:.2f}'.format(eager[0] / lazy[0]))
+    print('decode speedup: x{0:.2f}'.format(eager[1] / lazy[1]))
+    print('memory: x{0:.2f}'.format(eager[2] / lazy[2]))
+
+    protocols.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+# Encodes codes with random parameters for every protocol that has a
+# `_code_order` and turns each of them into an int, a hex string and a str
+# the way a log line or a name lookup does. It is done once building the
+# value out of bin() strings, the way IRCode used to, and once with shifts
+# and the bit reversal table. The cached values get thrown away before every
+# code so the work gets done each time. The best of 5 runs gets printed.
+#
+# python benchmarks/bench_ircode_int.py [passes]
+
+from __future__ import print_function
+import os
+import sys
+import time
+import random
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from pyIRDecoder import protocols, IRException  # NOQA
+from pyIRDecoder.ir_code import IRCode  # NOQA
+
+
+# noinspection PyProtectedMember
+def _int(self):
+    if self._int is None:
+        bits = ''
+
+        if 'CODE' in self._data:
+            if 'M' in self._data:
+                bits += bin(int(self.mode))[2:].zfill(3)[:3]
+
+            bits += bin(int(self.code))[2:]
+        else:
+            for param, num_bits in self._decoder._code_order:
+                bts = bin(
+                    int(self._data[param])
+                )[2:].zfill(num_bits)[:num_bits]
+
+                if self._decoder.encoding == 'msb':
+                    bits += bts
+                else:
+                    for i in range(num_bits - 1, -1, -1):
+                        bits += bts[i]
+
+        self._int = int(bits, 2)
+    return self._int
+
+
+# noinspection PyProtectedMember
+def _hexadecimal(self):
+    if self._hex is None:
+        res = hex(int(self))[2:].upper().rstrip('L')
+        self._hex = '0x' + res.zfill(len(res) + (len(res) % 2))
+    return self._hex
+
+
+_base_str = IRCode.__str__
+
+
+# noinspection PyProtectedMember
+def _str(self):
+    # the str was not kept
+    res = _base_str(self)
+    self._str = None
+    return res
+
+
+def load_codes(count, seed=0):
+    rnd = random.Random(seed)
+    codes = []
+    decoders = 0
+
+    for decoder in protocols:
+        # noinspection PyProtectedMember
+        if not getattr(decoder, '_code_order', None):
+            continue
+
+        encoded = 0
+
+        for _ in range(count):
+            params = list(
+                rnd.randint(min_val, max_val)
+                for _, min_val, max_val in decoder.encode_parameters
+            )
+            try:
+                codes.append(decoder.encode(*params))
+            except (IRException, TypeError, ValueError, KeyError):
+                continue
+
+            encoded += 1
+
+        if encoded:
+            decoders += 1
+
+    return decoders, codes
+
+
+# noinspection PyProtectedMember
+def format_all(codes, passes):
+    # best of 5 runs, a single run is easily thrown off by whatever else
+    # is running
+    durations = []
+
+    for _ in range(5):
+        start = time.perf_counter()
+
+        for _ in range(passes):
+            for code in codes:
+                code._int = None
+                code._hex = None
+                code._str = None
+
+                int(code)
+                code.hexadecimal
+                str(code)
+
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def main():
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    decoders, codes = load_codes(20)
+    count = len(codes) * passes
+
+    print('decoders:', decoders)
+    print('codes:', len(codes))
+    print('passes:', passes)
+    print()
+
+    int_func = IRCode.__int__
+    hexadecimal = IRCode.hexadecimal
+
+    IRCode.__int__ = _int
+    IRCode.hexadecimal = property(_hexadecimal)
+    IRCode.__str__ = _str
+    try:
+        format_all(codes, 1)
+        strings = format_all(codes, passes)
+    finally:
+        IRCode.__int__ = int_func
+        IRCode.hexadecimal = hexadecimal
+        IRCode.__str__ = _base_str
+
+    format_all(codes, 1)
+    shifts = format_all(codes, passes)
+
+    for label, duration in (
+        ('strings:', strings),
+        ('shifts:', shifts)
+    ):
+        print(
+            '{0:10s} {1:8.3f}s {2:8.2f}us/code'.format(
+                label,
+                duration,
+                duration / count * 1000000
+            )
+        )
+
+    print()
+    print('speedup: x{0:.2f}'.format(strings / shifts))
+
+    protocols.close()
+
+
+if __name__ == '__main__':
+    main()
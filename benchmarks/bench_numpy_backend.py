@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+# Encodes a set of frames with the long pulse distance and manchester
+# protocols and decodes them once with the pure Python stream parser and once
+# with the NumPy burst classification backend. NumPy has to be installed for
+# the second run.
+#
+# python benchmarks/bench_numpy_backend.py [passes]
+
+from __future__ import print_function
+import os
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from pyIRDecoder import protocols, code_wrapper, numpy_backend  # NOQA
+
+
+DECODERS = (
+    protocols.NEC,
+    protocols.RC6,
+    protocols.Panasonic,
+    protocols.Fujitsu128,
+    protocols.Kaseikyo,
+)
+
+
+def load_frames():
+    frames = []
+
+    for decoder in DECODERS:
+        params = [
+            min_val for _, min_val, _ in decoder.encode_parameters
+        ]
+        for i in range(len(params)):
+            args = params[:]
+            args[i] += 1
+            code = decoder.encode(*args)
+            frames.append((decoder, code.normalized_rlc[0]))
+
+    return frames
+
+
+def decode_all(frames, passes):
+    start = time.perf_counter()
+
+    for _ in range(passes):
+        for decoder, frame in frames:
+            decoder._last_code = None
+            code = decoder.decode(frame, decoder.frequency)
+            int(code)
+
+    return time.perf_counter() - start
+
+
+def main():
+    if not numpy_backend.is_available():
+        print('NumPy is not installed')
+        return
+
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    frames = load_frames()
+    count = len(frames) * passes
+
+    print('frames:', len(frames))
+    print('passes:', passes)
+    print()
+
+    results = []
+    for backend in ('python', 'numpy'):
+        code_wrapper.set_backend(backend)
+        decode_all(frames, 1)
+        results.append((backend, decode_all(frames, passes)))
+
+    code_wrapper.set_backend('python')
+
+    for label, duration in results:
+        print(
+            '{0:8s} {1:8.3f}s {2:8.1f}us/frame'.format(
+                label + ':',
+                duration,
+                duration / count * 1000000
+            )
+        )
+
+    print()
+    print('speedup: x{0:.2f}'.format(results[0][1] / results[1][1]))
+
+    protocols.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+
+# Measures the time and the memory that gets allocated to decode a frame
+# with the protocol the frame belongs to. The frame bounds and timing
+# windows get compiled before anything is measured.
+#
+# retained:   memory still allocated once the decode is done, this is the
+#             code that gets returned and everything it holds on to.
+# blocks:     number of blocks that make up the retained memory.
+# peak:       most memory in use at any point during a decode.
+#
+# python benchmarks/bench_parse_allocations.py [iterations]
+
+from __future__ import print_function
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(
+    0,
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+)
+
+from pyIRDecoder import protocols  # NOQA
+
+
+DECODERS = ['Sony12', 'NEC', 'RC6', 'Panasonic', 'Fujitsu128']
+
+
+def get_frame(decoder):
+    params = list(
+        (min_val + max_val) // 3
+        for _, min_val, max_val in decoder.encode_parameters
+    )
+    return decoder.encode(*params).normalized_rlc[0]
+
+
+def decode(decoder, data):
+    decoder._last_code = None
+    return decoder.decode(data, decoder.frequency)
+
+
+def measure_allocations(decoder, data):
+    decode(decoder, data)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        start_size = tracemalloc.get_traced_memory()[0]
+
+        decode(decoder, data)
+
+        peak = tracemalloc.get_traced_memory()[1] - start_size
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    stats = after.compare_to(before, 'filename')
+    retained = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+    blocks = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+
+    return retained, blocks, peak
+
+
+def measure_time(decoder, data, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        decode(decoder, data)
+
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print(
+        '{0:12s} {1:>7s} {2:>12s} {3:>11s} {4:>10s} {5:>11s}'.format(
+            'protocol',
+            'pulses',
+            'retained',
+            'blocks',
+            'peak',
+            'time'
+        )
+    )
+
+    for name in DECODERS:
+        decoder = getattr(protocols, name)
+        data = get_frame(decoder)
+
+        retained, blocks, peak = measure_allocations(decoder, data)
+        duration = measure_time(decoder, data, iterations)
+
+        print(
+            '{0:12s} {1:7d} {2:10d} B {3:11d} {4:8d} B {5:8.1f} us'.format(
+                name,
+                len(data),
+                retained,
+                blocks,
+                peak,
+                duration * 1000000
+            )
+        )
+
+    protocols.close()
+
+
+if __name__ == '__main__':
+    main()
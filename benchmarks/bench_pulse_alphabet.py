@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+# Decodes every frame in the test_protocols test modules with the
+# dispatcher. It is done once with every decoder matching the pulses of the
+# stream against the windows of its own timings and once with the pulses
+# classified using the pulse alphabet of the dispatcher. The dispatcher
+# turns most frames away before the stream gets parsed so the same gets done
+# parsing the stream of every frame with every decoder that matches the
+# lead in and lead out of the frame, the frame gets classified once for all
+# of them. The best of 5 runs gets printed.
+#
+# python benchmarks/bench_pulse_alphabet.py [passes]
+
+from __future__ import print_function
+import os
+import sys
+import glob
+import time
+import importlib
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from pyIRDecoder import protocols, code_wrapper, IRException  # NOQA
+from pyIRDecoder.pulse_alphabet import PulseAlphabet  # NOQA
+
+
+def load_frames():
+    frames = []
+
+    pattern = os.path.join(ROOT, 'test_protocols', 'test_*.py')
+    for path in sorted(glob.glob(pattern)):
+        module = importlib.import_module(
+            'test_protocols.' + os.path.basename(path)[:-3]
+        )
+        decoder = getattr(module, 'protocol', None)
+        if decoder is None:
+            continue
+
+        for value in vars(module).values():
+            if not isinstance(value, type) or not hasattr(value, 'rlc'):
+                continue
+
+            for rlc in value.rlc:
+                if rlc and isinstance(rlc[0], list):
+                    frames.extend((frame, decoder.frequency) for frame in rlc)
+                else:
+                    frames.append((rlc, decoder.frequency))
+
+    return frames
+
+
+def _classify(_, __):
+    return None
+
+
+def decode_all(frames, passes):
+    # best of 5 runs, a single run is easily thrown off by whatever else
+    # is running
+    durations = []
+
+    for _ in range(5):
+        start = time.perf_counter()
+
+        for _ in range(passes):
+            for frame, frequency in frames:
+                # noinspection PyProtectedMember
+                protocols._reset_state()
+                try:
+                    protocols.decode(frame[:], frequency)
+                except Exception:  # NOQA
+                    pass
+
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def load_parses(frames):
+    parses = []
+
+    for frame, _ in frames:
+        matches = []
+
+        for decoder in protocols:
+            # noinspection PyProtectedMember
+            if not decoder._use_quick_reject:
+                continue
+
+            # noinspection PyProtectedMember
+            spec = decoder._get_frame_spec()
+            # noinspection PyProtectedMember
+            windows = decoder._get_timing_windows()
+            frame_match = spec.match_frame(frame, windows)
+
+            if isinstance(frame_match, code_wrapper.Rejection):
+                continue
+
+            matches.append((spec, decoder.tolerance, windows, frame_match))
+
+        parses.append((frame, matches))
+
+    return parses
+
+
+def parse_all(parses, passes, alphabet):
+    durations = []
+
+    for _ in range(5):
+        start = time.perf_counter()
+
+        for _ in range(passes):
+            for frame, matches in parses:
+                classes = alphabet.classify(frame)
+
+                for spec, tolerance, windows, frame_match in matches:
+                    try:
+                        code_wrapper.CodeWrapper.from_spec(
+                            spec,
+                            tolerance,
+                            frame,
+                            windows,
+                            frame_match,
+                            alphabet,
+                            classes
+                        )
+                    except IRException:
+                        pass
+
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+def run(func, items, passes, count, *args):
+    classify = PulseAlphabet.classify
+
+    PulseAlphabet.classify = _classify
+    try:
+        func(items, 1, *args)
+        windows = func(items, passes, *args)
+    finally:
+        PulseAlphabet.classify = classify
+
+    func(items, 1, *args)
+    classes = func(items, passes, *args)
+
+    for label, duration in (
+        ('windows:', windows),
+        ('classes:', classes)
+    ):
+        print(
+            '{0:10s} {1:8.3f}s {2:8.1f}us/{3}'.format(
+                label,
+                duration,
+                duration / count * 1000000,
+                'frame' if func is decode_all else 'parse'
+            )
+        )
+
+    print()
+    print('speedup: x{0:.2f}'.format(windows / classes))
+    print()
+
+
+def main():
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 2
+    frames = load_frames()
+    count = len(frames) * passes
+
+    print('frames:', len(frames))
+    print('passes:', passes)
+    print('classes:', len(protocols.pulse_alphabet))
+    print()
+
+    print('dispatcher:')
+    run(decode_all, frames, passes, count)
+
+    parses = load_parses(frames)
+    count = sum(len(matches) for _, matches in parses) * passes
+
+    print('parsed by every decoder:', count // passes)
+    run(parse_all, parses, passes, count, protocols.pulse_alphabet)
+
+    protocols.close()
+
+
+if __name__ == '__main__':
+    main()
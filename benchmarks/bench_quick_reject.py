@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+# Hands every frame in the test_protocols test modules to every decoder, the
+# way a frame gets handed to decoders that do not know which protocol it
+# belongs to. It is done once with only the pulse count and duration checks
+# in front of the parse, the way it was before quick_reject, and once with
+# quick_reject. The number of frames each stage turned away gets printed
+# after.
+#
+# python benchmarks/bench_quick_reject.py [passes]
+
+from __future__ import print_function
+import os
+import sys
+import glob
+import time
+import importlib
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from pyIRDecoder import protocols, protocol_base  # NOQA
+
+
+def load_frames():
+    frames = []
+
+    pattern = os.path.join(ROOT, 'test_protocols', 'test_*.py')
+    for path in sorted(glob.glob(pattern)):
+        module = importlib.import_module(
+            'test_protocols.' + os.path.basename(path)[:-3]
+        )
+        if getattr(module, 'protocol', None) is None:
+            continue
+
+        for value in vars(module).values():
+            if not isinstance(value, type) or not hasattr(value, 'rlc'):
+                continue
+
+            for rlc in value.rlc:
+                if rlc and isinstance(rlc[0], list):
+                    frames.extend(rlc)
+                else:
+                    frames.append(rlc)
+
+    return frames
+
+
+def _bounds_only(self, data, duration, bounds):
+    error = self._get_bounds_error(data, duration, bounds)
+    if error is not None:
+        raise error
+
+    # the CodeWrapper matches the lead in and lead out on its own
+    return self._get_frame_spec(), self._get_timing_windows(), None
+
+
+def decode_all(decoders, frames, passes):
+    start = time.perf_counter()
+
+    for _ in range(passes):
+        for decoder in decoders:
+            for frame in frames:
+                decoder._last_code = None
+                try:
+                    decoder.decode(frame, decoder.frequency)
+                except Exception:  # NOQA
+                    pass
+
+    return time.perf_counter() - start
+
+
+def main():
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    frames = load_frames()
+
+    # only the decoders that quick_reject is used for
+    decoders = list(
+        decoder for decoder in protocols
+        if decoder._use_quick_reject  # NOQA
+    )
+    count = len(frames) * len(decoders) * passes
+
+    print('frames:', len(frames))
+    print('decoders:', len(decoders))
+    print('passes:', passes)
+    print()
+
+    quick_reject = protocol_base.IrProtocolBase._quick_reject
+
+    protocol_base.IrProtocolBase._quick_reject = _bounds_only
+    try:
+        decode_all(decoders, frames, 1)
+        bounds_only = decode_all(decoders, frames, passes)
+    finally:
+        protocol_base.IrProtocolBase._quick_reject = quick_reject
+
+    decode_all(decoders, frames, 1)
+    protocols.reset_reject_counts()
+    quick = decode_all(decoders, frames, passes)
+
+    for label, duration in (
+        ('bounds only:', bounds_only),
+        ('quick_reject:', quick)
+    ):
+        print(
+            '{0:14s} {1:8.3f}s {2:8.2f}us/attempt'.format(
+                label,
+                duration,
+                duration / count * 1000000
+            )
+        )
+
+    print()
+    print('speedup: x{0:.2f}'.format(bounds_only / quick))
+    print()
+
+    totals = dict.fromkeys(protocol_base.IrProtocolBase._reject_stages, 0)
+    for counts in protocols.reject_counts.values():
+        for stage, value in counts.items():
+            totals[stage] += value
+
+    print('rejected at:')
+    for stage in protocol_base.IrProtocolBase._reject_stages:
+        print(
+            '    {0:14s} {1:8d} {2:6.1f}%'.format(
+                stage,
+                totals[stage],
+                totals[stage] / float(count) * 100
+            )
+        )
+
+    protocols.close()
+
+
+if __name__ == '__main__':
+    main()
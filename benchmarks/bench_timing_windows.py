@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+
+# Decodes every frame in the test_protocols test modules with the protocol
+# the frame belongs to. The frames get decoded once with the timing windows
+# worked out on every compare, the way matching was done before the windows
+# got compiled, and once using the compiled windows.
+#
+# python benchmarks/bench_timing_windows.py [passes]
+
+from __future__ import print_function
+import os
+import sys
+import glob
+import math
+import time
+import importlib
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from pyIRDecoder import protocols, protocol_base, code_wrapper  # NOQA
+
+
+def load_frames():
+    frames = []
+
+    pattern = os.path.join(ROOT, 'test_protocols', 'test_*.py')
+    for path in sorted(glob.glob(pattern)):
+        module = importlib.import_module(
+            'test_protocols.' + os.path.basename(path)[:-3]
+        )
+        decoder = getattr(module, 'protocol', None)
+        if decoder is None:
+            continue
+
+        for value in vars(module).values():
+            if not isinstance(value, type) or not hasattr(value, 'rlc'):
+                continue
+
+            for rlc in value.rlc:
+                if rlc and isinstance(rlc[0], list):
+                    frames.extend((decoder, frame) for frame in rlc)
+                else:
+                    frames.append((decoder, rlc))
+
+    return frames
+
+
+def _match(value, expected_timing_value, tolerance):
+    if (
+        value < 0 < expected_timing_value or
+        value > 0 > expected_timing_value
+    ):
+        return False
+
+    high = math.floor(
+        expected_timing_value +
+        (expected_timing_value * (tolerance / 100.0))
+    )
+    low = math.floor(
+        expected_timing_value -
+        (expected_timing_value * (tolerance / 100.0))
+    )
+
+    if expected_timing_value < 0:
+        low, high = high, low
+
+    return low <= value <= high
+
+
+def _protocol_match(self, value, expected_timing_value, tolerance=None):
+    if tolerance is None:
+        tolerance = self.tolerance
+
+    return _match(value, expected_timing_value, tolerance)
+
+
+def _wrapper_match(self, value, expected_timing_value):
+    return _match(value, expected_timing_value, self._tolerance)
+
+
+def decode_all(frames, passes):
+    start = time.perf_counter()
+
+    for _ in range(passes):
+        for decoder, frame in frames:
+            decoder._last_code = None
+            try:
+                decoder.decode(frame[:], decoder.frequency)
+            except Exception:  # NOQA
+                pass
+
+    return time.perf_counter() - start
+
+
+def main():
+    passes = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    frames = load_frames()
+    count = len(frames) * passes
+
+    print('frames:', len(frames))
+    print('passes:', passes)
+    print()
+
+    protocol_match = protocol_base.IrProtocolBase._match
+    wrapper_match = code_wrapper.CodeWrapper._match
+
+    protocol_base.IrProtocolBase._match = _protocol_match
+    code_wrapper.CodeWrapper._match = _wrapper_match
+    try:
+        decode_all(frames, 1)
+        computed = decode_all(frames, passes)
+    finally:
+        protocol_base.IrProtocolBase._match = protocol_match
+        code_wrapper.CodeWrapper._match = wrapper_match
+
+    decode_all(frames, 1)
+    compiled = decode_all(frames, passes)
+
+    for label, duration in (
+        ('computed windows:', computed),
+        ('compiled windows:', compiled)
+    ):
+        print(
+            '{0:18s} {1:8.3f}s {2:8.1f}us/frame'.format(
+                label,
+                duration,
+                duration / count * 1000000
+            )
+        )
+
+    print()
+    print('speedup: x{0:.2f}'.format(computed / compiled))
+
+    protocols.close()
+
+
+if __name__ == '__main__':
+    main()
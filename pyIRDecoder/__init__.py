@@ -33,15 +33,18 @@ class IRException(Exception):
     """IR error"""
 
     def __init__(self, *args):
-        msg = ' '.join(str(arg) for arg in args)
+        # the message gets put together when it is asked for. Most of the
+        # errors raised while decoding get caught by the dispatcher and are
+        # never looked at.
+        self._args = args
+
+    def __str__(self):
+        msg = ' '.join(str(arg) for arg in self._args)
 
         if not msg:
-            self._msg = self.__doc__
-        else:
-            self._msg = msg
+            return self.__doc__
 
-    def __str__(self):
-        return self._msg
+        return msg
 
 
 class ExpectingMoreData(IRException):
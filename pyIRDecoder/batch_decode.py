@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+# Decoding large archives of captured frames one frame at a time through
+# `protocols.decode` is slow because every frame passes through the same
+# lock. `decode_many` splits the frames into chunks and hands the chunks to
+# a pool of processes. Every process has its own `protocols.Decoder` which
+# gets the settings and the saved codes of the decoders of the dispatcher
+# that is passed in.
+#
+# Every frame is decoded on its own, the state of the dispatcher gets reset
+# before each frame. A frame that is the same as the frame before it would
+# otherwise be seen as a repeat. This also makes the results the same no
+# matter how many processes are used or how the frames get split up.
+#
+# IRCode instances carry timers and callbacks so they do not get passed
+# between processes. The results are plain `DecodeResult` records. A decoder
+# that falls over on a frame does not stop the rest of the frames from being
+# decoded, the traceback ends up in the `error` field of the result for that
+# frame.
+
+import os
+import traceback
+import collections
+import multiprocessing
+from concurrent import futures
+
+from . import code_wrapper
+from . import DecodeError
+
+
+CHUNK_SIZE = 256
+
+DecodeResult = collections.namedtuple(
+    'DecodeResult',
+    ['decoder', 'code', 'params', 'frequency', 'normalized_rlc', 'error']
+)
+
+# the dispatcher of a worker process
+_decoder = None
+
+
+def _get_params(code):
+    # noinspection PyProtectedMember
+    return dict((key, int(value)) for key, value in code._data.items())
+
+
+def _get_settings(module):
+    # noinspection PyProtectedMember
+    return list(
+        (
+            decoder.name,
+            decoder.enabled,
+            decoder.tolerance,
+            decoder.frequency_tolerance,
+            list(
+                (
+                    code.name,
+                    code._original_rlc[:],
+                    [rlc[:] for rlc in code._normalized_rlc],
+                    _get_params(code)
+                )
+                for code in decoder
+            )
+        )
+        for decoder in module
+    )
+
+
+def _init_worker(settings, backend):
+    global _decoder
+
+    from . import protocols
+    from . import code_wrapper
+    from .ir_code import IRCode
+
+    code_wrapper.set_backend(backend)
+
+    _decoder = protocols.Decoder()
+
+    for name, enabled, tolerance, frequency_tolerance, codes in settings:
+        decoder = getattr(_decoder, name)
+        decoder.enabled = enabled
+        decoder.tolerance = tolerance
+        decoder.frequency_tolerance = frequency_tolerance
+
+        for code_name, original_rlc, normalized_rlc, params in codes:
+            IRCode(
+                decoder,
+                original_rlc,
+                normalized_rlc,
+                params,
+                name=code_name
+            ).save()
+
+
+def _to_result(code):
+    return DecodeResult(
+        code.decoder.name,
+        str(code),
+        _get_params(code),
+        int(code.frequency),
+        [rlc[:] for rlc in code.normalized_rlc],
+        None
+    )
+
+
+def _to_error():
+    return DecodeResult(None, None, None, None, None, traceback.format_exc())
+
+
+def _decode_chunk(chunk, frequency):
+    decoder = _decoder
+
+    results = []
+    for data in chunk:
+        # noinspection PyProtectedMember
+        decoder._reset_state()
+
+        # a frame that is not able to be decoded is a None in the results,
+        # a frame a decoder falls over on gets the error
+        try:
+            code = decoder.decode(data, frequency)
+        except DecodeError:
+            code = None
+        except Exception:  # NOQA
+            results.append(_to_error())
+            continue
+
+        if code is None:
+            results.append(None)
+        else:
+            results.append(_to_result(code))
+
+    return results
+
+
+def _get_chunks(frames, chunk_size):
+    chunk = []
+
+    for data in frames:
+        chunk.append(list(data))
+
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def decode_many(
+    module,
+    frames,
+    frequency=0,
+    workers=None,
+    chunk_size=CHUNK_SIZE
+):
+    """
+    Decodes frames using a pool of processes.
+
+    Every frame is decoded on its own by a `protocols.Decoder` that has the
+    settings and the saved codes of the decoders in `module`. Decode
+    callbacks, streams, the caches and the ranking of `module` are not
+    used.
+
+    :param module: the protocols module or a `protocols.Decoder` instance.
+    :param frames: iterable of frames, each frame is a list of rlc data.
+    :param frequency: frequency of the frames.
+    :param workers: number of processes, defaults to the number of cpu's.
+    :param chunk_size: number of frames that get sent to a process at a time.
+
+    :return: generator that yields a :class:`DecodeResult` or `None` for
+        each frame in the order the frames were passed in. If a decoder
+        raised something other than a `DecodeError` for a frame the
+        `error` field of its result holds the traceback and the other
+        fields are `None`.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # spawn is used because a forked process would copy the locks of the
+    # dispatcher in whatever state the threads in this process have them in.
+    executor = futures.ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(_get_settings(module), code_wrapper.get_backend())
+    )
+
+    with executor:
+        pending = collections.deque()
+
+        for chunk in _get_chunks(frames, chunk_size):
+            pending.append(executor.submit(_decode_chunk, chunk, frequency))
+
+            # only keep a couple of chunks per process in flight so the
+            # frames do not all get read into memory at once.
+            if len(pending) >= workers * 2:
+                for result in pending.popleft().result():
+                    yield result
+
+        while pending:
+            for result in pending.popleft().result():
+                yield result
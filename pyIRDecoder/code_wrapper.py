@@ -96,8 +96,8 @@
 # we handle the reversing of the bits when collecting the parameters
 # from the code.
 
+import itertools
 
-import math
 from . import (
     LeadOutError,
     LeadInError,
@@ -105,99 +105,255 @@ from . import (
 )
 
 from . import integer_wrapper
+from . import numpy_backend
+from .integer_wrapper import _REVERSED_BYTES, _reverse_bits
+from .timing_windows import TimingWindows
 
 
-class CodeWrapper(object):
-    @property
-    def encoding(self):
-        return self._encoding
+# 'python' or 'numpy'
+_backend = 'python'
 
-    @property
-    def original_code(self):
-        return self._original_code[:]
+_spec_keys = {}
+_spec_numbers = itertools.count()
 
-    @property
-    def burst_pairs(self):
-        return self._bursts[:]
 
-    @property
-    def tolerance(self):
-        return self._tolerance
+def _freeze(value):
+    # turns the lists and dicts of a timing spec into something hashable
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, _freeze(item)) for key, item in value.items())
+        )
 
-    @property
-    def stream_encoding(self):
-        return self._stream_encoding
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
 
-    @property
-    def stream_pairs(self):
-        return self._stream_pairs[:]
+    return value
 
-    def __init__(
-            self,
-            encoding,
-            lead_in,
-            lead_out,
-            middle_timings,
-            bursts,
-            tolerance,
-            code
-    ):
-        self._encoding = encoding
-        self._original_code = code[:]
-        self._lead_in = lead_in[:]
-        self._lead_out = lead_out[:]
-        self._bursts = bursts[:]
-        self._tolerance = tolerance
-        self._stream_encoding = 'halfbit'
-        self._middle_timings = middle_timings[:]
 
-        total_time = sum(abs(item) for item in code[:-1])
-        try:
-            if self._lead_out and self._lead_out[-1] > 0:
-                expected_lead_out = self._lead_out[-1] - total_time
+def get_backend():
+    return _backend
 
-                if not self._match(-expected_lead_out, code[-1]):
-                    raise LeadOutError(str(-expected_lead_out) + ':' + str(code[-1]))
-        except IndexError:
-            pass
 
-        decoded_code = []
-        cleaned_code = []
-        pairs = []
+def set_backend(backend):
+    """
+    Sets how the stream of a frame gets classified.
+
+    :param backend: `'python'` or `'numpy'`. NumPy needs to be installed
+        to use `'numpy'`.
+    """
+    global _backend
+
+    if backend not in ('python', 'numpy'):
+        raise ValueError('unknown backend ' + repr(backend))
+
+    if backend == 'numpy' and not numpy_backend.is_available():
+        raise RuntimeError('NumPy is not installed')
+
+    _backend = backend
+
+
+class Rejection(object):
+    """
+    Why a frame got turned away.
+
+    The error, and the message that goes with it, only gets built when
+    :meth:`error` is called. The dispatcher tries a frame with a lot of
+    decoders and all it needs to know is that a decoder turned it away.
+
+    :ivar stage: what turned the frame away, `'frame_bounds'`, `'lead_in'`,
+        `'lead_out'`, `'parse'` or `'fields'`.
+    """
+    __slots__ = ('stage', 'error_type', 'message', 'args')
+
+    def __init__(self, stage, error_type, message=None, *args):
+        self.stage = stage
+        self.error_type = error_type
+        self.message = message
+        self.args = args
+
+    @classmethod
+    def from_error(cls, stage, error):
+        """
+        Wraps an error that already got built while the frame was parsed.
+        """
+        rejection = cls(stage, None)
+        rejection.args = (error,)
+        return rejection
+
+    def error(self):
+        """
+        Builds the error the frame got turned away with.
+        """
+        if self.error_type is None:
+            return self.args[0]
+
+        if self.message is None:
+            return self.error_type(*self.args)
+
+        return self.error_type(self.message.format(*self.args))
+
+
+class FrameSpec(object):
+    """
+    The parts of a protocol's timing spec :class:`CodeWrapper` needs, worked
+    out once instead of for every frame.
+
+    :ivar stream_encoding: `'bit'`, `'manchester'` or `'halfbit'`
+    :ivar symbols: maps a burst pair (as a tuple), or a burst for bit
+        encoded streams, to the bits it stands for.
+    """
+
+    def __init__(self, encoding, lead_in, lead_out, middle_timings, bursts):
+        self.encoding = encoding
+        self.lead_in = tuple(lead_in)
+        self.lead_out = tuple(lead_out)
+        self.middle_timings = tuple(middle_timings)
+        self.bursts = bursts[:]
+
+        # kept to check if the spec of a protocol has changed
+        self._source = (
+            encoding,
+            lead_in[:],
+            lead_out[:],
+            middle_timings[:],
+            bursts[:]
+        )
+        # worked out the first time it is asked for, most specs never get
+        # looked up in the demodulation cache
+        self._key = None
+
+        self.stream_encoding = 'halfbit'
 
         if bursts:
             last_pair = bursts[0]
 
             if isinstance(last_pair, int):
-                self._stream_encoding = 'bit'
+                self.stream_encoding = 'bit'
             else:
-                for mark, space in bursts[1:]:
+                for pair in bursts[1:]:
                     if (
-                        mark == last_pair[1] and
-                        space == last_pair[0]
+                        len(pair) == 2 == len(last_pair) and
+                        pair[0] == last_pair[1] and
+                        pair[1] == last_pair[0]
                     ):
-                        self._stream_encoding = 'manchester'
+                        self.stream_encoding = 'manchester'
                         break
 
-                    last_pair = [mark, space]
-        else:
-            self._stream_encoding = 'halfbit'
+                    last_pair = pair
 
-        cleaned_lead_out = []
-        half_bits = []
-        offset = 0
+        self.symbols = {}
+        # same as symbols but the bits are packed into an int,
+        # `(value, number of bits)`
+        self.symbol_values = {}
+        # tables the NumPy backend uses, by tolerance
+        self._numpy_tables = {}
 
-        if self._stream_encoding == 'bit':
-            for i, e_burst in enumerate(lead_in):
-                try:
-                    burst = code[i - offset]
-                except IndexError:
-                    raise LeadInError
+        for num, burst in enumerate(bursts):
+            if len(bursts) == 2:
+                bits = [num]
+            elif len(bursts) == 4:
+                bits = [num >> 1 & 1, num & 1]
+            else:
+                bits = [num >> 3 & 1, num >> 2 & 1, num >> 1 & 1, num & 1]
+
+            if isinstance(burst, list):
+                # the stream pairs are lists so only a burst pair that is a
+                # list is able to match one.
+                burst = tuple(burst)
+            elif isinstance(burst, tuple):
+                continue
+
+            # the first burst wins if the same burst is in there twice
+            if burst not in self.symbols:
+                self.symbols[burst] = bits
+                self.symbol_values[burst] = (
+                    int(''.join(str(bit) for bit in bits), 2),
+                    len(bits)
+                )
+
+    @property
+    def key(self):
+        """
+        Specs that have the same key turn a frame into the same stream. The key
+        is a number so it is quick to hash.
+        """
+        if self._key is None:
+            self._key = _spec_keys.setdefault(
+                _freeze(self._source),
+                next(_spec_numbers)
+            )
+
+        return self._key
+
+    def matches(self, encoding, lead_in, lead_out, middle_timings, bursts):
+        """
+        Checks if the spec was built from the timings passed in.
+        """
+        return self._source == (
+            encoding,
+            lead_in,
+            lead_out,
+            middle_timings,
+            bursts
+        )
+
+    def match_total_time(self, pulses, windows):
+        """
+        Checks the last pulse of a frame when the last lead out timing is the
+        total time of the frame.
+
+        :param pulses: the frame.
+        :param windows: :class:`TimingWindows` to match the timings with.
+        :return: the duration of the frame without the last pulse or a
+            :class:`Rejection`.
+        """
+        if not pulses:
+            return 0
+
+        lead_out = self.lead_out
+        total_time = sum(map(abs, pulses)) - abs(pulses[-1])
 
-                if self._match(burst, e_burst):
-                    code.pop(0)
-                    cleaned_code += [e_burst]
-                    offset += 1
+        if lead_out and lead_out[-1] > 0:
+            expected_lead_out = lead_out[-1] - total_time
+
+            if not windows.match(-expected_lead_out, pulses[-1]):
+                return Rejection(
+                    'lead_out',
+                    LeadOutError,
+                    '{0}:{1}',
+                    -expected_lead_out,
+                    pulses[-1]
+                )
+
+        return total_time
+
+    def match_lead_in(self, pulses, windows):
+        """
+        Matches the lead in against the start of a frame.
+
+        A lead in timing that takes up part of a pulse leaves what is left of
+        the pulse in `head`, which stands in for the pulse at `start`.
+
+        :param pulses: the frame.
+        :param windows: :class:`TimingWindows` to match the timings with.
+        :return: `(start, head)` or a :class:`Rejection`.
+        """
+        match = windows.match
+        bursts = self.bursts
+        start = 0
+        stop = len(pulses)
+        head = None
+
+        if self.stream_encoding == 'bit':
+            for e_burst in self.lead_in:
+                if start == stop:
+                    return Rejection('lead_in', LeadInError)
+
+                burst = pulses[start] if head is None else head
+
+                if match(burst, e_burst):
+                    start += 1
+                    head = None
                     continue
 
                 for timing in bursts:
@@ -205,20 +361,84 @@ class CodeWrapper(object):
                     if multiplier == 0:
                         continue
 
-                    if self._match(burst, timing * multiplier + e_burst):
-                        offset += 1
-                        code.pop(0)
-                        code.insert(0, burst - e_burst)
-                        cleaned_code += [e_burst]
+                    if match(burst, timing * multiplier + e_burst):
+                        head = burst - e_burst
                         break
                 else:
-                    raise LeadInError
+                    return Rejection('lead_in', LeadInError)
+
+        else:
+            for e_burst in self.lead_in:
+                if start == stop:
+                    return Rejection('lead_in', LeadInError)
+
+                burst = pulses[start] if head is None else head
+
+                if match(burst, e_burst):
+                    start += 1
+                    head = None
+                    continue
+
+                for mark, _ in bursts:
+                    if match(burst, e_burst + mark):
+                        head = mark
+                        break
+                else:
+                    for timing in self.middle_timings:
+                        if not isinstance(timing, list):
+                            continue
+
+                        timing = timing[0]
+
+                        if match(burst, e_burst + timing):
+                            head = timing
+                            break
+                    else:
+                        return Rejection(
+                            'lead_in',
+                            LeadInError,
+                            '{0} : {1}',
+                            burst,
+                            e_burst
+                        )
+
+        return start, head
+
+    def match_lead_out(self, pulses, windows, start, head, total_time):
+        """
+        Matches the lead out in place against the end of a frame.
+
+        :param pulses: the frame.
+        :param windows: :class:`TimingWindows` to match the timings with.
+        :param start: cursor :meth:`match_lead_in` returned.
+        :param head: what :meth:`match_lead_in` left of the pulse at `start`.
+        :param total_time: what :meth:`match_total_time` returned.
+        :return: `(lead_out_start, lead_out_stop, cleaned_lead_out,
+            half_bits)`. The pulses from `lead_out_start` up to
+            `lead_out_stop` are the lead out, `half_bits` are pieces of
+            lead out pulses that belong to the stream. A :class:`Rejection`
+            if the lead out does not match.
+        """
+        match = windows.match
+        bursts = self.bursts
+        lead_out = self.lead_out
+        stop = len(pulses)
+
+        cleaned_lead_out = []
+        half_bits = []
+
+        if self.stream_encoding == 'bit':
+            lead_out_start = stop - len(lead_out)
+            if lead_out and lead_out_start < start:
+                return Rejection('lead_out', LeadOutError)
+
+            lead_out_stop = stop
 
             for i, e_burst in enumerate(lead_out):
-                idx = ~(i - len(lead_out)) + 1
-                burst = code.pop(len(code) - idx)
+                index = lead_out_start + i
+                burst = pulses[index] if index != start or head is None else head
 
-                if self._match(burst, e_burst):
+                if match(burst, e_burst):
                     cleaned_lead_out += [e_burst]
                     continue
 
@@ -228,57 +448,29 @@ class CodeWrapper(object):
                         if multiplier == 0:
                             continue
 
-                        if self._match(burst, timing * multiplier + e_burst):
+                        if match(burst, timing * multiplier + e_burst):
                             half_bits += [burst - e_burst]
                             cleaned_lead_out += [e_burst]
                             break
                     else:
-                        raise LeadOutError
+                        return Rejection('lead_out', LeadOutError)
 
         else:
-            for e_burst in lead_in:
-                try:
-                    burst = code[0]
-                except IndexError:
-                    raise LeadInError
-
-                if self._match(burst, e_burst):
-                    code.pop(0)
-                    cleaned_code += [e_burst]
-                    continue
-
-                for mark, _ in bursts:
-                    if self._match(burst, e_burst + mark):
-                        code.pop(0)
-                        code.insert(0, mark)
-                        cleaned_code += [e_burst]
-                        break
-                else:
-                    for timing in middle_timings:
-                        if not isinstance(timing, list):
-                            continue
-
-                        timing = timing[0]
-
-                        if self._match(burst, e_burst + timing):
-                            code.pop(0)
-                            code.insert(0, timing)
-                            cleaned_code += [e_burst]
-                            break
-                    else:
-                        raise LeadInError(str(burst) + ' : ' + str(e_burst))
+            lead_out_start = stop - len(lead_out)
+            lead_out_stop = lead_out_start
 
             for i, e_burst in enumerate(lead_out):
                 if e_burst == -999999999999:
                     break
 
-                idx = ~(i - len(lead_out)) + 1
-                try:
-                    burst = code.pop(len(code) - idx)
-                except IndexError:
-                    raise LeadOutError
+                if lead_out_start < start:
+                    return Rejection('lead_out', LeadOutError)
+
+                index = lead_out_start + i
+                burst = pulses[index] if index != start or head is None else head
+                lead_out_stop += 1
 
-                if self._match(burst, e_burst):
+                if match(burst, e_burst):
                     cleaned_lead_out += [e_burst]
                     continue
 
@@ -286,7 +478,7 @@ class CodeWrapper(object):
                     if (
                         len(lead_out) % 2 == 0 and
                         i == 0 and
-                        self._match(burst - space, e_burst)
+                        match(burst - space, e_burst)
                     ):
                         half_bits += [space]
                         cleaned_lead_out += [e_burst]
@@ -295,20 +487,20 @@ class CodeWrapper(object):
                     if (
                         i + 1 == len(lead_out) and
                         space < 0 and
-                        self._match(burst + space, e_burst)
+                        match(burst + space, e_burst)
                     ):
                         half_bits += [space]
                         cleaned_lead_out += [e_burst]
                         break
                 else:
-                    if self._match(e_burst, total_time + abs(burst)):
+                    if match(e_burst, total_time + abs(burst)):
                         cleaned_lead_out += [None]
 
                     elif not cleaned_lead_out:
                         for _, space in bursts:
                             if (
                                 e_burst < 0 > space and
-                                self._match(e_burst, burst - space)
+                                match(e_burst, burst - space)
                             ):
                                 cleaned_lead_out += [e_burst]
                                 half_bits += [space]
@@ -316,20 +508,281 @@ class CodeWrapper(object):
 
                             if (
                                     e_burst > 0 < space and
-                                    self._match(e_burst, burst - space)
+                                    match(e_burst, burst - space)
                             ):
                                 cleaned_lead_out += [e_burst]
                                 half_bits += [space]
                                 break
                         else:
-                            raise LeadOutError(
-                                str(burst) + ' : ' + str(lead_out)
+                            return Rejection(
+                                'lead_out',
+                                LeadOutError,
+                                '{0} : {1}',
+                                burst,
+                                lead_out
                             )
 
                     else:
-                        raise LeadOutError(str(e_burst) + ':' + str(burst))
+                        return Rejection(
+                            'lead_out',
+                            LeadOutError,
+                            '{0}:{1}',
+                            e_burst,
+                            burst
+                        )
+
+        return lead_out_start, lead_out_stop, cleaned_lead_out, half_bits
+
+    def match_frame(self, pulses, windows):
+        """
+        Matches the lead in and the lead out of a frame without touching the
+        stream.
+
+        :param pulses: the frame.
+        :param windows: :class:`TimingWindows` to match the timings with.
+        :return: `(start, head, lead_out_start, lead_out_stop,
+            cleaned_lead_out, half_bits)`, see :meth:`match_lead_in` and
+            :meth:`match_lead_out`, or a :class:`Rejection`.
+        """
+        total_time = self.match_total_time(pulses, windows)
+        if isinstance(total_time, Rejection):
+            return total_time
+
+        lead_in = self.match_lead_in(pulses, windows)
+        if isinstance(lead_in, Rejection):
+            return lead_in
+
+        lead_out = self.match_lead_out(
+            pulses,
+            windows,
+            lead_in[0],
+            lead_in[1],
+            total_time
+        )
+        if isinstance(lead_out, Rejection):
+            return lead_out
+
+        return lead_in + lead_out
 
-        code += half_bits[:]
+
+class CodeWrapper(object):
+    @property
+    def encoding(self):
+        return self._encoding
+
+    @property
+    def original_code(self):
+        return list(self._original_code)
+
+    @property
+    def burst_pairs(self):
+        return self._bursts[:]
+
+    @property
+    def tolerance(self):
+        return self._tolerance
+
+    @property
+    def stream_encoding(self):
+        return self._stream_encoding
+
+    @property
+    def stream_pairs(self):
+        return self._stream_pairs[:]
+
+    def __init__(
+            self,
+            encoding,
+            lead_in,
+            lead_out,
+            middle_timings,
+            bursts,
+            tolerance,
+            code,
+            windows=None
+    ):
+        spec = FrameSpec(encoding, lead_in, lead_out, middle_timings, bursts)
+        self._parse(spec, tolerance, code, windows)
+
+    @classmethod
+    def from_spec(
+        cls,
+        spec,
+        tolerance,
+        code,
+        windows=None,
+        frame_match=None,
+        alphabet=None,
+        classes=None
+    ):
+        """
+        Builds a wrapper using a :class:`FrameSpec` that has already been
+        compiled.
+
+        :param frame_match: what :meth:`FrameSpec.match_frame` returned for
+            `code` using `windows`, if the frame has already been matched.
+        :param alphabet: :class:`pulse_alphabet.PulseAlphabet` the pulses of
+            `code` have been classified with.
+        :param classes: what :meth:`pulse_alphabet.PulseAlphabet.classify`
+            returned for `code`.
+        """
+        self = cls.__new__(cls)
+        self._parse(
+            spec,
+            tolerance,
+            code,
+            windows,
+            frame_match,
+            alphabet,
+            classes
+        )
+        return self
+
+    def _parse(
+        self,
+        spec,
+        tolerance,
+        code,
+        windows,
+        frame_match=None,
+        alphabet=None,
+        classes=None
+    ):
+        if windows is None or windows.tolerance != tolerance:
+            windows = TimingWindows(tolerance)
+            frame_match = None
+
+        encoding = spec.encoding
+        lead_in = spec.lead_in
+        lead_out = spec.lead_out
+        bursts = spec.bursts
+        # matched middle timings get removed
+        middle_timings = list(spec.middle_timings)
+
+        self._windows = windows
+        self._encoding = encoding
+        self._lsb = encoding.startswith('lsb')
+        self._original_code = tuple(code)
+        self._lead_in = lead_in
+        self._lead_out = lead_out
+        self._bursts = bursts
+        self._tolerance = tolerance
+        self._stream_encoding = spec.stream_encoding
+        self._middle_timings = spec.middle_timings
+
+        # the pulses of the frame never get moved around. The lead in is
+        # matched by moving a cursor forward from the start of the frame and
+        # the lead out is matched in place at the end of the frame. A lead in
+        # timing that takes up part of a pulse leaves what is left of the
+        # pulse in `head`, which stands in for the pulse at the cursor.
+        pulses = self._original_code
+        stop = len(pulses)
+
+        if frame_match is None:
+            frame_match = spec.match_frame(pulses, windows)
+
+            if isinstance(frame_match, Rejection):
+                raise frame_match.error()
+
+        (
+            start,
+            head,
+            lead_out_start,
+            lead_out_stop,
+            cleaned_lead_out,
+            half_bits
+        ) = frame_match
+
+        cleaned_code = list(lead_in)
+
+        # the pulses between the lead in and the lead out are the only ones
+        # that get copied. Pulses that come after a wildcard in the lead out
+        # are part of the stream.
+        code = list(pulses[start:lead_out_start])
+        if lead_out_stop < stop:
+            code += pulses[lead_out_stop:stop]
+
+        if head is not None and (start < lead_out_start or lead_out_stop == start):
+            code[0] = head
+
+        code += half_bits
+
+        stream = None
+
+        if (
+            classes is not None and
+            alphabet.get_table(spec, windows) is not None
+        ):
+            # the classes of the pulses that got changed while matching the
+            # lead in and lead out have to be worked out again
+            changed = alphabet.classify(
+                ([] if head is None else [head]) + half_bits
+            )
+
+            if changed is not None:
+                code_classes = classes[start:lead_out_start]
+                if lead_out_stop < stop:
+                    code_classes += classes[lead_out_stop:stop]
+
+                if head is not None:
+                    if start < lead_out_start or lead_out_stop == start:
+                        code_classes[0] = changed[0]
+
+                    del changed[0]
+
+                code_classes += changed
+
+                stream = alphabet.classify_stream(
+                    spec,
+                    windows,
+                    code_classes,
+                    cleaned_code
+                )
+
+        if (
+            stream is None and
+            _backend == 'numpy' and
+            numpy_backend.can_classify(spec)
+        ):
+            stream = numpy_backend.classify(spec, windows, code, cleaned_code)
+
+        if stream is None:
+            stream = self._parse_stream(
+                spec,
+                code,
+                middle_timings,
+                cleaned_code
+            )
+
+        pairs, self._bit_value, self._num_bits = stream
+
+        self._code = []
+        cleaned_code += cleaned_lead_out
+
+        if not cleaned_code:
+            raise IRStreamError
+
+        if cleaned_code[-1] is None:
+            total_time = -self._lead_out[-1]
+            total_time += sum(abs(item) for item in cleaned_code[:-1])
+            cleaned_code[-1] = total_time
+
+        for pulse in cleaned_code:
+            if (
+                len(self._code) and
+                (self._code[-1] < 0 > pulse or self._code[-1] > 0 < pulse)
+            ):
+                self._code[-1] += pulse
+                continue
+
+            self._code += [pulse]
+
+        self._stream_pairs = pairs
+
+    def _parse_stream(self, spec, code, middle_timings, cleaned_code):
+        lead_in = spec.lead_in
+        bursts = spec.bursts
+        pairs = []
 
         if self._stream_encoding == 'bit':
             mark, space = bursts
@@ -356,7 +809,7 @@ class CodeWrapper(object):
         elif self._stream_encoding == 'manchester':
             mark, space = bursts[0]
 
-            for i, burst in enumerate(code[:]):
+            for i, burst in enumerate(code):
                 if self._match(burst, mark):
                     pairs += [mark]
                     cleaned_code += [mark]
@@ -695,6 +1148,12 @@ class CodeWrapper(object):
                 else:
                     raise IRStreamError(str(code))
 
+        # the bits get shifted in to a single int, the first bit of the
+        # stream ends up being the most significant bit.
+        symbol_values = spec.symbol_values
+        value = 0
+        num_bits = 0
+
         for i, bp in enumerate(pairs):
             if self._stream_encoding != 'bit' and len(bp) == 1:
                 if i + 1 == len(pairs):
@@ -708,46 +1167,18 @@ class CodeWrapper(object):
                 else:
                     raise IRStreamError
 
-            if bp in bursts:
-                if len(bursts) == 2:
-                    decoded_code += [bursts.index(bp)]
-                elif len(bursts) == 4:
-                    num = bursts.index(bp)
-                    decoded_code += [num >> 1 & 1, num & 1]
+            try:
+                if isinstance(bp, list):
+                    bits, count = symbol_values[tuple(bp)]
                 else:
-                    num = bursts.index(bp)
-                    decoded_code += [
-                        num >> 3 & 1,
-                        num >> 2 & 1,
-                        num >> 1 & 1,
-                        num & 1
-                    ]
-            else:
+                    bits, count = symbol_values[bp]
+            except KeyError:
                 raise IRStreamError(str(pairs))
 
-        self._code = []
-        cleaned_code += cleaned_lead_out
+            value = value << count | bits
+            num_bits += count
 
-        if not cleaned_code:
-            raise IRStreamError
-
-        if cleaned_code[-1] is None:
-            total_time = -self._lead_out[-1]
-            total_time += sum(abs(item) for item in cleaned_code[:-1])
-            cleaned_code[-1] = total_time
-
-        for pulse in cleaned_code:
-            if (
-                len(self._code) and
-                (self._code[-1] < 0 > pulse or self._code[-1] > 0 < pulse)
-            ):
-                self._code[-1] += pulse
-                continue
-
-            self._code += [pulse]
-
-        self._stream_pairs = pairs[:]
-        self._decoded_code = decoded_code[:]
+        return pairs, value, num_bits
 
     def _match_pair(self, mark, space, expected_mark, expected_space):
         return (
@@ -756,26 +1187,7 @@ class CodeWrapper(object):
         )
 
     def _match(self, value, expected_timing_value):
-        if (
-            value < 0 < expected_timing_value or
-            value > 0 > expected_timing_value
-        ):
-            return False
-
-        high = math.floor(
-            expected_timing_value +
-            (expected_timing_value * (self._tolerance / 100.0))
-        )
-        low = math.floor(
-            expected_timing_value -
-            (expected_timing_value * (self._tolerance / 100.0))
-        )
-
-        # do a flip flop of the high and low so the same expression can
-        # be used when evaluating a raw timing
-        if expected_timing_value < 0:
-            low, high = high, low
-
+        low, high = self._windows[expected_timing_value]
         return low <= value <= high
 
     def __iter__(self):
@@ -786,16 +1198,24 @@ class CodeWrapper(object):
         return self._code[item]
 
     def get_value(self, start_bit, stop_bit):
-        bits = self._decoded_code[start_bit: stop_bit + 1]
-
-        res = 0
+        num_bits = self._num_bits
+        # a field that runs past the end of the stream gets cut short
+        stop = min(stop_bit, num_bits - 1)
+        count = stop - start_bit + 1
+
+        if count > 0:
+            res = (
+                self._bit_value >> (num_bits - 1 - stop) &
+                ((1 << count) - 1)
+            )
 
-        if self._encoding.startswith('lsb'):
-            for i, item in enumerate(bits):
-                res |= item << i
+            if self._lsb:
+                if count <= 8:
+                    res = _REVERSED_BYTES[res] >> (8 - count)
+                else:
+                    res = _reverse_bits(res, count)
         else:
-            for i, item in enumerate(bits):
-                res |= item << ~i + len(bits)
+            res = 0
 
         return integer_wrapper.IntegerWrapper(
             res,
@@ -817,12 +1237,12 @@ class CodeWrapper(object):
 
     @property
     def lead_in(self):
-        return self._lead_in[:]
+        return list(self._lead_in)
 
     @property
     def lead_out(self):
 
-        lead_out = self._lead_out[:]
+        lead_out = list(self._lead_out)
         if lead_out and lead_out[-1] > 0:
             tt = sum(abs(item) for item in self._code[:-1])
             lead_out[-1] = tt - lead_out[-1]
@@ -831,11 +1251,16 @@ class CodeWrapper(object):
 
     @property
     def num_bits(self):
-        return len(self._decoded_code)
+        return self._num_bits
+
+    @property
+    def bit_value(self):
+        return self._bit_value
 
     @property
     def bits(self):
-        return self._decoded_code[:]
+        value = self._bit_value
+        return [value >> i & 1 for i in range(self._num_bits - 1, -1, -1)]
 
     def get_burst_pair(self, index):
         return self._stream_pairs[index]
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# ****************************************************************************
+
+# Remotes send the same handful of frames over and over again. The decode
+# cache remembers which decoder decoded a frame and what the parameters of
+# the code were. The key is a signature of the frame, every duration is
+# rounded to the resolution of the cache and the frequency is rounded to the
+# nearest kHz. When the same frame comes in again the code is rebuilt from
+# the cached parameters without going through the dispatcher and without
+# parsing the frame.
+#
+# Only codes that were decoded from the single frame that was passed in get
+# cached. Decoders that build a code from more then one frame (XMP, DirecTV)
+# set `_cache_decode` to False and codes that are repeats of a code that was
+# decoded before are left out because the decoder has to see those frames to
+# keep track of its state. A cached code is only handed out when the decoder
+# that decoded it is the decoder the dispatcher would try first.
+#
+# The negative cache works the other way around, it remembers frames that
+# none of the decoders were able to decode. Those are the most expensive
+# frames because every decoder gets tried. When one of those frames comes in
+# again only the decoders that keep state and the universal decoder get to
+# see it.
+
+import threading
+from collections import OrderedDict
+
+from . import high_precision_timers
+from .ir_code import IRCode
+
+
+MAX_SIZE = 256
+TTL = 3600.0
+RESOLUTION = 50
+
+NEGATIVE_MAX_SIZE = 1024
+NEGATIVE_TTL = 60.0
+
+
+class _SignatureCache(object):
+
+    def __init__(self, max_size, ttl, resolution):
+        """
+        :param max_size: maximum number of frames that are cached.
+        :param ttl: number of seconds a frame stays in the cache.
+        :param resolution: durations are rounded to this many microseconds.
+        """
+        self._max_size = max_size
+        self._ttl = ttl
+        self._resolution = resolution
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    @property
+    def evictions(self):
+        return self._evictions
+
+    def __len__(self):
+        return len(self._entries)
+
+    def signature(self, data, frequency):
+        resolution = self._resolution
+        half = resolution // 2
+
+        return (
+            (frequency + 500) // 1000,
+            tuple((item + half) // resolution for item in data)
+        )
+
+    def _get(self, key, decoder):
+        with self._lock:
+            entry = self._entries.get(key, None)
+
+            if entry is None or entry[0] != decoder:
+                self._misses += 1
+                return None
+
+            if high_precision_timers.millis() - entry[-1] > self._ttl * 1000:
+                del self._entries[key]
+                self._evictions += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry
+
+    def _put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DecodeCache(_SignatureCache):
+
+    def __init__(self, max_size=MAX_SIZE, ttl=TTL, resolution=RESOLUTION):
+        _SignatureCache.__init__(self, max_size, ttl, resolution)
+
+    def get_code(self, data, frequency, decoder):
+        """
+        Rebuilds the code for a frame that is in the cache.
+
+        :param decoder: decoder the frame has to have been decoded by.
+
+        :return: new :class:`ir_code.IRCode` instance or `None` if the frame
+            is not in the cache.
+        """
+        entry = self._get(self.signature(data, frequency), decoder)
+
+        if entry is None:
+            return None
+
+        decoder, params, normalized_rlc, wrapper, name, _ = entry
+
+        code = IRCode(
+            decoder,
+            data[:],
+            [rlc[:] for rlc in normalized_rlc],
+            params.copy(),
+            name=name
+        )
+        code._code = wrapper
+        return code
+
+    def add(self, data, frequency, code):
+        """
+        Adds a decoded code to the cache.
+
+        The code is only added if it was decoded from `data` alone.
+        """
+        # noinspection PyProtectedMember
+        if not code.decoder._cache_decode or code._original_rlc != data:
+            return
+
+        # noinspection PyProtectedMember
+        entry = (
+            code.decoder,
+            code._data.copy(),
+            [rlc[:] for rlc in code._normalized_rlc],
+            code._code,
+            code._name,
+            high_precision_timers.millis()
+        )
+
+        self._put(self.signature(data, frequency), entry)
+
+
+class NegativeCache(_SignatureCache):
+
+    def __init__(
+        self,
+        max_size=NEGATIVE_MAX_SIZE,
+        ttl=NEGATIVE_TTL,
+        resolution=RESOLUTION
+    ):
+        _SignatureCache.__init__(self, max_size, ttl, resolution)
+
+    def rejected(self, data, frequency):
+        """
+        Checks if none of the decoders were able to decode the frame before.
+
+        :rtype: bool
+        """
+        return self._get(self.signature(data, frequency), None) is not None
+
+    def add(self, data, frequency):
+        """
+        Adds a frame that none of the decoders were able to decode.
+        """
+        self._put(
+            self.signature(data, frequency),
+            (None, high_precision_timers.millis())
+        )
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+# Delivers decoded codes and release events to an asyncio event loop.
+#
+# The dispatcher hands every code it would pass to the decode callback to
+# each open stream. If that happens on the thread that runs the event loop
+# the event gets queued right away, otherwise it gets handed to the loop
+# using `call_soon_threadsafe`. No thread is used to poll for codes.
+#
+# Frames that are sent using `DecodeStream.send` get decoded in the default
+# executor of the event loop the same way `async_decode` does it and `send`
+# waits until there is room in the queue before it decodes the frame. Frames that come in from other threads (`stream_decode`) are not
+# able to wait, when the queue is full the oldest event gets dropped and
+# `dropped` gets incremented.
+
+import asyncio
+import threading
+import collections
+
+
+MAX_SIZE = 64
+
+DecodeEvent = collections.namedtuple('DecodeEvent', ['code', 'released'])
+
+_CLOSED = object()
+
+
+class DecodeStream(object):
+
+    def __init__(self, module, maxsize=MAX_SIZE):
+        """
+        Has to be created from a coroutine running on the event loop the
+        events should be delivered to.
+
+        :param module: the protocols module.
+        :param maxsize: number of events that get queued.
+        """
+        self._module = module
+        self._loop = asyncio.get_running_loop()
+        self._thread_id = threading.get_ident()
+        self._queue = asyncio.Queue(maxsize)
+        self._space = asyncio.Event()
+        self._space.set()
+        self._closed = False
+        self._dropped = 0
+
+    @property
+    def closed(self):
+        return self._closed
+
+    @property
+    def dropped(self):
+        return self._dropped
+
+    def _put(self, event):
+        if self._closed:
+            return
+
+        if self._queue.full():
+            self._queue.get_nowait()
+            self._dropped += 1
+
+        self._queue.put_nowait(event)
+
+        if self._queue.full():
+            self._space.clear()
+
+    def _put_threadsafe(self, event):
+        if threading.get_ident() == self._thread_id:
+            self._put(event)
+            return
+
+        try:
+            self._loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # the event loop has been closed
+            self._module._remove_stream(self)
+            self._closed = True
+
+    def _released(self, code):
+        code.unbind_released_callback(self._released)
+        self._put_threadsafe(DecodeEvent(code, True))
+
+    def _decoded(self, code):
+        code.bind_released_callback(self._released)
+        self._put_threadsafe(DecodeEvent(code, False))
+
+    async def send(self, data, frequency=0):
+        """
+        Decodes a frame without blocking the event loop.
+
+        Waits until there is room in the queue before the frame gets decoded.
+
+        :return: the same thing `protocols.decode` returns.
+        """
+        while self._queue.full() and not self._closed:
+            await self._space.wait()
+
+        return await self._module.async_decode(data, frequency)
+
+    def close(self):
+        if self._closed:
+            return
+
+        self._closed = True
+        self._module._remove_stream(self)
+
+        if self._queue.full():
+            self._queue.get_nowait()
+
+        self._queue.put_nowait(_CLOSED)
+        self._space.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+
+        event = await self._queue.get()
+        self._space.set()
+
+        if event is _CLOSED:
+            raise StopAsyncIteration
+
+        return event
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# ****************************************************************************
+
+# The decoder ranking keeps a decayed hit count for every decoder. Every time
+# a decoder decodes a frame its count goes up by one and the counts of all of
+# the decoders decay a little bit. The dispatcher uses the counts to try the
+# decoders that are seen the most first.
+#
+# Instead of decaying every count on each hit the amount that gets added for
+# a hit grows by the inverse of the decay. The effect is the same and only
+# the count of the decoder that had the hit gets touched. Once the increment
+# gets too large everything is scaled back down.
+#
+# Decoders that are able to decode the same frame have to be tried in the
+# order the dispatcher hands them over, the first one that decodes the frame
+# is the one the frame belongs to. Two decoders are only able to decode the
+# same frame if their data timings overlap and the number of pulses and the
+# duration of their frames overlap. The sort keeps every pair of decoders like
+# that in the order they were passed in and moves everything else around by
+# hit count. This is not carried over from one pair to the next, NEC and
+# NECf16 are free to swap places even if there is a decoder that is able to
+# decode the frames of both of them.
+
+import heapq
+import threading
+
+from .frame_bounds import UNBOUNDED
+from .timing_windows import get_timings
+
+
+DECAY = 0.999
+RESCALE_LIMIT = 1e100
+
+
+def _data_windows(decoder):
+    # noinspection PyProtectedMember
+    windows = decoder._get_timing_windows()
+    # noinspection PyProtectedMember
+    return [windows[timing] for timing in get_timings(decoder._bursts)]
+
+
+def _frame_bounds(decoder):
+    # a decoder that skips quick_reject is handed every frame
+    # noinspection PyProtectedMember
+    if not decoder._use_quick_reject:
+        return [UNBOUNDED]
+
+    bounds = [decoder.frame_bounds]
+
+    # noinspection PyProtectedMember
+    if decoder._repeat_lead_in or decoder._repeat_lead_out:
+        bounds += [decoder.repeat_frame_bounds]
+
+    return bounds
+
+
+def _ranges_overlap(low1, high1, low2, high2):
+    # a high of None means there is no upper bound
+    return (
+        (high2 is None or low1 <= high2) and
+        (high1 is None or low2 <= high1)
+    )
+
+
+def _bounds_overlap(bounds1, bounds2):
+    return (
+        _ranges_overlap(
+            bounds1.min_pulses,
+            bounds1.max_pulses,
+            bounds2.min_pulses,
+            bounds2.max_pulses
+        ) and
+        _ranges_overlap(
+            bounds1.min_duration,
+            bounds1.max_duration,
+            bounds2.min_duration,
+            bounds2.max_duration
+        )
+    )
+
+
+def can_overlap(decoder1, decoder2):
+    """
+    Checks if 2 decoders are able to decode the same frame.
+
+    The bits of a frame are made from the bursts of a decoder. If none of the
+    burst windows of one decoder overlap the burst windows of the other
+    decoder there is no frame they are both able to decode. The same goes for
+    decoders whose frames are not able to have the same number of pulses and
+    the same duration.
+    """
+    for bounds1 in _frame_bounds(decoder1):
+        if any(
+            _bounds_overlap(bounds1, bounds2)
+            for bounds2 in _frame_bounds(decoder2)
+        ):
+            break
+    else:
+        return False
+
+    windows1 = _data_windows(decoder1)
+    windows2 = _data_windows(decoder2)
+
+    if not windows1 or not windows2:
+        return True
+
+    for low1, high1 in windows1:
+        for low2, high2 in windows2:
+            if low1 <= high2 and low2 <= high1:
+                return True
+
+    return False
+
+
+def get_conflicts(decoders):
+    """
+    Finds the decoders that have to stay in the order they were passed in.
+
+    :return: `(conflicts, counts)`, `conflicts` is a list with the indexes of
+        the decoders that come after each decoder and are able to decode the
+        same frame as it. `counts` is the number of decoders that come before
+        each decoder and are able to decode the same frame.
+    """
+    conflicts = [[] for _ in decoders]
+    counts = [0] * len(decoders)
+
+    for i, decoder1 in enumerate(decoders):
+        for j in range(i + 1, len(decoders)):
+            if can_overlap(decoder1, decoders[j]):
+                conflicts[i].append(j)
+                counts[j] += 1
+
+    return conflicts, counts
+
+
+class DecoderRanking(object):
+
+    def __init__(self, decay=DECAY):
+        self._decay = decay
+        self._increment = 1.0
+        self._scores = {}
+        self._conflicts = {}
+        self._lock = threading.Lock()
+
+    @property
+    def decay(self):
+        return self._decay
+
+    def hit(self, decoder):
+        name = decoder.name
+
+        with self._lock:
+            self._increment /= self._decay
+            self._scores[name] = self._scores.get(name, 0.0) + self._increment
+
+            if self._increment > RESCALE_LIMIT:
+                for key, value in self._scores.items():
+                    self._scores[key] = value / self._increment
+
+                self._increment = 1.0
+
+    def sort(self, decoders):
+        """
+        Orders `decoders` by hit count, highest first.
+
+        A decoder only gets moved in front of the decoders it is not able to
+        decode the same frame as. Decoders that have the same hit count keep
+        the order they were passed in.
+        """
+        key = tuple(decoder.name for decoder in decoders)
+
+        try:
+            conflicts, counts = self._conflicts[key]
+        except KeyError:
+            conflicts, counts = get_conflicts(decoders)
+            self._conflicts[key] = (conflicts, counts)
+
+        scores = self._scores
+
+        # a decoder that has to be tried before a decoder with a lot of hits
+        # gets moved up along with it
+        priorities = [0.0] * len(decoders)
+
+        for i in range(len(decoders) - 1, -1, -1):
+            priorities[i] = max(
+                [scores.get(decoders[i].name, 0.0)] +
+                [priorities[j] for j in conflicts[i]]
+            )
+
+        counts = counts[:]
+
+        # the decoders that have no decoder in front of them that has to be
+        # tried first
+        ready = [
+            (-priorities[i], i)
+            for i in range(len(decoders))
+            if not counts[i]
+        ]
+        heapq.heapify(ready)
+
+        res = []
+
+        while ready:
+            _, i = heapq.heappop(ready)
+            res.append(decoders[i])
+
+            for j in conflicts[i]:
+                counts[j] -= 1
+
+                if not counts[j]:
+                    heapq.heappush(ready, (-priorities[j], j))
+
+        return res
+
+    def invalidate(self):
+        # the conflicts depend on the tolerance of the decoders
+        self._conflicts.clear()
+
+    def get_hit_count(self, name):
+        with self._lock:
+            return self._scores.get(name, 0.0) / self._increment
+
+    def set_hit_count(self, name, value):
+        with self._lock:
+            if value:
+                self._scores[name] = value * self._increment
+            else:
+                self._scores.pop(name, None)
+
+    def clear(self):
+        with self._lock:
+            self._scores.clear()
+            self._increment = 1.0
+
+    @property
+    def ranking(self):
+        """
+        List of (decoder name, hit count) for the decoders that have had a hit,
+        highest hit count first.
+        """
+        with self._lock:
+            increment = self._increment
+            res = [
+                (name, score / increment)
+                for name, score in self._scores.items()
+            ]
+
+        return sorted(res, key=lambda item: -item[1])
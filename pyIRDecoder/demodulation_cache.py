@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# ****************************************************************************
+
+# A lot of protocols share the same lead in, lead out, middle timings and
+# bursts and only differ in how the bits get split into fields and what the
+# checksum is. The NEC, RC6 and Sky families are made up of protocols like
+# that. When the dispatcher hands a frame to every one of them each decoder
+# matches the lead in and lead out and parses the stream again, all to end
+# up with the same bits.
+#
+# Decoders get grouped by the key of their FrameSpec and their tolerance.
+# While the dispatcher has a frame out to its decoders the first decoder of
+# a group that matches the frame or parses the stream leaves what it got in
+# the cache, the other decoders of the group pick it up from there and only
+# check the bit count and their fields. What is cached is only good for the
+# frame that is being dispatched, it gets thrown away once the dispatcher
+# is done with the frame.
+#
+# When the dispatcher has a pulse alphabet the pulses of the frame get
+# classified once and every decoder parses the stream from those classes.
+#
+# Decoders that have `_use_quick_reject` set to False do not use the cache.
+# Those change the frame or their spec while they decode so what they get
+# out of a frame is not able to be shared.
+
+from .code_wrapper import CodeWrapper
+from . import IRException
+
+
+_NOT_CLASSIFIED = object()
+
+
+class DemodulationCache(object):
+
+    def __init__(self):
+        self._frame = None
+        self._alphabet = None
+        self._classes = _NOT_CLASSIFIED
+        self._matches = {}
+        self._streams = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self):
+        # number of times a decoder did not have to match or parse the frame
+        # because another decoder of its group already had
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def reset_counts(self):
+        self._hits = 0
+        self._misses = 0
+
+    def start(self, data, alphabet=None):
+        """
+        Starts caching for a frame that is being handed to the decoders.
+
+        Only calls that get passed the same list as `data` use the cache.
+
+        :param alphabet: :class:`pulse_alphabet.PulseAlphabet` to classify
+            the pulses of the frame with.
+        """
+        self._frame = data
+        self._alphabet = alphabet
+        self._classes = _NOT_CLASSIFIED
+        self._matches.clear()
+        self._streams.clear()
+
+    def stop(self):
+        self._frame = None
+        self._alphabet = None
+        self._classes = _NOT_CLASSIFIED
+        self._matches.clear()
+        self._streams.clear()
+
+    def _get_classes(self):
+        # the frame only gets classified once a decoder parses the stream,
+        # most frames get turned away before that
+        classes = self._classes
+
+        if classes is _NOT_CLASSIFIED:
+            if self._alphabet is None:
+                classes = None
+            else:
+                classes = self._alphabet.classify(self._frame)
+
+            self._classes = classes
+
+        return classes
+
+    def match_frame(self, spec, windows, data):
+        """
+        Same as :meth:`FrameSpec.match_frame`.
+        """
+        if data is not self._frame:
+            return spec.match_frame(data, windows)
+
+        key = (spec.key, windows.tolerance)
+
+        try:
+            frame_match = self._matches[key]
+        except KeyError:
+            self._misses += 1
+            frame_match = spec.match_frame(data, windows)
+            self._matches[key] = frame_match
+        else:
+            self._hits += 1
+
+        return frame_match
+
+    def parse(self, spec, tolerance, data, windows, frame_match):
+        """
+        Same as :meth:`CodeWrapper.from_spec`.
+
+        A CodeWrapper does not get changed once it has been built so the
+        decoders of a group all get handed the same one.
+        """
+        if data is not self._frame:
+            return CodeWrapper.from_spec(
+                spec,
+                tolerance,
+                data,
+                windows,
+                frame_match
+            )
+
+        key = (spec.key, tolerance)
+
+        try:
+            code = self._streams[key]
+        except KeyError:
+            self._misses += 1
+
+            try:
+                code = CodeWrapper.from_spec(
+                    spec,
+                    tolerance,
+                    data,
+                    windows,
+                    frame_match,
+                    self._alphabet,
+                    self._get_classes()
+                )
+            except IRException as err:
+                code = err
+
+            self._streams[key] = code
+        else:
+            self._hits += 1
+
+        if isinstance(code, IRException):
+            # the error gets raised again for every decoder of the group,
+            # the traceback would keep on growing if it was left on it
+            raise code.with_traceback(None)
+
+        return code
+
+
+def get_groups(decoders):
+    """
+    Groups decoders that demodulate a frame the same way.
+
+    :param decoders: decoders to group.
+
+    :return: `{(FrameSpec.key, tolerance): [decoder, ...]}`, groups of a
+        single decoder are left out.
+    """
+    groups = {}
+
+    for decoder in decoders:
+        # noinspection PyProtectedMember
+        if not decoder._use_quick_reject:
+            continue
+
+        # noinspection PyProtectedMember
+        key = (decoder._get_frame_spec().key, decoder.tolerance)
+        groups.setdefault(key, []).append(decoder)
+
+    return dict(
+        (key, group) for key, group in groups.items()
+        if len(group) > 1
+    )
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+# Most protocols carry fields that always hold the same value or that hold
+# the inverted bits of another field. Those fields get declared on the
+# decoder and are compiled here into masks over the packed bitstream of a
+# CodeWrapper, that way a frame that fails them is able to be turned away
+# before any IntegerWrapper or IRCode gets built for it.
+#
+# The bitstream is packed with the first bit of the stream as the most
+# significant bit. A field of an lsb protocol has its bits in the stream in
+# reverse order so the constant gets reversed before it is put into the
+# mask. Inverting a field does not care about the bit order.
+
+from .integer_wrapper import _reverse
+
+
+class FieldChecks(object):
+    """
+    Checks a packed bitstream against the constant and inverted fields of a
+    protocol.
+
+    :param encoding: encoding of the protocol, `'lsb'` or `'msb'`.
+    :param bit_count: number of bits in the stream.
+    :param parameters: `[name, start, stop]` of every field in the stream.
+    :param constant_fields: `[name, value]` of the fields that always hold
+        the same value.
+    :param inverted_fields: `[name, other]` of the fields that hold the
+        inverted bits of field `other`.
+    """
+
+    def __init__(
+        self,
+        encoding,
+        bit_count,
+        parameters,
+        constant_fields,
+        inverted_fields
+    ):
+        self.encoding = encoding
+        self.bit_count = bit_count
+        self.parameters = parameters
+
+        fields = {}
+        for name, start, stop in parameters:
+            if stop >= bit_count:
+                raise ValueError(
+                    'field {0} runs past the end of the stream'.format(name)
+                )
+
+            fields[name] = (bit_count - 1 - stop, stop - start + 1)
+
+        lsb = encoding.startswith('lsb')
+        mask = 0
+        value = 0
+
+        for name, constant in constant_fields:
+            shift, num_bits = fields[name]
+
+            if constant >> num_bits:
+                raise ValueError(
+                    'constant {0} does not fit into field {1}'.format(
+                        constant,
+                        name
+                    )
+                )
+
+            if lsb:
+                constant = _reverse(constant, num_bits)
+
+            mask |= ((1 << num_bits) - 1) << shift
+            value |= constant << shift
+
+        self.mask = mask
+        self.value = value
+
+        inverted = []
+        for name, other in inverted_fields:
+            shift, num_bits = fields[name]
+            other_shift, other_num_bits = fields[other]
+
+            if num_bits != other_num_bits:
+                raise ValueError(
+                    'fields {0} and {1} are not the same size'.format(
+                        name,
+                        other
+                    )
+                )
+
+            inverted += [(shift, other_shift, (1 << num_bits) - 1)]
+
+        self.inverted = inverted
+
+    def matches(self, encoding, bit_count, parameters):
+        """
+        Checks if the checks got compiled from the spec passed in.
+
+        :param encoding: encoding of the protocol.
+        :param bit_count: number of bits in the stream.
+        :param parameters: field list of the protocol.
+
+        :return: `True` if the checks are able to be used for the spec.
+        """
+        return (
+            parameters is self.parameters and
+            bit_count == self.bit_count and
+            encoding == self.encoding
+        )
+
+    def check(self, bit_value):
+        """
+        Checks a packed bitstream.
+
+        :param bit_value: stream packed into an int, the first bit of the
+            stream being the most significant bit.
+
+        :return: `True` if every declared field holds what it has to.
+        """
+        if bit_value & self.mask != self.value:
+            return False
+
+        for shift, other_shift, mask in self.inverted:
+            if (bit_value >> shift ^ bit_value >> other_shift) & mask != mask:
+                return False
+
+        return True
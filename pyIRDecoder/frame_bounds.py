@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+
+# The timing spec of a protocol fixes how many pulses a frame is able to have
+# and how long the frame is able to be. Working out those bounds once lets a
+# decoder turn away a frame by looking at its length and duration instead of
+# building a CodeWrapper only to find out the frame has the wrong number of
+# bits.
+#
+# The bounds are kept loose on purpose. CodeWrapper merges a lead in with the
+# first half bit, a lead out with the last half bit and a middle timing with
+# the half bit next to it, and the last space of the stream is allowed to be
+# missing. The bounds allow for all of that so a frame that CodeWrapper is
+# able to decode never gets rejected.
+#
+# pulse distance:  every pulse holds at most one half bit.
+# manchester:      every pulse holds at most two half bits.
+# bit:             a pulse is able to hold any number of bits.
+
+import math
+from collections import namedtuple
+
+
+WILDCARD = -999999999999
+
+FrameBounds = namedtuple(
+    'FrameBounds',
+    ['min_pulses', 'max_pulses', 'min_duration', 'max_duration']
+)
+
+# a maximum of None means there is no upper bound.
+UNBOUNDED = FrameBounds(0, None, 0, None)
+
+
+def _get_stream_encoding(bursts):
+    # same logic CodeWrapper uses
+    if not bursts:
+        return 'halfbit'
+
+    last_pair = bursts[0]
+    if isinstance(last_pair, int):
+        return 'bit'
+
+    for mark, space in bursts[1:]:
+        if mark == last_pair[1] and space == last_pair[0]:
+            return 'manchester'
+
+        last_pair = [mark, space]
+
+    return 'halfbit'
+
+
+def get_frame_bounds(
+    lead_in,
+    lead_out,
+    middle_timings,
+    bursts,
+    bit_count,
+    tolerance
+):
+    """
+    Works out the bounds for a frame built from the timing spec passed in.
+
+    :param lead_in: lead in timings
+    :param lead_out: lead out timings, a positive last item is the total
+        time of the frame.
+    :param middle_timings: middle timings
+    :param bursts: burst pairs, or single timings for bit encoded streams.
+    :param bit_count: number of bits in the frame, None if the number of bits
+        is not known.
+    :param tolerance: tolerance of the decoder in percent.
+
+    :return: FrameBounds
+    """
+    if WILDCARD in lead_in or WILDCARD in lead_out:
+        return UNBOUNDED
+
+    # decoders that parse their frames on their own are able to have bursts
+    # that are not pairs
+    if any(
+        not isinstance(burst, int) and len(burst) != 2
+        for burst in bursts
+    ):
+        return UNBOUNDED
+
+    stream_encoding = _get_stream_encoding(bursts)
+    high = 1.0 + tolerance / 100.0
+    low = max(0.0, 1.0 - tolerance / 100.0)
+
+    # middle timings that are tuples or dicts are able to match any number
+    # of pulses without adding a bit.
+    unbounded_middles = False
+    middle_pulses = 0
+    middle_time = 0
+
+    if stream_encoding != 'bit':
+        for timing in middle_timings:
+            if isinstance(timing, int):
+                middle_pulses += 1
+                middle_time += abs(timing)
+            elif isinstance(timing, list):
+                middle_pulses += len(timing)
+                middle_time += sum(abs(item) for item in timing)
+            elif isinstance(timing, dict):
+                if stream_encoding != 'manchester':
+                    unbounded_middles = True
+            else:
+                unbounded_middles = True
+
+    if stream_encoding == 'bit':
+        timings = [abs(item) for item in bursts]
+        burst_times = timings
+        groups = bit_count
+        half_bits = bit_count
+    elif bursts:
+        pairs = list(bursts)
+        for timing in middle_timings:
+            if isinstance(timing, dict):
+                pairs += timing['bursts']
+
+        timings = [abs(item) for pair in pairs for item in pair]
+        burst_times = [abs(mark) + abs(space) for mark, space in pairs]
+
+        if len(bursts) == 2:
+            bits_per_group = 1
+        elif len(bursts) == 4:
+            bits_per_group = 2
+        else:
+            bits_per_group = 4
+
+        if bit_count is None:
+            groups = None
+        else:
+            groups = int(math.ceil(bit_count / float(bits_per_group)))
+
+        half_bits = None if groups is None else groups * 2
+    else:
+        timings = [0]
+        burst_times = [0]
+        groups = 0
+        half_bits = 0
+
+    # every lead in and lead out timing takes up a pulse of its own
+    lead_pulses = len(lead_in) + len(lead_out)
+    lead_in_time = sum(abs(item) for item in lead_in)
+
+    if groups is None:
+        min_pulses = lead_pulses
+        min_time = lead_in_time
+    else:
+        if stream_encoding == 'bit':
+            min_pulses = lead_pulses
+        elif stream_encoding == 'manchester':
+            min_pulses = max(lead_pulses, groups)
+        else:
+            min_pulses = max(lead_pulses, half_bits - 1)
+
+        min_time = lead_in_time + groups * min(burst_times) - max(timings)
+
+    if groups is None or unbounded_middles:
+        max_pulses = None
+        max_duration = None
+    else:
+        max_pulses = lead_pulses + middle_pulses + half_bits
+        max_time = (
+            lead_in_time +
+            sum(abs(item) for item in lead_out) +
+            middle_time +
+            groups * max(burst_times)
+        )
+        max_duration = int(math.ceil(max_time * high)) + max_pulses
+
+    # floor is used when matching a timing so every pulse is able to come up
+    # one short
+    min_duration = max(
+        0,
+        int(math.floor(min_time * low)) - len(lead_in) - (half_bits or 0)
+    )
+
+    if lead_out and lead_out[-1] > 0:
+        # the last item of the lead out is the total time of the frame
+        total_time = lead_out[-1]
+        min_duration = max(
+            min_duration,
+            int(math.floor(total_time * low)) - 1
+        )
+        max_total = int(math.ceil(total_time * high)) + 1
+
+        if max_duration is None:
+            max_duration = max_total
+        else:
+            max_duration = min(max_duration, max_total)
+
+    return FrameBounds(min_pulses, max_pulses, min_duration, max_duration)
@@ -1,7 +1,54 @@
 from typing import Union, Optional
 
 
+# every byte with the order of its bits reversed
+_REVERSED_BYTES = bytes(
+    int('{0:08b}'.format(i)[::-1], 2) for i in range(256)
+)
+
+# the number of bits that are set in every byte
+_ONE_BITS = bytes(bin(i).count('1') for i in range(256))
+
+
+def _mask(num_bits):
+    if num_bits <= 0:
+        return 0
+
+    return (1 << num_bits) - 1
+
+
+def _reverse_bits(value, num_bits):
+    # reverses the order of the lowest `num_bits` bits of value a byte at
+    # a time
+    num_bytes = (num_bits + 7) // 8
+    data = value.to_bytes(num_bytes, 'little').translate(_REVERSED_BYTES)
+    return int.from_bytes(data, 'big') >> (num_bytes * 8 - num_bits)
+
+
+def _reverse(value, num_bits):
+    # same as _reverse_bits but value is allowed to have more bits or be
+    # negative, the lowest `num_bits` bits are what gets reversed
+    if num_bits <= 0:
+        return 0
+
+    value &= (1 << num_bits) - 1
+
+    if num_bits <= 8:
+        return _REVERSED_BYTES[value] >> (8 - num_bits)
+
+    return _reverse_bits(value, num_bits)
+
+
+def _count_one_bits(value):
+    data = value.to_bytes((value.bit_length() + 7) // 8, 'little')
+    return sum(data.translate(_ONE_BITS))
+
+
 class IntegerWrapper(object):
+    # there is one of these for every parameter of every code and a new one
+    # for every operation, the slots keep them small. An int subclass is not
+    # able to have slots.
+    __slots__ = ('_value', '_num_bits', '_timings', 'encoding')
 
     def __init__(
             self,
@@ -12,16 +59,12 @@ class IntegerWrapper(object):
     ):
         if isinstance(value, IntegerWrapper):
             if num_bits is None:
-                num_bits = value.num_bits
-                value = int(value)
+                num_bits = value._num_bits
+                value = value._value
             else:
-                value = int(value)
+                value = value._value
                 if value >= 0:
-                    val = 0
-                    for i in range(num_bits):
-                        val |= ((value >> i) & 1) << i
-
-                    value = val
+                    value &= _mask(num_bits)
         else:
             if num_bits is None:
                 if value == 0:
@@ -30,11 +73,7 @@ class IntegerWrapper(object):
                     num_bits = value.bit_length()
             else:
                 if value >= 0:
-                    val = 0
-                    for i in range(num_bits):
-                        val |= ((value >> i) & 1) << i
-
-                    value = val
+                    value &= _mask(num_bits)
 
         self._num_bits = num_bits
         self._value = value
@@ -43,44 +82,44 @@ class IntegerWrapper(object):
 
     def __eq__(self, other: Union[int, "IntegerWrapper"]):  # self ==
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return self._value == other
 
     def __ne__(self, other: Union[int, "IntegerWrapper"]):  # self !=
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return self._value != other
 
     def __lt__(self, other: Union[int, "IntegerWrapper"]):  # self <
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return self._value < other
 
     def __gt__(self, other: Union[int, "IntegerWrapper"]):  # self >
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return self._value > other
 
     def __le__(self, other: Union[int, "IntegerWrapper"]):  # self <=
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return self._value <= other
 
     def __ge__(self, other: Union[int, "IntegerWrapper"]):  # self >=
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return self._value >= other
 
     def __pos__(self):  # +self
         return IntegerWrapper(
             +self._value,
-            self.num_bits,
+            self._num_bits,
             self._timings,
             self.encoding
         )
@@ -88,7 +127,7 @@ class IntegerWrapper(object):
     def __neg__(self):  # -self
         return IntegerWrapper(
             -self._value,
-            self.num_bits,
+            self._num_bits,
             self._timings,
             self.encoding
         )
@@ -96,7 +135,7 @@ class IntegerWrapper(object):
     def __abs__(self):  # abs(self)
         return IntegerWrapper(
             abs(self._value),
-            self.num_bits,
+            self._num_bits,
             self._timings,
             self.encoding
         )
@@ -110,8 +149,8 @@ class IntegerWrapper(object):
 
     def __add__(self, other: Union[int, "IntegerWrapper"]):  # self +
         if isinstance(other, IntegerWrapper):
-            other_num_bits = other.num_bits
-            other = int(other)
+            other_num_bits = other._num_bits
+            other = other._value
         else:
             other_num_bits = other.bit_length()
 
@@ -123,7 +162,7 @@ class IntegerWrapper(object):
 
     def __sub__(self, other: Union[int, "IntegerWrapper"]):  # self -
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             self._value - other,
@@ -133,7 +172,7 @@ class IntegerWrapper(object):
 
     def __mul__(self, other: Union[int, "IntegerWrapper"]):  # self *
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             self._value * other,
@@ -143,7 +182,7 @@ class IntegerWrapper(object):
 
     def __floordiv__(self, other: Union[int, "IntegerWrapper"]):  # self //
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             self._value // other,
@@ -153,7 +192,7 @@ class IntegerWrapper(object):
 
     def __div__(self, other: Union[int, "IntegerWrapper"]):  # self /
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             self._value // other,
@@ -163,7 +202,7 @@ class IntegerWrapper(object):
 
     def __truediv__(self, other: Union[int, "IntegerWrapper"]):  # self /
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             self._value // other,
@@ -173,7 +212,7 @@ class IntegerWrapper(object):
 
     def __mod__(self, other: Union[int, "IntegerWrapper"]):  # self %
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             self._value % other,
@@ -183,7 +222,7 @@ class IntegerWrapper(object):
 
     def __lshift__(self, other: Union[int, "IntegerWrapper"]):  # self <<
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             self._value << other,
@@ -194,7 +233,7 @@ class IntegerWrapper(object):
 
     def __rshift__(self, other: Union[int, "IntegerWrapper"]):  # self >>
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             self._value >> other,
@@ -205,7 +244,7 @@ class IntegerWrapper(object):
 
     def __and__(self, other: Union[int, "IntegerWrapper"]):  # self &
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             self._value & other,
@@ -215,7 +254,7 @@ class IntegerWrapper(object):
 
     def __or__(self, other: Union[int, "IntegerWrapper"]):  # self |
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             self._value | other,
@@ -225,7 +264,7 @@ class IntegerWrapper(object):
 
     def __xor__(self, other: Union[int, "IntegerWrapper"]):  # self ^
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             self._value ^ other,
@@ -235,7 +274,7 @@ class IntegerWrapper(object):
 
     def __radd__(self, other: Union[int, "IntegerWrapper"]):  # + self
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             other + self._value,
@@ -245,7 +284,7 @@ class IntegerWrapper(object):
 
     def __rsub__(self, other: Union[int, "IntegerWrapper"]):  # - self
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             other - self._value,
@@ -255,7 +294,7 @@ class IntegerWrapper(object):
 
     def __rmul__(self, other: Union[int, "IntegerWrapper"]):  # * self
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             other * self._value,
@@ -265,7 +304,7 @@ class IntegerWrapper(object):
 
     def __rfloordiv__(self, other: Union[int, "IntegerWrapper"]):  # // self
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             other // self._value,
@@ -275,7 +314,7 @@ class IntegerWrapper(object):
 
     def __rdiv__(self, other: Union[int, "IntegerWrapper"]):  # / self
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             other // self._value,
@@ -285,7 +324,7 @@ class IntegerWrapper(object):
 
     def __rtruediv__(self, other: Union[int, "IntegerWrapper"]):  # / self
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             other // self._value,
@@ -295,7 +334,7 @@ class IntegerWrapper(object):
 
     def __rmod__(self, other: Union[int, "IntegerWrapper"]):  # % self
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         return IntegerWrapper(
             other % self._value,
@@ -305,8 +344,8 @@ class IntegerWrapper(object):
 
     def __rlshift__(self, other: Union[int, "IntegerWrapper"]):  # << self
         if isinstance(other, IntegerWrapper):
-            other_num_bits = other.num_bits
-            other = int(other)
+            other_num_bits = other._num_bits
+            other = other._value
         else:
             other_num_bits = other.bit_length()
 
@@ -319,8 +358,8 @@ class IntegerWrapper(object):
 
     def __rrshift__(self, other: Union[int, "IntegerWrapper"]):  # >> self
         if isinstance(other, IntegerWrapper):
-            other_num_bits = other.num_bits
-            other = int(other)
+            other_num_bits = other._num_bits
+            other = other._value
         else:
             other_num_bits = other.bit_length()
 
@@ -333,8 +372,8 @@ class IntegerWrapper(object):
 
     def __rand__(self, other: Union[int, "IntegerWrapper"]):  # & self
         if isinstance(other, IntegerWrapper):
-            other_num_bits = other.num_bits
-            other = int(other)
+            other_num_bits = other._num_bits
+            other = other._value
         else:
             other_num_bits = other.bit_length()
 
@@ -347,8 +386,8 @@ class IntegerWrapper(object):
 
     def __ror__(self, other: Union[int, "IntegerWrapper"]):  # | self
         if isinstance(other, IntegerWrapper):
-            other_num_bits = other.num_bits
-            other = int(other)
+            other_num_bits = other._num_bits
+            other = other._value
         else:
             other_num_bits = other.bit_length()
 
@@ -361,8 +400,8 @@ class IntegerWrapper(object):
 
     def __rxor__(self, other: Union[int, "IntegerWrapper"]):  # ^ self
         if isinstance(other, IntegerWrapper):
-            other_num_bits = other.num_bits
-            other = int(other)
+            other_num_bits = other._num_bits
+            other = other._value
         else:
             other_num_bits = other.bit_length()
 
@@ -375,7 +414,7 @@ class IntegerWrapper(object):
 
     def __iadd__(self, other: Union[int, "IntegerWrapper"]):  # self +=
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         self._value += other
         self._num_bits = self._value.bit_length()
@@ -383,7 +422,7 @@ class IntegerWrapper(object):
 
     def __isub__(self, other: Union[int, "IntegerWrapper"]):  # self -=
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         self._value -= other
         self._num_bits = min(self._num_bits, self._value.bit_length())
@@ -391,7 +430,7 @@ class IntegerWrapper(object):
 
     def __imul__(self, other: Union[int, "IntegerWrapper"]):  # self *=
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         self._value *= other
         self._num_bits = max(self._num_bits, self._value.bit_length())
@@ -399,7 +438,7 @@ class IntegerWrapper(object):
 
     def __ifloordiv__(self, other: Union[int, "IntegerWrapper"]):  # self //=
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         self._value //= other
         self._num_bits = max(self._num_bits, self._value.bit_length())
@@ -407,7 +446,7 @@ class IntegerWrapper(object):
 
     def __idiv__(self, other: Union[int, "IntegerWrapper"]):  # self /=
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         self._value //= other
         self._num_bits = max(self._num_bits, self._value.bit_length())
@@ -415,7 +454,7 @@ class IntegerWrapper(object):
 
     def __itruediv__(self, other: Union[int, "IntegerWrapper"]):  # self /=
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         self._value //= other
         self._num_bits = max(self._num_bits, self._value.bit_length())
@@ -423,7 +462,7 @@ class IntegerWrapper(object):
 
     def __imod__(self, other: Union[int, "IntegerWrapper"]):  # self %=
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         self._value %= other
         self._num_bits = max(self._num_bits, self._value.bit_length())
@@ -431,7 +470,7 @@ class IntegerWrapper(object):
 
     def __ilshift__(self, other: Union[int, "IntegerWrapper"]):  # self <<=
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         self._value <<= other
         self._num_bits += other
@@ -439,7 +478,7 @@ class IntegerWrapper(object):
 
     def __irshift__(self, other: Union[int, "IntegerWrapper"]):  # self >>=
         if isinstance(other, IntegerWrapper):
-            other = int(other)
+            other = other._value
 
         self._value >>= other
         self._num_bits -= other
@@ -447,8 +486,8 @@ class IntegerWrapper(object):
 
     def __iand__(self, other: Union[int, "IntegerWrapper"]):  # self &=
         if isinstance(other, IntegerWrapper):
-            other_num_bits = other.num_bits
-            other = int(other)
+            other_num_bits = other._num_bits
+            other = other._value
         else:
             other_num_bits = other.bit_length()
 
@@ -459,8 +498,8 @@ class IntegerWrapper(object):
     def __ior__(self, other: Union[int, "IntegerWrapper"]):  # self |=
 
         if isinstance(other, IntegerWrapper):
-            other_num_bits = other.num_bits
-            other = int(other)
+            other_num_bits = other._num_bits
+            other = other._value
         else:
             other_num_bits = other.bit_length()
 
@@ -470,8 +509,8 @@ class IntegerWrapper(object):
 
     def __ixor__(self, other: Union[int, "IntegerWrapper"]):  # self ^=
         if isinstance(other, IntegerWrapper):
-            other_num_bits = other.num_bits
-            other = int(other)
+            other_num_bits = other._num_bits
+            other = other._value
         else:
             other_num_bits = other.bit_length()
 
@@ -489,7 +528,7 @@ class IntegerWrapper(object):
         return hash(self._value)
 
     def __len__(self):  # number of bits
-        return self.num_bits
+        return self._num_bits
 
     def __hex__(self):
         return hex(self._value)
@@ -505,8 +544,9 @@ class IntegerWrapper(object):
             if start_bit is None:
                 start_bit = 0
 
-            for i in range(start_bit, start_bit + num_bits + 1):
-                self._value |= ((value >> (i - start_bit)) & 1) << i
+            # 1 bit more then num_bits gets set
+            if num_bits >= 0:
+                self._value |= (value & _mask(num_bits + 1)) << start_bit
 
             self._num_bits = max(self._num_bits, start_bit + num_bits)
 
@@ -515,59 +555,55 @@ class IntegerWrapper(object):
             if isinstance(item, IntegerWrapper):
                 item = int(item)
 
-            return list(self)[item]
+            if not isinstance(item, int) or self._num_bits < 0:
+                # the same error list(self) raises
+                return list(self)[item]
+
+            if item < 0:
+                item += self._num_bits
+
+            if not 0 <= item < self._num_bits:
+                raise IndexError('list index out of range')
+
+            return self._value >> item & 1
 
         if (
                 item.stop is not None is not item.step and
                 item.step != 0 <= item.stop
         ):
-            val = IntegerWrapper(0)
-            for i in range(item.step, item.step + item.stop + 1):
-                val |= ((self >> i) & 0x1) << (i - item.step)
-
             val = IntegerWrapper(
-                val,
+                self._get_bits() >> item.step & _mask(item.stop),
                 item.stop,
                 self._timings,
                 self.encoding
             )
 
         elif item.stop is not None and item.stop > 0:
-            val = IntegerWrapper(0)
-            for i in range(item.stop):
-                val |= ((self >> i) & 0x1) << i
-
             val = IntegerWrapper(
-                val,
+                self._get_bits() & _mask(item.stop),
                 item.stop,
                 self._timings,
                 self.encoding
             )
 
         elif item.stop is not None and item.stop < 0:
-            val = IntegerWrapper(0)
+            value = self._get_bits()
             if item.step is not None and item.step > 0:
-                for i in range(item.step, item.step - item.stop + 1):
-                    val |= ((self >> i) & 0x1) << (i - item.step)
-            else:
-                for i in range(-item.stop):
-                    val |= ((self >> i) & 0x1) << i
+                value >>= item.step
 
-            val = reversed(IntegerWrapper(
-                val,
+            val = IntegerWrapper(
+                _reverse(value, -item.stop),
                 -item.stop,
                 self._timings,
                 self.encoding
-            ))
+            )
 
         elif item.stop is None and item.step is not None:
-            val = IntegerWrapper(0)
-            for i in range(item.step, len(self), 1):
-                val |= ((self >> i) & 0x1) << i
-
+            # the bits stay where they are
+            num_bits = len(self) - item.step
             val = IntegerWrapper(
-                val,
-                len(self) - item.step,
+                self._get_bits() >> item.step << item.step & _mask(num_bits),
+                num_bits,
                 self._timings,
                 self.encoding
             )
@@ -586,24 +622,29 @@ class IntegerWrapper(object):
         return val
 
     def __iter__(self):  # iterate over bits
+        value = self._value
         for i in range(self._num_bits):
-            yield int((self >> i) & 1)
+            yield value >> i & 1
 
     def __reversed__(self):  # reverse bit order
         num_bits = self._num_bits
 
-        val = 0
-
-        for i in range(num_bits):
-            val |= (int(self >> i) & 1) << (~i + num_bits)
-
         return IntegerWrapper(
-            val,
+            _reverse(self._get_bits(), num_bits),
             num_bits,
             self._timings,
             self.encoding
         )
 
+    def _get_bits(self):
+        # the bits the bit operations work on. A bit past num_bits is 0 unless
+        # the value is negative, then it is the sign.
+        value = self._value
+        if value >= 0:
+            value &= _mask(self._num_bits)
+
+        return value
+
     # isinstance(self, other)
     def __instancecheck__(self, instance: Union[int, "IntegerWrapper"]):
         if instance.__class__ in (int, IntegerWrapper):
@@ -623,13 +664,8 @@ class IntegerWrapper(object):
         elif isinstance(num_bits, IntegerWrapper):
             num_bits = int(num_bits)
 
-        val = 0
-
-        for i in range(num_bits):
-            val |= (1 - (int(self >> i) & 1)) << i
-
         return IntegerWrapper(
-            val,
+            ~self._get_bits() & _mask(num_bits),
             num_bits,
             self._timings,
             self.encoding
@@ -641,13 +677,8 @@ class IntegerWrapper(object):
         elif isinstance(num_bits, IntegerWrapper):
             num_bits = int(num_bits)
 
-        val = 0
-
-        for i in range(num_bits):
-            val |= (int(self >> i) & 1) << (~i + num_bits)
-
         return IntegerWrapper(
-            val,
+            _reverse(self._get_bits(), num_bits),
             num_bits,
             self._timings,
             self.encoding
@@ -655,13 +686,8 @@ class IntegerWrapper(object):
 
     @property
     def num_one_bits(self):
-        count = 0
-
-        for i in range(self._num_bits):
-            count += self._value >> i & 1
-
         count = IntegerWrapper(
-            count,
+            _count_one_bits(self._value & _mask(self._num_bits)),
             timings=self._timings,
             encoding=self.encoding
         )
@@ -731,11 +757,8 @@ class IntegerWrapper(object):
 
     @property
     def bits(self):
-        bits = []
-        for bit in self:
-            bits.insert(0, bit)
-
-        return bits
+        value = self._value
+        return [value >> i & 1 for i in range(self._num_bits - 1, -1, -1)]
 
     @property
     def num_bits(self):
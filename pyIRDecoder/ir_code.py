@@ -31,12 +31,25 @@ from . import pronto
 from . import utils
 from . import xml_handler
 from . import integer_wrapper
+from .integer_wrapper import _REVERSED_BYTES, _reverse_bits
 
 
 _timer_thread_worker = thread_worker.TimerThreadWorker()
 _process_thread_worker = thread_worker.ProcessThreadWorker()
 
 
+def _field_bits(value, num_bits):
+    # the value of a parameter is put into the code the way bin() writes it
+    # out, cut down to the first `num_bits` bits. A value that is too big for
+    # the field loses its lowest bits, not its highest.
+    length = value.bit_length()
+
+    if length > num_bits:
+        return value >> (length - num_bits)
+
+    return value
+
+
 class Timer(object):
     def __init__(self, func, duration):
         self.func = func
@@ -92,6 +105,27 @@ class Timer(object):
 
 # noinspection PyProtectedMember
 class IRCode(object):
+    # A code gets built for every frame that gets decoded and most of them get
+    # compared to the last code and thrown away. The repeat timer and the list
+    # of callbacks are only made the first time they are needed and the slots
+    # keep the codes small.
+    __slots__ = (
+        '_decoder',
+        '_original_rlc',
+        '_normalized_rlc',
+        '_code',
+        '_name',
+        '_xml',
+        '_int',
+        '_hex',
+        '_key',
+        '_str',
+        '_callbacks',
+        '_repeat_count',
+        '_repeat_timeout',
+        '_repeat_timer',
+        '_data'
+    )
 
     def __init__(
         self,
@@ -113,8 +147,14 @@ class IRCode(object):
         self._xml = None
         self._int = None
         self._hex = None
-        self._callbacks = []
+        self._key = None
+        self._str = None
+        # the decoder gets reset when the code is released, see
+        # _get_callbacks
+        self._callbacks = None
         self._repeat_count = repeat_count
+        self._repeat_timeout = None
+        self._repeat_timer = None
 
         self._data = {}
 
@@ -133,17 +173,6 @@ class IRCode(object):
                         )
             self._data[key] = value
 
-        if decoder.repeat_timeout == 0:
-            repeat_timeout = sum(
-                abs(item) for rlc in normalized_rlc for item in rlc
-            )
-        else:
-            repeat_timeout = decoder.repeat_timeout
-
-        self._repeat_timer = Timer(self.__repeat_reset, repeat_timeout)
-        self._repeat_duration = repeat_timeout
-        self.bind_released_callback(decoder.reset)
-
     def __iter__(self):
         for item in self.normalized_rlc:
             yield item[:]
@@ -174,24 +203,51 @@ class IRCode(object):
         self._repeat_count = value
 
     def __repeat_reset(self):
-        for callback in self._callbacks[:]:
+        for callback in self._get_callbacks()[:]:
             callback(self)
 
+    def _get_callbacks(self):
+        if self._callbacks is None:
+            self._callbacks = [self._decoder.reset]
+
+        return self._callbacks
+
+    def _get_repeat_timeout(self):
+        # worked out from the frames the code was built with, adding codes
+        # together after that does not change it
+        if self._repeat_timeout is None:
+            if self._decoder.repeat_timeout == 0:
+                self._repeat_timeout = sum(
+                    abs(item) for rlc in self._normalized_rlc for item in rlc
+                )
+            else:
+                self._repeat_timeout = self._decoder.repeat_timeout
+
+        return self._repeat_timeout
+
     def bind_released_callback(self, callback):
-        if callback not in self._callbacks:
-            self._callbacks.append(callback)
+        callbacks = self._get_callbacks()
+
+        if callback not in callbacks:
+            callbacks.append(callback)
 
     def unbind_released_callback(self, callback):
-        if callback in self._callbacks:
-            self._callbacks.remove(callback)
+        callbacks = self._get_callbacks()
+
+        if callback in callbacks:
+            callbacks.remove(callback)
 
     def save(self):
         if self not in self.decoder._saved_codes:
             self.decoder._saved_codes.append(self)
+            self.decoder._saved_code_index.add(self)
 
     def delete(self):
-        if self in self.decoder._saved_codes:
-            self.decoder._saved_codes.remove(self)
+        for code in self.decoder._saved_codes:
+            if code == self:
+                self.decoder._saved_codes.remove(code)
+                self.decoder._saved_code_index.remove(code)
+                break
 
     def __set_name(self):
         config = self.decoder.config
@@ -225,6 +281,7 @@ class IRCode(object):
                 return
             else:
                 self._name = response.content
+                self._key = None
 
     @staticmethod
     def load_from_xml(xml, decoder):
@@ -291,6 +348,12 @@ class IRCode(object):
 
     @property
     def repeat_timer(self):
+        if self._repeat_timer is None:
+            self._repeat_timer = Timer(
+                self.__repeat_reset,
+                self._get_repeat_timeout()
+            )
+
         return self._repeat_timer
 
     @property
@@ -446,32 +509,45 @@ class IRCode(object):
         if not isinstance(other, IRCode):
             raise TypeError
 
+        other._get_repeat_timeout()
         other._normalized_rlc += self._normalized_rlc
         other._original_rlc += self.original_rlc
-        other._data.update(self._data)
+        other._set_params(**self._data)
         return other
 
     def __add__(self, other):
         if not isinstance(other, IRCode):
             raise TypeError
 
+        self._get_repeat_timeout()
         self._normalized_rlc += other.normalized_rlc
         self._original_rlc += other.original_rlc
-        self._data.update(other._data)
+        self._set_params(**other._data)
         return self
 
     def __radd__(self, other):
         if not isinstance(other, IRCode):
             raise TypeError
 
+        self._get_repeat_timeout()
         self._normalized_rlc += other.normalized_rlc
         self._original_rlc += other.original_rlc
-        self._data.update(other._data)
+        self._set_params(**other._data)
         return self
 
+    def _set_params(self, **params):
+        # decoders that work out a parameter after the code has been built
+        # set it through here so the cached values get worked out again
+        self._data.update(params)
+        self._int = None
+        self._hex = None
+        self._key = None
+        self._str = None
+
     def __getattr__(self, item):
-        if item in self.__dict__:
-            return self.__dict__[item]
+        if item in IRCode.__slots__:
+            # a slot that has not been set yet
+            raise AttributeError(item)
 
         if item.upper() in self._data:
             return self._data[item.upper()]
@@ -485,23 +561,34 @@ class IRCode(object):
 
     def __int__(self):
         if self._int is None:
-            bits = ''
+            data = self._data
 
-            if 'CODE' in self._data:
-                if 'M' in self._data:
-                    bits += bin(self.mode)[2:].zfill(3)[:3]
+            if 'CODE' in data:
+                code = int(data['CODE'])
+
+                if 'M' in data:
+                    value = _field_bits(int(data['M']), 3)
+                else:
+                    value = 0
 
-                bits += bin(self.code)[2:]
+                # the code keeps all of its bits, 0 is written as a single bit
+                value = value << max(code.bit_length(), 1) | code
             else:
+                value = 0
+                lsb = self._decoder.encoding != 'msb'
+
                 for param, num_bits in self._decoder._code_order:
-                    bts = bin(int(self._data[param]))[2:].zfill(num_bits)[:num_bits]
-                    if self._decoder.encoding == 'msb':
-                        bits += bts
-                    else:
-                        for i in range(num_bits - 1, -1, -1):
-                            bits += bts[i]
-
-            self._int = int(bits, 2)
+                    bits = _field_bits(int(data[param]), num_bits)
+
+                    if lsb and num_bits:
+                        if num_bits <= 8:
+                            bits = _REVERSED_BYTES[bits] >> (8 - num_bits)
+                        else:
+                            bits = _reverse_bits(bits, num_bits)
+
+                    value = value << num_bits | bits
+
+            self._int = value
         return self._int
 
     @property
@@ -511,11 +598,12 @@ class IRCode(object):
     @name.setter
     def name(self, value):
         self._name = value
+        self._key = None
 
     @property
     def hexadecimal(self):
         if self._hex is None:
-            res = hex(int(self))[2:].upper().rstrip('L')
+            res = '%X' % (int(self),)
             self._hex = '0x' + res.zfill(len(res) + (len(res) % 2))
         return self._hex
 
@@ -551,18 +639,49 @@ class IRCode(object):
             return True
 
         if isinstance(other, IRCode):
-            if other.decoder.__class__ != self.decoder.__class__:
-                return False
-
-            return str(other) == str(self)
+            return other.key == self.key
 
         return False
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
+    def __hash__(self):
+        return hash(self.key)
+
+    @property
+    def key(self):
+        """
+        What a code is compared and hashed with, the decoder class and either
+        the name of the code or the values of the parameters that make up
+        the code. Two codes that have the same key have the same `str`.
+
+        The key changes when the code gets a name, a code that is in a dict or
+        a set should not be renamed.
+        """
+        if self._key is None:
+            if self._name is not None:
+                values = self._name
+            elif 'CODE' in self._data:
+                if 'M' in self._data:
+                    values = (int(self._data['M']), int(self._data['CODE']))
+                else:
+                    values = (int(self._data['CODE']),)
+            else:
+                data = self._data
+                values = tuple(
+                    int(data[param]) for param, _ in self._decoder._code_order
+                )
+
+            self._key = (self._decoder.__class__, values)
+
+        return self._key
+
     def __str__(self):
         if self._name is None:
+            if self._str is not None:
+                return self._str
+
             res = []
 
             if 'CODE' in self._data:
@@ -582,6 +701,7 @@ class IRCode(object):
 
                     res += [(('%X' % (value,)).zfill(fill)).rstrip('L')]
 
-            return self.decoder.name + '.' + ':'.join(res)
+            self._str = self.decoder.name + '.' + ':'.join(res)
+            return self._str
 
         return self._name
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+# Classifies all of the pulses in the stream of a frame at once using NumPy.
+#
+# The pulses are compared against the windows of every timing the stream is
+# able to be made of using broadcasting. That gives the index of the first
+# timing each pulse matches, the same one the pure Python parser picks
+# because it tries the timings in the same order, and a mask of the pulses
+# that do not match anything. The timing indexes are turned into burst pairs
+# and the burst pairs into bits using lookup tables.
+#
+# Only streams the pure Python parser handles with a simple loop get
+# classified here: pulse distance and manchester streams that have no middle
+# timings. If a frame has a pulse that does not match or a burst pair that
+# is not known `None` gets returned and the frame is left to the pure Python
+# parser, which then raises the same error it always has. The results are
+# exactly the same as the pure Python parser's.
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .pulse_alphabet import can_classify  # NOQA
+
+
+def is_available():
+    return numpy is not None
+
+
+class _StreamTables(object):
+
+    def __init__(self, spec, windows):
+        bursts = spec.bursts
+        symbols = spec.symbols
+
+        if spec.stream_encoding == 'manchester':
+            mark, space = bursts[0]
+            # a pulse is able to be 1 or 2 half bits
+            timings = [mark, space, mark * 2, space * 2]
+            self.half_bits = numpy.array([mark, space, mark, space])
+            self.counts = numpy.array([1, 1, 2, 2])
+            values = [mark, space]
+        else:
+            timings = [timing for pair in bursts for timing in pair]
+            self.half_bits = numpy.array(timings)
+            self.counts = None
+            values = timings
+
+        windows = [windows[timing] for timing in timings]
+        self.low = numpy.array([window[0] for window in windows])
+        self.high = numpy.array([window[1] for window in windows])
+
+        # burst number for each pair of half bits, -1 if the pair is not
+        # a burst pair.
+        self.burst_numbers = numpy.full((len(values), len(values)), -1)
+        numbers = dict(
+            (tuple(pair), i) for i, pair in reversed(list(enumerate(bursts)))
+        )
+
+        for i, first in enumerate(values):
+            for j, second in enumerate(values):
+                if (first, second) in symbols:
+                    self.burst_numbers[i, j] = numbers[(first, second)]
+
+        self.bits = numpy.array(
+            [symbols.get(tuple(pair), []) for pair in bursts],
+            dtype=numpy.uint8
+        )
+
+
+def _get_tables(spec, windows):
+    # noinspection PyProtectedMember
+    tables = spec._numpy_tables
+    try:
+        return tables[windows.tolerance]
+    except KeyError:
+        pass
+
+    table = _StreamTables(spec, windows)
+    tables[windows.tolerance] = table
+    return table
+
+
+def classify(spec, windows, code, cleaned_code):
+    """
+    Turns the stream of a frame into burst pairs and bits.
+
+    :param spec: :class:`code_wrapper.FrameSpec`
+    :param windows: :class:`timing_windows.TimingWindows`
+    :param code: the pulses between the lead in and the lead out.
+    :param cleaned_code: gets the normalized half bits added to it.
+
+    :return: `(pairs, value, num_bits)` or `None` if the stream has to be
+        parsed by the pure Python parser. The first bit of the stream is the
+        most significant bit of `value`.
+    """
+    if not code:
+        return None
+
+    tables = _get_tables(spec, windows)
+
+    pulses = numpy.asarray(code, dtype=numpy.float64)[:, None]
+    matches = (tables.low <= pulses) & (pulses <= tables.high)
+
+    if not matches.any(axis=1).all():
+        return None
+
+    indexes = matches.argmax(axis=1)
+
+    if tables.counts is None:
+        half_bits = tables.half_bits[indexes]
+        half_bit_indexes = indexes
+    else:
+        counts = tables.counts[indexes]
+        half_bits = numpy.repeat(tables.half_bits[indexes], counts)
+        half_bit_indexes = numpy.repeat(indexes % 2, counts)
+
+    half_bits = half_bits.tolist()
+
+    last_pair = []
+    if len(half_bits) % 2:
+        # the last space of the stream is allowed to be missing. The space
+        # of the first burst pair with the same mark gets added.
+        mark = half_bits[-1]
+        for burst_mark, space in spec.bursts:
+            if burst_mark == mark:
+                last_pair = [mark, space]
+                break
+        else:
+            return None
+
+        if tuple(last_pair) not in spec.symbols:
+            return None
+
+        half_bit_indexes = half_bit_indexes[:-1]
+
+    half_bit_indexes = half_bit_indexes.reshape(-1, 2)
+    burst_numbers = tables.burst_numbers[
+        half_bit_indexes[:, 0],
+        half_bit_indexes[:, 1]
+    ]
+
+    if (burst_numbers < 0).any():
+        return None
+
+    bit_array = tables.bits[burst_numbers].ravel()
+
+    if last_pair:
+        bit_array = numpy.concatenate((
+            bit_array,
+            numpy.array(spec.symbols[tuple(last_pair)], dtype=numpy.uint8)
+        ))
+
+    cleaned_code += half_bits
+
+    pairs = [
+        half_bits[i:i + 2] for i in range(0, len(half_bits) - 1, 2)
+    ]
+
+    if last_pair:
+        pairs.append(last_pair)
+        cleaned_code.append(last_pair[1])
+
+    return pairs, pack_bits(bit_array), len(bit_array)
+
+
+def pack_bits(bits):
+    """
+    Packs an array of bits into an int, the first bit is the most
+    significant bit.
+    """
+    if not len(bits):
+        return 0
+
+    data = numpy.packbits(bits).tobytes()
+    return int.from_bytes(data, 'big') >> (-len(bits) % 8)
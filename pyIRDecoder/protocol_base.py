@@ -26,9 +26,8 @@
 # ****************************************************************************
 
 from __future__ import print_function
-import math
 import six
-from typing import Sequence, Optional
+from typing import Sequence, Optional, Union
 
 from . import code_wrapper
 from . import xml_handler
@@ -44,8 +43,12 @@ from . import (
 )
 
 from .config import Config
+from .field_checks import FieldChecks
+from .frame_bounds import FrameBounds, UNBOUNDED, get_frame_bounds
 from .integer_wrapper import IntegerWrapper
 from .ir_code import IRCode
+from .saved_code_index import SavedCodeIndex
+from .timing_windows import TimingWindows, get_timings, get_window
 
 
 class ProtocolBaseMeta(type):
@@ -84,17 +87,46 @@ class IrProtocolBase(object):
     _repeat_lead_out = []
     _middle_timings = []
     _repeat_bursts = []
-    _stored_codes = []
 
     _has_repeat_lead_out = False
 
     _code_order = []
     _parameters = []
     encode_parameters = []
+
+    # [name, value] of the fields in _parameters that always hold the same
+    # value and [name, other] of the fields that hold the inverted bits of
+    # another field. A frame that does not match them gets turned away with
+    # a "Checksum failed" DecodeError right after the stream is parsed.
+    _constant_fields = []
+    _inverted_fields = []
     repeat_timeout = 0
 
     _enabled = True
 
+    # set to False by decoders that parse the lead in on their own. The
+    # dispatcher is then not able to tell what the first pulse of a frame
+    # is going to be so the decoder gets handed every frame.
+    _index_lead_in = True
+
+    # set to False by decoders where the code that gets returned depends on
+    # frames that were decoded before. Those decoders have to see every
+    # frame so their results never get put into the decode cache.
+    _cache_decode = True
+
+    # set to False by decoders that swap out their timing spec while decoding
+    # a frame. The frame bounds are worked out from the spec the decoder is
+    # created with, they would turn away frames that match one of the other
+    # specs.
+    _check_frame_bounds = True
+
+    # set to False by decoders that parse frames on their own, change their
+    # spec while decoding or change a frame before it gets handed to
+    # IrProtocolBase.decode. quick_reject only knows about the spec the
+    # decoder has at the time so it is not able to tell which frames those
+    # decoders turn away.
+    _use_quick_reject = True
+
     def __init__(self, parent=None, xml=None):
         import threading
         self.__last_code = None
@@ -102,6 +134,15 @@ class IrProtocolBase(object):
         self._tolerance = 20
         self._frequency_tolerance = 2
         self._saved_codes = []
+        self._stored_codes = []
+        self._saved_code_index = SavedCodeIndex(self)
+        self._frame_bounds = None
+        self._timing_windows = {}
+        self._frame_spec = None
+        self._repeat_frame_spec = None
+        self._field_checks = None
+        self._frame_match = None
+        self._reject_counts = dict.fromkeys(self._reject_stages, 0)
         self._sequence = []
         self._parent = parent
 
@@ -139,7 +180,7 @@ class IrProtocolBase(object):
             self._tolerance = xml.tolerance
             self._frequency_tolerance = xml.frequency_tolerance
 
-            for code in xml.Codes:
+            for code in xml:
                 code = IRCode.load_from_xml(code, self)
                 code.save()
 
@@ -168,6 +209,9 @@ class IrProtocolBase(object):
         for code in self._saved_codes:
             yield code
 
+    def get_saved_code(self, data: list) -> Optional[IRCode]:
+        return self._saved_code_index.find(data)
+
     def frequency_match(self, frequency: int) -> bool:
         return self._match(
             frequency,
@@ -187,6 +231,10 @@ class IrProtocolBase(object):
         self._xml.tolerance = self._tolerance
         self._xml.frequency_tolerance = self._frequency_tolerance
 
+        hit_count = self.hit_count
+        if hit_count or 'hit_count' in self._xml:
+            self._xml.hit_count = hit_count
+
         for code_xml in self._xml:
             self._xml.remove(code_xml)
 
@@ -270,6 +318,7 @@ class IrProtocolBase(object):
     @enabled.setter
     def enabled(self, value: bool):
         self._enabled = value
+        self._settings_changed()
 
     @property
     def tolerance(self) -> float:
@@ -278,6 +327,252 @@ class IrProtocolBase(object):
     @tolerance.setter
     def tolerance(self, value: float):
         self._tolerance = value
+        self._frame_bounds = None
+        self._timing_windows = {}
+        self._settings_changed()
+
+    # attribute names the timings of a spec are stored under. Decoders that
+    # have more then one spec add a number to the end of the name
+    # (_lead_out1, _lead_out2...) so those get picked up as well.
+    _timing_attributes = (
+        '_lead_in',
+        '_lead_out',
+        '_middle_timings',
+        '_bursts',
+        '_repeat_lead_in',
+        '_repeat_lead_out',
+        '_repeat_bursts'
+    )
+
+    def _get_timing_windows(self) -> TimingWindows:
+        tolerance = self._tolerance
+
+        try:
+            return self._timing_windows[tolerance]
+        except KeyError:
+            pass
+
+        timings = set()
+        for name in dir(self):
+            if name.rstrip('0123456789') in self._timing_attributes:
+                timings.update(get_timings(getattr(self, name)))
+
+        # manchester encoded streams merge 2 half bits that are the same
+        bursts = get_timings(self._bursts)
+        timings.update(timing * 2 for timing in bursts)
+
+        windows = TimingWindows(tolerance, timings)
+        self._timing_windows[tolerance] = windows
+        return windows
+
+    def _get_frame_spec(self) -> code_wrapper.FrameSpec:
+        spec = self._frame_spec
+        timings = (
+            self.encoding,
+            self._lead_in,
+            self._lead_out,
+            self._middle_timings,
+            self._bursts
+        )
+
+        # decoders are able to change their spec between frames
+        if spec is None or not spec.matches(*timings):
+            spec = code_wrapper.FrameSpec(*timings)
+            self._frame_spec = spec
+
+        return spec
+
+    def _get_field_checks(self) -> Optional[FieldChecks]:
+        if not self._constant_fields and not self._inverted_fields:
+            return None
+
+        checks = self._field_checks
+        encoding = self.encoding
+        bit_count = self.bit_count
+        parameters = self._parameters
+
+        # decoders are able to change their spec between frames
+        if checks is None or not checks.matches(
+            encoding,
+            bit_count,
+            parameters
+        ):
+            checks = FieldChecks(
+                encoding,
+                bit_count,
+                parameters,
+                self._constant_fields,
+                self._inverted_fields
+            )
+            self._field_checks = checks
+
+        return checks
+
+    def _get_repeat_frame_spec(self) -> code_wrapper.FrameSpec:
+        spec = self._repeat_frame_spec
+        timings = (
+            self.encoding,
+            self._repeat_lead_in,
+            self._repeat_lead_out,
+            [],
+            self._repeat_bursts
+        )
+
+        if spec is None or not spec.matches(*timings):
+            spec = code_wrapper.FrameSpec(*timings)
+            self._repeat_frame_spec = spec
+
+        return spec
+
+    def _get_frame_bounds(self):
+        tolerance = self._tolerance
+        bounds = self._frame_bounds
+
+        if bounds is None or bounds[0] != tolerance:
+            if self._check_frame_bounds:
+                frame_bounds = get_frame_bounds(
+                    self._lead_in,
+                    self._lead_out,
+                    self._middle_timings,
+                    self._bursts,
+                    self.bit_count,
+                    tolerance
+                )
+
+                if self._repeat_lead_in or self._repeat_lead_out:
+                    repeat_frame_bounds = get_frame_bounds(
+                        self._repeat_lead_in,
+                        self._repeat_lead_out,
+                        [],
+                        self._repeat_bursts,
+                        None if self._repeat_bursts else 0,
+                        tolerance
+                    )
+                else:
+                    repeat_frame_bounds = UNBOUNDED
+            else:
+                frame_bounds = UNBOUNDED
+                repeat_frame_bounds = UNBOUNDED
+
+            bounds = (tolerance, frame_bounds, repeat_frame_bounds)
+            self._frame_bounds = bounds
+
+        return bounds
+
+    # smallest and largest number of pulses and total duration a frame is
+    # able to have. Frames outside of these get rejected before they are
+    # parsed.
+    @property
+    def frame_bounds(self) -> FrameBounds:
+        return self._get_frame_bounds()[1]
+
+    @property
+    def repeat_frame_bounds(self) -> FrameBounds:
+        return self._get_frame_bounds()[2]
+
+    # the stages a frame is able to get turned away at. The first 3 make up
+    # quick_reject, "parse" counts the frames that got past those and then
+    # failed while the stream was parsed and "fields" the frames that did not
+    # match the constant and inverted fields.
+    _reject_stages = (
+        'frame_bounds',
+        'lead_in',
+        'lead_out',
+        'parse',
+        'fields'
+    )
+
+    # returns the spec and timing windows that got used along with what
+    # FrameSpec.match_frame returned so the CodeWrapper does not have to
+    # match the lead in and lead out a second time. A frame that gets turned
+    # away returns a Rejection, the error only gets built if it is needed.
+    # The frame bounds do not get checked if `bounds` is None.
+    def _quick_reject(self, data, duration, bounds):
+        if bounds is None:
+            rejection = None
+        else:
+            rejection = self._get_bounds_rejection(data, duration, bounds)
+
+        if rejection is None:
+            spec = self._get_frame_spec()
+            windows = self._get_timing_windows()
+
+            # these are the same checks the CodeWrapper starts with so a
+            # frame gets turned away with the same error it would have been
+            # before
+            cache = self._get_demodulation_cache()
+
+            if cache is None:
+                rejection = spec.match_frame(data, windows)
+            else:
+                rejection = cache.match_frame(spec, windows, data)
+
+            if not isinstance(rejection, code_wrapper.Rejection):
+                return spec, windows, rejection
+
+        self._reject_counts[rejection.stage] += 1
+        return rejection
+
+    # the dispatcher shares what the decoders that have the same spec get out
+    # of a frame. Decoders that are not created by a dispatcher do not have
+    # one to share with.
+    def _get_demodulation_cache(self):
+        if not self._use_quick_reject:
+            return None
+
+        return getattr(self._parent, 'demodulation_cache', None)
+
+    # checks the frame bounds, the lead in and the lead out of a frame the
+    # same way decode starts out. Returns a Rejection if decode is going to
+    # turn the frame away at the quick_reject stage, what _quick_reject
+    # returned if it is not and None if decode has to be called to find out.
+    # Decoders that match repeat frames are not able to tell before decode is
+    # called once they have a last code.
+    def _match_frame(self, data: list):
+        if not self._use_quick_reject or (
+            self._last_code is not None and
+            (self._repeat_lead_in or self._repeat_lead_out)
+        ):
+            return None
+
+        return self._quick_reject(
+            data,
+            sum(map(abs, data)),
+            self._get_frame_bounds()[1]
+        )
+
+    def _reject(self, data: list) -> Optional[code_wrapper.Rejection]:
+        rejection = self._match_frame(data)
+
+        if isinstance(rejection, code_wrapper.Rejection):
+            return rejection
+
+        return None
+
+    # checks the pulse count and duration, the lead in and the lead out of a
+    # frame without parsing the stream. Returns True if the frame is not able
+    # to be decoded by this decoder.
+    def quick_reject(self, frame: list) -> bool:
+        if not self._use_quick_reject:
+            return False
+
+        rejection = self._quick_reject(
+            frame,
+            sum(map(abs, frame)),
+            self.frame_bounds
+        )
+
+        return isinstance(rejection, code_wrapper.Rejection)
+
+    # number of frames that got turned away at each stage of decode. The
+    # counts are not locked so they are only a close estimate when the
+    # decoder is used from more then one thread.
+    @property
+    def reject_counts(self) -> dict:
+        return dict(self._reject_counts)
+
+    def reset_reject_counts(self) -> None:
+        self._reject_counts = dict.fromkeys(self._reject_stages, 0)
 
     @property
     def frequency_tolerance(self) -> float:
@@ -286,13 +581,29 @@ class IrProtocolBase(object):
     @frequency_tolerance.setter
     def frequency_tolerance(self, value: float):
         self._frequency_tolerance = value
+        self._settings_changed()
+
+    @property
+    def hit_count(self) -> float:
+        if self._parent is None:
+            return 0.0
+
+        # noinspection PyProtectedMember
+        return self._parent._ranking.get_hit_count(self.name)
+
+    def _settings_changed(self) -> None:
+        if self._parent is not None:
+            # noinspection PyProtectedMember
+            self._parent._decoder_settings_changed(self)
 
     @property
     def name(self) -> str:
         return self.__class__.__name__
 
+    # a code that is released after a new code that is the same has been
+    # decoded must not reset the new code, the release runs on a worker thread
     def reset(self, code: IRCode) -> None:
-        if self._last_code is not None and self._last_code == code:
+        if self._last_code is not None and self._last_code is code:
             self._last_code = None
 
             del self._stored_codes[:]
@@ -363,21 +674,121 @@ class IrProtocolBase(object):
 
         return packet[:]
 
+    # returns a Rejection for a frame that is outside of `bounds`, None if
+    # the frame is inside of them
+    @staticmethod
+    def _get_bounds_rejection(data, duration, bounds):
+        num_pulses = len(data)
+
+        if num_pulses < bounds.min_pulses:
+            return code_wrapper.Rejection(
+                'frame_bounds',
+                NotEnoughBitsError,
+                'expected at least {0} pulses got {1}',
+                bounds.min_pulses,
+                num_pulses
+            )
+
+        if bounds.max_pulses is not None and num_pulses > bounds.max_pulses:
+            return code_wrapper.Rejection(
+                'frame_bounds',
+                TooManyBitsError,
+                'expected at most {0} pulses got {1}',
+                bounds.max_pulses,
+                num_pulses
+            )
+
+        if duration < bounds.min_duration or (
+            bounds.max_duration is not None and
+            duration > bounds.max_duration
+        ):
+            return code_wrapper.Rejection(
+                'frame_bounds',
+                DecodeError,
+                'frame duration {0} outside of {1} - {2}',
+                duration,
+                bounds.min_duration,
+                bounds.max_duration
+            )
+
+        return None
+
+    # the frame bounds are only checked for frames the dispatcher hands out.
+    # A frame that is outside of them is turned away with a different error
+    # than the one the parse raises and callers of decode catch those.
     def decode(self, data: list, frequency: int = 0) -> IRCode:
+        result = self._decode_frame(data, frequency)
+
+        if isinstance(result, code_wrapper.Rejection):
+            raise result.error()
+
+        return result
+
+    # used by the dispatcher, a frame that gets turned away returns a
+    # Rejection instead of raising an error. The dispatcher hands a frame to
+    # a lot of decoders that turn it away, building and raising an error for
+    # each one of them is most of the time it takes to decode a frame.
+    def _try_decode(
+        self,
+        data: list,
+        frequency: int = 0
+    ) -> Union[IRCode, code_wrapper.Rejection]:
+        if self.__class__.decode == IrProtocolBase.decode:
+            return self._decode_frame(data, frequency, True)
+
+        # a decoder that has a decode of its own. What the frame got matched
+        # against gets handed to IrProtocolBase.decode so it does not get
+        # done a second time.
+        result = self._match_frame(data)
+
+        if isinstance(result, code_wrapper.Rejection):
+            return result
+
+        if result is not None:
+            self._frame_match = (data, result)
+
+        try:
+            return self.decode(data, frequency)
+        except DecodeError as err:
+            return code_wrapper.Rejection.from_error('parse', err)
+        finally:
+            self._frame_match = None
+
+    # decode without raising an error for a frame that gets turned away
+    def _decode_frame(
+        self,
+        data: list,
+        frequency: int = 0,
+        check_bounds: bool = False
+    ) -> Union[IRCode, code_wrapper.Rejection]:
+        if check_bounds:
+            _, frame_bounds, repeat_frame_bounds = self._get_frame_bounds()
+        else:
+            frame_bounds = None
+            repeat_frame_bounds = None
+
+        duration = sum(map(abs, data))
+
         with self.__code_lock:
             if self._last_code is not None and (
                 self._repeat_lead_in or
                 self._repeat_lead_out
             ):
                 try:
-                    code = code_wrapper.CodeWrapper(
-                        self.encoding,
-                        self._repeat_lead_in[:],
-                        self._repeat_lead_out[:],
-                        [],
-                        self._repeat_bursts[:],
+                    if repeat_frame_bounds is not None:
+                        rejection = self._get_bounds_rejection(
+                            data,
+                            duration,
+                            repeat_frame_bounds
+                        )
+                        if rejection is not None:
+                            raise rejection.error()
+
+                    code = code_wrapper.CodeWrapper.from_spec(
+                        self._get_repeat_frame_spec(),
                         self.tolerance,
-                        data[:]
+                        data,
+                        self._get_timing_windows()
                     )
 
                     if (
@@ -409,20 +820,74 @@ class IrProtocolBase(object):
                 except IRException:
                     pass
 
-        code = code_wrapper.CodeWrapper(
-            self.encoding,
-            self._lead_in[:],
-            self._lead_out[:],
-            self._middle_timings[:],
-            self._bursts[:],
-            self.tolerance,
-            data[:]
-        )
+        frame_match = self._frame_match
+        self._frame_match = None
+
+        # a decoder is able to change its spec before it calls this
+        if (
+            frame_match is not None and
+            frame_match[0] is data and
+            frame_match[1][0] is self._get_frame_spec()
+        ):
+            result = frame_match[1]
+        else:
+            result = self._quick_reject(data, duration, frame_bounds)
+
+            if isinstance(result, code_wrapper.Rejection):
+                return result
+
+        spec, windows, frame_match = result
+
+        cache = self._get_demodulation_cache()
+
+        try:
+            if cache is None:
+                code = code_wrapper.CodeWrapper.from_spec(
+                    spec,
+                    self._tolerance,
+                    data,
+                    windows,
+                    frame_match
+                )
+            else:
+                code = cache.parse(
+                    spec,
+                    self._tolerance,
+                    data,
+                    windows,
+                    frame_match
+                )
+
+        except DecodeError as err:
+            self._reject_counts['parse'] += 1
+            return code_wrapper.Rejection.from_error('parse', err)
+
+        if code.num_bits != self.bit_count:
+            self._reject_counts['parse'] += 1
+
+            if code.num_bits > self.bit_count:
+                error_type = TooManyBitsError
+            else:
+                error_type = NotEnoughBitsError
+
+            return code_wrapper.Rejection(
+                'parse',
+                error_type,
+                None,
+                self.bit_count,
+                ':',
+                code.stream_pairs
+            )
 
-        if code.num_bits > self.bit_count:
-            raise TooManyBitsError(self.bit_count, ':', code.stream_pairs)
-        elif code.num_bits < self.bit_count:
-            raise NotEnoughBitsError(self.bit_count, ':', code.stream_pairs)
+        field_checks = self._get_field_checks()
+
+        if field_checks is not None and not field_checks.check(code.bit_value):
+            self._reject_counts['fields'] += 1
+            return code_wrapper.Rejection(
+                'fields',
+                DecodeError,
+                'Checksum failed'
+            )
 
         params = dict(frequency=self.frequency)
         for name, start, stop in self._parameters:
@@ -455,26 +920,8 @@ class IrProtocolBase(object):
 
     def _match(self, value, expected_timing_value, tolerance=None):
         if tolerance is None:
-            tolerance = self.tolerance
-
-        if (
-            value < 0 < expected_timing_value or
-            value > 0 > expected_timing_value
-        ):
-            return False
-
-        high = math.floor(
-            expected_timing_value +
-            (expected_timing_value * (tolerance / 100.0))
-        )
-        low = math.floor(
-            expected_timing_value -
-            (expected_timing_value * (tolerance / 100.0))
-        )
-
-        # do a flip flop of the high and low so the same expression can
-        # be used when evaluating a raw timing
-        if expected_timing_value < 0:
-            low, high = high, low
+            low, high = self._get_timing_windows()[expected_timing_value]
+        else:
+            low, high = get_window(expected_timing_value, tolerance)
 
         return low <= value <= high
@@ -192,11 +192,19 @@ from .zaptor56 import Zaptor56 as _Zaptor56  # NOQA
 
 from .. import high_precision_timers
 from .. import thread_worker
+from .. import batch_decode
 from ..config import Config
-
+from ..decoder_ranking import DecoderRanking
+from ..decode_cache import DecodeCache, NegativeCache
+from ..demodulation_cache import DemodulationCache, get_groups
+from ..pulse_alphabet import PulseAlphabet
+from ..decode_stream import DecodeStream, MAX_SIZE as _STREAM_MAX_SIZE
+from ..timing_tree import TimingTree
+
+import asyncio
 import threading
 from collections import deque
-from typing import Optional
+from typing import Optional, Iterable, Iterator
 
 AdNotham: protocol_base.IrProtocolBase
 Aiwa: protocol_base.IrProtocolBase
@@ -378,6 +386,15 @@ config: Config
 enabled_decoders: list
 disabled_decoders: list
 last_used_decoder: protocol_base.IrProtocolBase
+timing_tree: TimingTree
+adaptive_ordering: bool
+decoder_ranking: list
+decode_cache: Optional[DecodeCache]
+negative_cache: Optional[NegativeCache]
+demodulation_cache: Optional[DemodulationCache]
+demodulation_groups: list
+pulse_alphabet: PulseAlphabet
+reject_counts: dict
 
 
 # noinspection PyUnusedLocal
@@ -403,6 +420,29 @@ def decode(data: list, frequency: int = 0) -> Optional[protocol_base.IRCode]:
     pass
 
 
+# noinspection PyUnusedLocal
+async def async_decode(
+    data: list,
+    frequency: int = 0
+) -> Optional[protocol_base.IRCode]:
+    pass
+
+
+# noinspection PyUnusedLocal
+def stream(maxsize: int = _STREAM_MAX_SIZE) -> DecodeStream:
+    pass
+
+
+# noinspection PyUnusedLocal
+def decode_many(
+    frames: Iterable[list],
+    frequency: int = 0,
+    workers: Optional[int] = None,
+    chunk_size: int = batch_decode.CHUNK_SIZE
+) -> Iterator[Optional[batch_decode.DecodeResult]]:
+    pass
+
+
 def __iter__():
     pass
 
@@ -421,6 +461,10 @@ def load_config(config_data):
     pass
 
 
+def reset_reject_counts():
+    pass
+
+
 class DecodeThread(threading.Thread):
 
     def __init__(self, decoder):
@@ -506,32 +550,68 @@ class DecodeThread(threading.Thread):
 
 _process_threadworker = thread_worker.ProcessThreadWorker()
 _timer_threadworker = thread_worker.TimerThreadWorker()
+_workers_lock = threading.Lock()
+_workers_count = 0
 
 
-class FakeModule(object):
-    _instance = None
+# the thread workers are shared by all of the Decoder instances. They get
+# started when the first instance is created and stopped when the last
+# instance is closed.
+def _start_workers():
+    global _workers_count
 
-    def __init__(self, config_data=None):
-        import sys
+    with _workers_lock:
+        _workers_count += 1
 
-        if FakeModule._instance is None:
-            mod = sys.modules[__name__]
-            # noinspection PyTypeChecker
-            sys.modules[__name__] = self
+        if _workers_count == 1:
+            _timer_threadworker.start()
+            _process_threadworker.start()
 
-        else:
-            # noinspection PyProtectedMember
-            mod = FakeModule._instance._original_module
 
-        self.__doc__ = mod.__doc__
-        self.__file__ = mod.__file__
-        self.__loader__ = mod.__loader__
-        self.__name__ = mod.__name__
-        self.__package__ = mod.__package__
-        self.__path__ = mod.__path__
-        self.__spec__ = mod.__spec__
-        self._original_module = mod
-        
+def _stop_workers():
+    global _workers_count
+
+    with _workers_lock:
+        _workers_count -= 1
+
+        if _workers_count == 0:
+            _timer_threadworker.stop()
+            _process_threadworker.stop()
+
+
+_protocols = []
+
+
+def _get_protocols():
+    if not _protocols:
+        import inspect
+
+        _protocols.extend(
+            globals()[key] for key in sorted(list(globals().keys()))
+            if inspect.isclass(globals()[key]) and
+            issubclass(globals()[key], protocol_base.IrProtocolBase)
+        )
+
+    return _protocols
+
+
+def _keeps_state(decoder):
+    # noinspection PyProtectedMember
+    return not decoder._cache_decode or (
+        decoder._last_code is not None and
+        bool(decoder._repeat_lead_in or decoder._repeat_lead_out)
+    )
+
+
+class Decoder(object):
+    """
+    Decodes the frames from a single IR receiver.
+
+    Every instance has its own set of decoders, repeat state, stream buffer
+    and config so several receivers are able to be decoded in parallel.
+    """
+
+    def __init__(self, config_data=None):
         if config_data is None:
             config_data = Config()
 
@@ -546,21 +626,33 @@ class FakeModule(object):
         self._repeat_code_lock = threading.Lock()
         self._decode_thread = None
         self._decode_callback = None
-
-        import inspect
-
-        decoders = [
-            globals()[key] for key in sorted(list(globals().keys()))
-            if inspect.isclass(globals()[key]) and
-            issubclass(globals()[key], protocol_base.IrProtocolBase)
-        ]
-
-        for decoder in decoders:
+        self._timing_tree = TimingTree()
+        self._ranking = DecoderRanking()
+        self._decode_cache = None
+        self._negative_cache = None
+        self._demodulation_cache = DemodulationCache()
+        self._pulse_alphabet = None
+        self._streams = []
+
+        # a config file that was edited by hand can hold "true" or "false"
+        adaptive_ordering = getattr(config_data, 'adaptive_ordering', False)
+        if isinstance(adaptive_ordering, str):
+            adaptive_ordering = adaptive_ordering.lower() == 'true'
+
+        self._adaptive_ordering = bool(adaptive_ordering)
+
+        for decoder in _get_protocols():
             for decoder_xml in self._config:
                 if decoder.__name__ == decoder_xml.name:
                     self._decoders.append(
                         decoder(self, decoder_xml)
                     )
+
+                    if 'hit_count' in decoder_xml:
+                        self._ranking.set_hit_count(
+                            decoder_xml.name,
+                            float(decoder_xml.hit_count)
+                        )
                     break
             else:
                 decoder = decoder(self)
@@ -568,13 +660,22 @@ class FakeModule(object):
                 decoder_xml = decoder.xml
                 self._config.append(decoder_xml)
 
-        if FakeModule._instance is None:
-            FakeModule._instance = self
-        else:
-            FakeModule._instance.__dict__.update(self.__dict__)
+        # Universal decodes anything that is handed to it so it is always
+        # the last decoder that gets tried.
+        self._timing_tree.build(
+            [
+                decoder for decoder in self._decoders
+                if not isinstance(decoder, _Universal)
+            ] + [
+                decoder for decoder in self._decoders
+                if isinstance(decoder, _Universal)
+            ]
+        )
+
+        self._pulse_alphabet = self._build_pulse_alphabet()
 
-        _timer_threadworker.start()
-        _process_threadworker.start()
+        self._workers_started = True
+        _start_workers()
                 
     def __getattr__(self, item):
         if item in self.__dict__:
@@ -598,26 +699,18 @@ class FakeModule(object):
 
         self._timer.reset()
         with self._repeat_code_lock:
-            code = Universal.decode(rlc, frequency)
+            code = self.Universal.decode(rlc, frequency)
             if self._last_code is not None:
                 if self._last_code == code:
                     self._last_code.repeat_timer.start(self._timer)
-                    if self._decode_callback is not None:
-                        _process_threadworker.add(
-                            self._decode_callback,
-                            self._last_code
-                        )
+                    self.__notify(self._last_code)
 
                 self._last_code.repeat_timer.stop()
 
             code.bind_released_callback(self.__reset_last_code)
             self._last_code = code
             self._last_code.repeat_timer.start(self._timer)
-            if self._decode_callback is not None:
-                _process_threadworker.add(
-                    self._decode_callback,
-                    self._last_code
-                )
+            self.__notify(self._last_code)
 
             return True
 
@@ -630,8 +723,9 @@ class FakeModule(object):
         except:  # NOQA
             pass
 
-        _timer_threadworker.stop()
-        _process_threadworker.stop()
+        if self._workers_started:
+            self._workers_started = False
+            _stop_workers()
 
     @property
     def config(self):
@@ -674,46 +768,223 @@ class FakeModule(object):
 
             code.unbind_released_callback(self.__reset_last_code)
 
+    def _decoder_settings_changed(self, _):
+        self._timing_tree.invalidate()
+        self._ranking.invalidate()
+        self._pulse_alphabet = None
+
+        if self._decode_cache is not None:
+            self._decode_cache.clear()
+
+        if self._negative_cache is not None:
+            self._negative_cache.clear()
+
+    @property
+    def timing_tree(self):
+        return self._timing_tree
+
+    @property
+    def adaptive_ordering(self):
+        return self._adaptive_ordering
+
+    @adaptive_ordering.setter
+    def adaptive_ordering(self, value):
+        self._adaptive_ordering = bool(value)
+        self._config.adaptive_ordering = self._adaptive_ordering
+
+    @property
+    def decoder_ranking(self):
+        return self._ranking.ranking
+
+    @property
+    def decode_cache(self):
+        return self._decode_cache
+
+    @decode_cache.setter
+    def decode_cache(self, value):
+        self._decode_cache = value
+
+    @property
+    def negative_cache(self):
+        return self._negative_cache
+
+    @negative_cache.setter
+    def negative_cache(self, value):
+        self._negative_cache = value
+
+    @property
+    def demodulation_cache(self):
+        return self._demodulation_cache
+
+    @demodulation_cache.setter
+    def demodulation_cache(self, value):
+        self._demodulation_cache = value
+
+    @property
+    def demodulation_groups(self):
+        # names of the decoders that share what they get out of a frame
+        return sorted(
+            sorted(decoder.name for decoder in group)
+            for group in get_groups(self).values()
+        )
+
+    def _build_pulse_alphabet(self):
+        windows = set()
+
+        for decoder in self._decoders:
+            if decoder.enabled:
+                # noinspection PyProtectedMember
+                windows.update(decoder._get_timing_windows().values())
+
+        return PulseAlphabet(windows)
+
+    @property
+    def pulse_alphabet(self):
+        # the windows of every enabled decoder cut up into classes, it gets
+        # built again when the settings of a decoder change
+        alphabet = self._pulse_alphabet
+
+        if alphabet is None:
+            alphabet = self._build_pulse_alphabet()
+            self._pulse_alphabet = alphabet
+
+        return alphabet
+
+    def __add_to_cache(self, data, frequency, code):
+        if (
+            self._decode_cache is not None and
+            not isinstance(code.decoder, _Universal)
+        ):
+            self._decode_cache.add(data, frequency, code)
+
+    def __notify(self, code):
+        if self._decode_callback is not None:
+            _process_threadworker.add(self._decode_callback, code)
+
+        for stream in self._streams[:]:
+            # noinspection PyProtectedMember
+            stream._decoded(code)
+
+    def stream(self, maxsize: int = _STREAM_MAX_SIZE) -> DecodeStream:
+        stream = DecodeStream(self, maxsize)
+        self._streams.append(stream)
+        return stream
+
+    def _remove_stream(self, stream):
+        if stream in self._streams:
+            self._streams.remove(stream)
+
+    def __add_to_negative_cache(self, data, frequency):
+        if self._negative_cache is not None:
+            self._negative_cache.add(data, frequency)
+
+    def __decode_cached(self, data, frequency, decoder):
+        code = self._decode_cache.get_code(data, frequency, decoder)
+
+        if code is None:
+            return None
+
+        # update the state of the decoder the same way decoding the frame
+        # would have done
+        # noinspection PyProtectedMember
+        last_code = decoder._last_code
+
+        if last_code is not None and last_code == code:
+            code = last_code
+        else:
+            if last_code is not None:
+                last_code.repeat_timer.stop()
+
+            # noinspection PyProtectedMember
+            decoder._last_code = code
+
+        self.__hit(decoder)
+
+        # the rest mirrors what _decode does when the decoder that is tried
+        # first decodes the frame
+        if self._last_code is None:
+            self._last_code = code
+            result = True
+        elif self._last_code == code:
+            result = True
+        else:
+            self._last_code = code
+            result = code
+
+        self._last_code.repeat_timer.start(self._timer)
+
+        self.__notify(self._last_code)
+
+        return result
+
+    def __hit(self, decoder):
+        if self._adaptive_ordering and not isinstance(decoder, _Universal):
+            self._ranking.hit(decoder)
+
     def _decode(self, data, frequency):
         self._timer.reset()
 
-        if frequency == 0:
-            possible_decoders = list(
-                decoder for decoder in self._decoders if decoder.enabled
-            )
-        else:
+        possible_decoders = self._timing_tree.get_decoders(data)
+
+        if frequency != 0:
             possible_decoders = list(
-                decoder for decoder in self._decoders
-                if decoder.enabled and decoder.frequency_match(frequency)
+                decoder for decoder in possible_decoders
+                if decoder.frequency_match(frequency)
             )
 
+        if self._adaptive_ordering:
+            # Universal decodes anything so it has to stay the last decoder
+            # that gets tried
+            universal = [
+                decoder for decoder in possible_decoders
+                if isinstance(decoder, _Universal)
+            ]
+            possible_decoders = self._ranking.sort([
+                decoder for decoder in possible_decoders
+                if not isinstance(decoder, _Universal)
+            ]) + universal
+
         with self._repeat_code_lock:
+            if self._decode_cache is not None:
+                # a cached code is only used if it was decoded by the decoder
+                # that gets to see the frame first. Any other decoder could
+                # claim the frame before it based on the state it is in.
+                if (
+                    self._last_code is not None and
+                    self._last_code.decoder in possible_decoders
+                ):
+                    decoder = self._last_code.decoder
+                elif self._last_decoder in possible_decoders:
+                    decoder = self._last_decoder
+                else:
+                    decoder = None
+
+                if decoder is not None:
+                    code = self.__decode_cached(data, frequency, decoder)
+                    if code is not None:
+                        return code
+
             if (
                 self._last_code is not None and
                 self._last_code.decoder in possible_decoders
             ):
                 if data == self._last_code:
+                    self.__hit(self._last_code.decoder)
                     self._last_code.repeat_timer.start(self._timer)
-                    if self._decode_callback is not None:
-                        _process_threadworker.add(
-                            self._decode_callback,
-                            self._last_code
-                        )
+                    self.__notify(self._last_code)
 
                     return True
 
                 try:
                     code = self._last_code.decoder.decode(data, frequency)
+                    self.__hit(code.decoder)
+                    self.__add_to_cache(data, frequency, code)
                     if code != self._last_code:
                         self._last_code = code
 
                     self._last_code.repeat_timer.start(self._timer)
 
-                    if self._decode_callback is not None:
-                        _process_threadworker.add(
-                            self._decode_callback,
-                            self._last_code
-                        )
+                    self.__notify(self._last_code)
 
                     return code
 
@@ -732,16 +1003,14 @@ class FakeModule(object):
             ):
                 try:
                     code = self._last_decoder.decode(data, frequency)
+                    self.__hit(self._last_decoder)
+                    self.__add_to_cache(data, frequency, code)
                     if code != self._last_code:
                         self._last_code = code
 
                     self._last_code.repeat_timer.start(self._timer)
 
-                    if self._decode_callback is not None:
-                        _process_threadworker.add(
-                            self._decode_callback,
-                            self._last_code
-                        )
+                    self.__notify(self._last_code)
 
                     return True
 
@@ -755,40 +1024,112 @@ class FakeModule(object):
                 except (RepeatLeadOutError, RepeatTimeoutExpired):
                     return True
 
-            for decoder in possible_decoders:
-                for code in decoder:
-                    if code == data:
+            rejected = (
+                self._negative_cache is not None and
+                self._negative_cache.rejected(data, frequency)
+            )
+
+            if rejected:
+                # none of the decoders were able to decode the frame the
+                # last time it came in. Only the decoders that keep state
+                # are able to decode it now.
+                possible_decoders = [
+                    decoder for decoder in possible_decoders
+                    if _keeps_state(decoder) or
+                    isinstance(decoder, _Universal)
+                ]
+
+            # decoders that have the same spec share what they get out of the
+            # frame while it is handed to them
+            demodulation_cache = self._demodulation_cache
+
+            if demodulation_cache is not None:
+                demodulation_cache.start(data, self.pulse_alphabet)
+
+            try:
+                for decoder in possible_decoders:
+                    code = decoder.get_saved_code(data)
+
+                    if code is not None:
                         # noinspection PyProtectedMember
                         if decoder._last_code is not None:
                             # noinspection PyProtectedMember
                             decoder._last_code.repeat_timer.stop()
-                        break
 
-                else:
-                    try:
-                        code = decoder.decode(data, frequency)
-                    except DecodeError:
-                        continue
+                    else:
+                        # most decoders turn a frame away, they hand back
+                        # why instead of building and raising an error.
+                        try:
+                            # noinspection PyProtectedMember
+                            code = decoder._try_decode(data, frequency)
+                        except RepeatLeadInError:
+                            self._last_decoder = decoder
+                            return True
 
-                    except RepeatLeadInError:
-                        self._last_decoder = decoder
-                        return True
+                        except (RepeatLeadOutError, RepeatTimeoutExpired):
+                            return True
 
-                    except (RepeatLeadOutError, RepeatTimeoutExpired):
-                        return True
+                        if isinstance(code, code_wrapper.Rejection):
+                            continue
 
-                code.bind_released_callback(self.__reset_last_code)
-                self._last_decoder = decoder
-                self._last_code = code
-                code.repeat_timer.start(self._timer)
+                        if isinstance(decoder, _Universal):
+                            if not rejected:
+                                self.__add_to_negative_cache(data, frequency)
+                        else:
+                            self.__add_to_cache(data, frequency, code)
 
-                if self._decode_callback is not None:
-                    _process_threadworker.add(
-                        self._decode_callback,
-                        self._last_code
-                    )
+                    self.__hit(decoder)
+                    code.bind_released_callback(self.__reset_last_code)
+                    self._last_decoder = decoder
+                    self._last_code = code
+                    code.repeat_timer.start(self._timer)
+
+                    self.__notify(self._last_code)
+
+                    return code
+
+                if not rejected:
+                    self.__add_to_negative_cache(data, frequency)
+            finally:
+                if demodulation_cache is not None:
+                    demodulation_cache.stop()
+
+    async def async_decode(
+        self,
+        data: list,
+        frequency: int = 0
+    ) -> Optional[protocol_base.IRCode]:
+        # the frame gets decoded in the default executor of the loop so the
+        # loop keeps running while the decoders are tried
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.decode, data, frequency)
+
+    def _reset_state(self):
+        with self._repeat_code_lock:
+            if self._last_code is not None:
+                self._last_code.repeat_timer.stop()
 
-                return code
+            self._last_code = None
+            self._last_decoder = None
+
+            for decoder in self._decoders:
+                decoder._last_code = None
+                del decoder._stored_codes[:]
+
+    def decode_many(
+        self,
+        frames: Iterable[list],
+        frequency: int = 0,
+        workers: Optional[int] = None,
+        chunk_size: int = batch_decode.CHUNK_SIZE
+    ) -> Iterator[Optional[batch_decode.DecodeResult]]:
+        return batch_decode.decode_many(
+            self,
+            frames,
+            frequency,
+            workers,
+            chunk_size
+        )
 
     def decode(
         self,
@@ -870,11 +1211,63 @@ class FakeModule(object):
 
         return res
 
+    @property
+    def reject_counts(self):
+        # where the frames handed to each decoder got turned away
+        res = {}
+
+        for decoder in self:
+            res[decoder.name] = decoder.reject_counts
+
+        return res
+
+    def reset_reject_counts(self):
+        for decoder in self:
+            decoder.reset_reject_counts()
+
     def __get_decoder(self, cls):
         for decoder in self:
             if decoder.name == cls.name:
                 return decoder
 
+    def load_config(self, config_data):
+        self.close()
+        self.__init__(config_data)
+
+
+class FakeModule(Decoder):
+    _instance = None
+
+    Decoder = Decoder
+
+    def __init__(self, config_data=None):
+        import sys
+
+        if FakeModule._instance is None:
+            mod = sys.modules[__name__]
+            # noinspection PyTypeChecker
+            sys.modules[__name__] = self
+
+        else:
+            # noinspection PyProtectedMember
+            mod = FakeModule._instance._original_module
+
+        self.__doc__ = mod.__doc__
+        self.__file__ = mod.__file__
+        self.__loader__ = mod.__loader__
+        self.__name__ = mod.__name__
+        self.__package__ = mod.__package__
+        self.__path__ = mod.__path__
+        self.__spec__ = mod.__spec__
+        self._original_module = mod
+
+        Decoder.__init__(self, config_data)
+
+        if FakeModule._instance is None:
+            FakeModule._instance = self
+        else:
+            FakeModule._instance.__dict__.update(self.__dict__)
+
     def load_config(self, config_data):
         self.close()
         FakeModule(config_data)
@@ -45,6 +45,7 @@ class Aiwa(protocol_base.IrProtocolBase):
     frequency = 38123
     bit_count = 42
     encoding = 'lsb'
+    _use_quick_reject = False
 
     _lead_in = [TIMING * 16, -TIMING * 8]
     _lead_out = [TIMING, -TIMING * 42]
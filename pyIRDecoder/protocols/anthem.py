@@ -50,6 +50,9 @@ class Anthem(protocol_base.IrProtocolBase):
     frequency = 38000
     bit_count = 32
     encoding = 'lsb'
+    _cache_decode = False
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_in = [8000, -4000]
     _lead_out1 = [TIMING, -25000]
@@ -76,8 +79,6 @@ class Anthem(protocol_base.IrProtocolBase):
         ['function', 0, 255],
     ]
 
-    _stored_codes = []
-
     @staticmethod
     def _calc_checksum(
         device: protocol_base.IntegerWrapper,
@@ -144,6 +145,9 @@ class Anthem(protocol_base.IrProtocolBase):
 
                 raise DecodeError
 
+            # an end frame without the frames that come before it
+            raise DecodeError
+
     def encode(
         self,
         device: int,
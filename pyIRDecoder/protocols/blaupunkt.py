@@ -51,6 +51,9 @@ class Blaupunkt(protocol_base.IrProtocolBase):
     frequency = 30300
     bit_count = 10
     encoding = 'lsb'
+    _cache_decode = False
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_in = [TIMING, -TIMING * 5]
     _lead_out1 = [-TIMING * 44]  # 22528
@@ -81,52 +84,48 @@ class Blaupunkt(protocol_base.IrProtocolBase):
         sum(abs(item) for item in _lead_in) + abs(_lead_out2[0])
     )
 
-    _saved_codes = []
-
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         self._lead_out = self._lead_out1
 
         try:
             code = protocol_base.IrProtocolBase.decode(self, data, frequency)
             if code.c0 != 1:
-                del self._saved_codes[:]
+                del self._stored_codes[:]
                 raise DecodeError
             if code.device != 7:
-                del self._saved_codes[:]
+                del self._stored_codes[:]
                 raise DecodeError
             if code.function != 63:
-                del self._saved_codes[:]
+                del self._stored_codes[:]
                 raise DecodeError
 
-            if len(self._saved_codes) == 2:
+            if len(self._stored_codes) == 2:
                 device = self._last_code.device
                 function = self._last_code.function
 
-                del self._saved_codes[:]
+                del self._stored_codes[:]
                 self._last_code += code
                 # noinspection PyProtectedMember
-                self._last_code._data['F'] = function
-                # noinspection PyProtectedMember
-                self._last_code._data['D'] = device
+                self._last_code._set_params(F=function, D=device)
                 raise RepeatLeadOutError
 
-            elif not self._saved_codes:
-                self._saved_codes.append(code)
+            elif not self._stored_codes:
+                self._stored_codes.append(code)
                 raise RepeatLeadInError
             else:
-                del self._daved_codes[:]
+                del self._stored_codes[:]
                 raise DecodeError
         except LeadOutError:
             self._lead_out = self._lead_out2
             code = protocol_base.IrProtocolBase.decode(self, data, frequency)
 
             if code.c0 != 1:
-                del self._saved_codes[:]
+                del self._stored_codes[:]
                 raise DecodeError
 
-            if len(self._saved_codes) == 1:
-                code += self._saved_codes[0]
-                self._saved_codes.append(code)
+            if len(self._stored_codes) == 1:
+                code += self._stored_codes[0]
+                self._stored_codes.append(code)
 
         if self._last_code is not None:
             if self._last_code == code:
@@ -27,7 +27,6 @@
 
 # Local imports
 from . import protocol_base
-from . import DecodeError
 
 
 TIMING = 500
@@ -54,6 +53,9 @@ class Bose(protocol_base.IrProtocolBase):
         ['F', 0, 7],
         ['F_CHECKSUM', 8, 15],
     ]
+
+    _inverted_fields = [['F_CHECKSUM', 'F']]
+
     # [F:0..255]
     encode_parameters = [
         ['function', 0, 255],
@@ -68,11 +70,6 @@ class Bose(protocol_base.IrProtocolBase):
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
 
-        func_checksum = self._calc_checksum(code.function)
-
-        if func_checksum != code.f_checksum:
-            raise DecodeError('Checksum failed')
-
         if self._last_code is not None:
             if self._last_code == code:
                 return self._last_code
@@ -95,7 +95,7 @@ class CanalSatLD(protocol_base.IrProtocolBase):
 
         if code.toggle == 0:
             # noinspection PyProtectedMember
-            code._data['T'] = 1
+            code._set_params(T=1)
             self._last_code = code
         else:
             raise DecodeError('toggle bit incorrect')
@@ -42,6 +42,9 @@ class Denon(protocol_base.IrProtocolBase):
     _bit_count1 = 15
     _bit_count2 = 30
     encoding = 'lsb'
+    _cache_decode = False
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_out = [TIMING, -TIMING * 165]
     _middle_timings1 = []
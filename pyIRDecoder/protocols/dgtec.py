@@ -27,7 +27,6 @@
 
 # Local imports
 from . import protocol_base
-from . import DecodeError
 
 
 TIMING = 560
@@ -64,6 +63,9 @@ class Dgtec(protocol_base.IrProtocolBase):
         ['F', 8, 15],
         ['F_CHECKSUM', 16, 23],
     ]
+
+    _inverted_fields = [['F_CHECKSUM', 'F']]
+
     # [D:0..255,F:0..255]
     encode_parameters = [
         ['device', 0, 255],
@@ -78,10 +80,6 @@ class Dgtec(protocol_base.IrProtocolBase):
 
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
-        func_checksum = self._calc_checksum(code.function)
-
-        if func_checksum != code.f_checksum:
-            raise DecodeError('Checksum failed')
 
         if self._last_code is not None:
             if code == self._last_code:
@@ -27,7 +27,6 @@
 
 # Local imports
 from . import protocol_base
-from . import DecodeError
 
 
 TIMING = 182
@@ -67,6 +66,9 @@ class Digivision(protocol_base.IrProtocolBase):
         ['F', 24, 31],
         ['F_CHECKSUM', 32, 39]
     ]
+
+    _inverted_fields = [['F_CHECKSUM', 'F']]
+
     # [D:0..255,Dev2:0..255,Dev3:0..255,F:0..255]
     encode_parameters = [
         ['device', 0, 255],
@@ -83,10 +85,6 @@ class Digivision(protocol_base.IrProtocolBase):
 
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
-        func_checksum = self._calc_checksum(code.function)
-
-        if func_checksum != code.f_checksum:
-            raise DecodeError('Checksum failed')
 
         if self._last_code is not None:
             if self._last_code == code:
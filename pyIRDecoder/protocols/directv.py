@@ -52,9 +52,13 @@ class DirecTV(protocol_base.IrProtocolBase):
     frequency = 38000
     bit_count = 16
     encoding = 'msb'
+    _cache_decode = False
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_in1 = [TIMING * 10, -TIMING * 2]
     _lead_in2 = []
+    _index_lead_in = False
 
     _lead_out = [TIMING, -30000, TIMING * 5, -TIMING * 2]
     _bursts = [
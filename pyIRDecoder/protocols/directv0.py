@@ -52,10 +52,14 @@ class DirecTV0(protocol_base.IrProtocolBase):
     frequency = 40000
     bit_count = 16
     encoding = 'msb'
+    _cache_decode = False
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_in = []
     _lead_in1 = [TIMING * 10, -TIMING * 2]
     _lead_in2 = [TIMING * 5, -TIMING * 2]
+    _index_lead_in = False
 
     _lead_out = [TIMING, -TIMING * 15]
     _bursts = [
@@ -41,6 +41,8 @@ class DishPlayer(protocol_base.IrProtocolBase):
     frequency = 38400
     bit_count = 13
     encoding = 'msb'
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_in = [TIMING, -TIMING * 11]
     _lead_out = [TIMING, -TIMING * 11]
@@ -50,6 +50,8 @@ class Dyson(protocol_base.IrProtocolBase):
     _bit_count2 = 1
 
     encoding = 'lsb'
+    _check_frame_bounds = False
+    _use_quick_reject = False
     _lead_in = [TIMING * 3, -TIMING]
     _lead_out = [TIMING, -60000]
 
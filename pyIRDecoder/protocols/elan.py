@@ -29,7 +29,6 @@ from typing import Sequence
 
 # Local imports
 from . import protocol_base
-from . import DecodeError
 
 
 TIMING = 398
@@ -60,6 +59,12 @@ class Elan(protocol_base.IrProtocolBase):
         ['F', 16, 23],
         ['F_CHECKSUM', 24, 31]
     ]
+
+    _inverted_fields = [
+        ['D_CHECKSUM', 'D'],
+        ['F_CHECKSUM', 'F']
+    ]
+
     # [D:0..255,F:0..255]
     encode_parameters = [
         ['device', 0, 255],
@@ -76,14 +81,6 @@ class Elan(protocol_base.IrProtocolBase):
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
 
-        dev_checksum, func_checksum = self._calc_checksum(
-            code.device,
-            code.function
-        )
-
-        if dev_checksum != code.d_checksum or func_checksum != code.f_checksum:
-            raise DecodeError('Checksum failed')
-
         if self._last_code is not None:
             if self._last_code == code:
                 return self._last_code
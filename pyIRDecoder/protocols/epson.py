@@ -53,6 +53,9 @@ class Epson(protocol_base.IrProtocolBase):
     frequency = 38400
     bit_count = 26
     encoding = 'msb'
+    _cache_decode = False
+    _check_frame_bounds = False
+    _use_quick_reject = False
     _enabled = False
 
     _lead_in = [TIMING * 4, -TIMING]
@@ -277,8 +280,10 @@ class Epson(protocol_base.IrProtocolBase):
             )
 
         elif 'FUNCTION1' in params:
-            code._data['FUNCTION1'] = code._data['FUNCTION1'][True:2:0]
-            code._data['FUNCTION2'] = code._data['FUNCTION2'][True:2:0]
+            code._set_params(
+                FUNCTION1=code.function1[True:2:0],
+                FUNCTION2=code.function2[True:2:0]
+            )
 
             if self._partial_code is not None:
                 if (
@@ -40,6 +40,7 @@ class F12(protocol_base.IrProtocolBase):
     frequency = 37900
     bit_count = 12
     encoding = 'lsb'
+    _cache_decode = False
 
     _lead_in = []
     _lead_out = [-TIMING * 80]
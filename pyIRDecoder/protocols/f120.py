@@ -47,6 +47,9 @@ class F120(protocol_base.IrProtocolBase):
     _bit_count1 = 12
     _bit_count2 = 24
     encoding = 'lsb'
+    _cache_decode = False
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_in = []
     _lead_out = []
@@ -46,6 +46,7 @@ class F121(protocol_base.IrProtocolBase):
     frequency = 37900
     bit_count = 48
     encoding = 'lsb'
+    _use_quick_reject = False
 
     _lead_in = []
     _lead_out = []
@@ -49,6 +49,7 @@ class Grundig16(protocol_base.IrProtocolBase):
     frequency = 35700
     bit_count = 16
     encoding = 'msb'
+    _use_quick_reject = False
 
     _lead_in = [806, -2960, 1346]
     _lead_out = [-TIMING * 100]
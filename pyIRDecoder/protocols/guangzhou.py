@@ -50,6 +50,8 @@ class GuangZhou(protocol_base.IrProtocolBase):
     frequency = 38000
     bit_count = 40
     encoding = 'lsb'
+    _cache_decode = False
+    _use_quick_reject = False
 
     _lead_in = [TIMING * 20, -TIMING * 10]
     _lead_out = [TIMING * 3, 108000]
@@ -165,7 +167,8 @@ class GuangZhou(protocol_base.IrProtocolBase):
                     [],
                     self._bursts[:],
                     self.tolerance,
-                    data[:]
+                    data,
+                    self._get_timing_windows()
                 )
 
                 if code.num_bits > 24:
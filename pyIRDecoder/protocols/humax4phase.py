@@ -53,6 +53,8 @@ class Humax4Phase(protocol_base.IrProtocolBase):
     frequency = 56000
     bit_count = 22
     encoding = 'msb'
+    _cache_decode = False
+    _use_quick_reject = False
 
     _lead_in = [TIMING * 2, -TIMING * 2]
     _lead_out = [95000]
@@ -136,11 +138,12 @@ class Humax4Phase(protocol_base.IrProtocolBase):
                 raise LeadOutError
 
         while code:
-            try:
-                timings = code[:2]
-                code = code[2:]
-            except ValueError:
-                break
+            timings = code[:2]
+            code = code[2:]
+
+            # a frame from another decoder that has a timing left over
+            if len(timings) != 2:
+                raise DecodeError(str(timings))
 
             for bursts in self._bursts:
                 if (
@@ -43,6 +43,8 @@ class JVC(protocol_base.IrProtocolBase):
     frequency = 37900
     bit_count = 16
     encoding = 'lsb'
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_in = [TIMING * 16, -TIMING * 8]
     _lead_out = [TIMING, 59080]
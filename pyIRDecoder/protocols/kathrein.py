@@ -50,6 +50,8 @@ class Kathrein(protocol_base.IrProtocolBase):
     _bit_count2 = 8
 
     encoding = 'lsb'
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_in = [TIMING * 16, -TIMING * 8]
     _lead_out = [TIMING, 105000]
@@ -28,7 +28,6 @@
 from typing import Sequence
 # Local imports
 from . import protocol_base
-from . import DecodeError
 
 
 TIMING = 127
@@ -59,6 +58,12 @@ class Logitech(protocol_base.IrProtocolBase):
         ['F', 8, 15],
         ['F_CHECKSUM', 16, 23],
     ]
+
+    _inverted_fields = [
+        ['D_CHECKSUM', 'D'],
+        ['F_CHECKSUM', 'F']
+    ]
+
     # [D:0..15,F:0..255]
     encode_parameters = [
         ['device', 0, 15],
@@ -76,15 +81,6 @@ class Logitech(protocol_base.IrProtocolBase):
 
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
-        dev_checksum, func_checksum = (
-            self._calc_checksum(code.device, code.function)
-        )
-
-        if (
-            dev_checksum != code.d_checksum or
-            func_checksum != code.f_checksum
-        ):
-            raise DecodeError('Checksum failed')
 
         if self._last_code is not None:
             if self._last_code == code:
@@ -27,7 +27,7 @@
 
 # Local imports
 from . import protocol_base
-from . import DecodeError, EncodeError
+from . import EncodeError
 
 
 MCE_COMMANDS = {
@@ -125,6 +125,15 @@ class MCE(protocol_base.IrProtocolBase):
         ['D', 21, 27],
         ['F', 28, 35],
     ]
+
+    _constant_fields = [
+        ['C0', 1],
+        ['M', 6],
+        ['OEM1', OEM1],
+        ['OEM2', OEM2],
+        ['D', MCE_DEVICE]
+    ]
+
     # [D:0..127,S:0..255,F:0..255,T@:0..1=0]
     encode_parameters = [
         ['function', 0, 0x5E],
@@ -138,14 +147,6 @@ class MCE(protocol_base.IrProtocolBase):
 
     def decode(self, data, frequency=0):
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
-        if (
-            code.c0 != 1 or
-            code.mode != 6 or
-            code.oem1 != OEM1 or
-            code.oem2 != OEM2 or
-            code.device != MCE_DEVICE
-        ):
-            raise DecodeError('Checksum failed')
 
         if code.function not in MCE_COMMANDS:
             raise EncodeError('Invalid function')
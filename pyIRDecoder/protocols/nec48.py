@@ -29,7 +29,6 @@ from typing import Sequence
 
 # Local imports
 from . import protocol_base
-from . import DecodeError
 
 
 TIMING = 564
@@ -72,6 +71,11 @@ class NEC48(protocol_base.IrProtocolBase):
         ['E_CHECKSUM', 40, 47]
     ]
 
+    _inverted_fields = [
+        ['F_CHECKSUM', 'F'],
+        ['E_CHECKSUM', 'E']
+    ]
+
     # [D:0..255,S:0..255=255-D,F:0..255,E:0..255]
     encode_parameters = [
         ['device', 0, 255],
@@ -90,16 +94,6 @@ class NEC48(protocol_base.IrProtocolBase):
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
 
-        func_checksum, e_checksum = (
-            self._calc_checksum(code.function, code.extended_function)
-        )
-
-        if (
-            func_checksum != code.f_checksum or
-            e_checksum != code.e_checksum
-        ):
-            raise DecodeError('Checksum failed')
-
         if self._last_code is not None:
             if self._last_code == code:
                 return self._last_code
@@ -99,7 +99,7 @@ class NECYamaha(protocol_base.IrProtocolBase):
         )
 
         # noinspection PyProtectedMember
-        code._data['Y'] = y
+        code._set_params(Y=y)
 
         if self._last_code is not None:
             if self._last_code == code:
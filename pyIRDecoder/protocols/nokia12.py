@@ -50,6 +50,7 @@ class Nokia12(protocol_base.IrProtocolBase):
     frequency = 36000
     bit_count = 12
     encoding = 'msb'
+    _use_quick_reject = False
 
     _lead_in = [int(TIMING * 15), int(-TIMING * 10)]
     _lead_out = [int(TIMING * 6), 100000]
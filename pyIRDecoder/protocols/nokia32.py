@@ -51,6 +51,7 @@ class Nokia32(protocol_base.IrProtocolBase):
     frequency = 36000
     bit_count = 32
     encoding = 'msb'
+    _use_quick_reject = False
 
     _lead_in = [int(TIMING * 15), int(-TIMING * 10)]
     _lead_out = [int(TIMING * 6), 100000]
@@ -50,6 +50,9 @@ class NRC16(protocol_base.IrProtocolBase):
     frequency = 38000
     bit_count = 48
     encoding = 'lsb'
+    _cache_decode = False
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_in = [TIMING, -TIMING * 5]
     _lead_out = []
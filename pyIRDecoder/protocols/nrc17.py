@@ -52,6 +52,9 @@ class NRC17(protocol_base.IrProtocolBase):
     frequency = 38000
     bit_count = 17
     encoding = 'lsb'
+    _cache_decode = False
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_in = [TIMING, -TIMING * 5]
     _lead_out = []
@@ -78,8 +81,8 @@ class NRC17(protocol_base.IrProtocolBase):
     ]
 
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
-        tolerance = self.tolerance
-        self.tolerance = 5
+        tolerance = self._tolerance
+        self._tolerance = 5
         codes = []
         code = []
 
@@ -104,7 +107,7 @@ class NRC17(protocol_base.IrProtocolBase):
                 except:
                     self._lead_out = []
                     self.bit_count = 51
-                    self.tolerance = tolerance
+                    self._tolerance = tolerance
                     raise
 
                 if (
@@ -114,7 +117,7 @@ class NRC17(protocol_base.IrProtocolBase):
                 ):
                     self._lead_out = []
                     self.bit_count = 17
-                    self.tolerance = tolerance
+                    self._tolerance = tolerance
                     raise DecodeError
 
                 codes.append(code)
@@ -137,7 +140,7 @@ class NRC17(protocol_base.IrProtocolBase):
                 except:
                     self._lead_out = []
                     self.bit_count = 51
-                    self.tolerance = tolerance
+                    self._tolerance = tolerance
                     raise
 
                 codes.append(code)
@@ -160,7 +163,7 @@ class NRC17(protocol_base.IrProtocolBase):
                 except:
                     self._lead_out = []
                     self.bit_count = 51
-                    self.tolerance = tolerance
+                    self._tolerance = tolerance
                     raise
 
                 if (
@@ -170,7 +173,7 @@ class NRC17(protocol_base.IrProtocolBase):
                 ):
                     self._lead_out = []
                     self.bit_count = 51
-                    self.tolerance = tolerance
+                    self._tolerance = tolerance
                     raise DecodeError
 
                 codes.append(code)
@@ -179,7 +182,7 @@ class NRC17(protocol_base.IrProtocolBase):
         if not codes:
             self._lead_out = []
             self.bit_count = 51
-            self.tolerance = tolerance
+            self._tolerance = tolerance
 
             raise DecodeError
 
@@ -201,7 +204,7 @@ class NRC17(protocol_base.IrProtocolBase):
             self._stored_codes.append(code)
             self._lead_out = []
             self.bit_count = 51
-            self.tolerance = tolerance
+            self._tolerance = tolerance
             raise ExpectingMoreData
 
         if len(self._stored_codes) == 3:
@@ -229,7 +232,7 @@ class NRC17(protocol_base.IrProtocolBase):
 
             return code
 
-        self.tolerance = tolerance
+        self._tolerance = tolerance
         raise ExpectingMoreData
 
     def encode(
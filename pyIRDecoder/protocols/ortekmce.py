@@ -45,6 +45,7 @@ class OrtekMCE(protocol_base.IrProtocolBase):
     frequency = 38600
     bit_count = 17
     encoding = 'lsb'
+    _cache_decode = False
 
     _lead_in = [TIMING * 4, -TIMING]
     _lead_out = [-48000]
@@ -110,7 +111,7 @@ class OrtekMCE(protocol_base.IrProtocolBase):
             # noinspection PyProtectedMember
             self._last_code._original_rlc += code._original_rlc
             # noinspection PyProtectedMember
-            self._last_code._data['P'] = 1
+            self._last_code._set_params(P=1)
 
             raise RepeatLeadInError
 
@@ -123,7 +124,7 @@ class OrtekMCE(protocol_base.IrProtocolBase):
             # noinspection PyProtectedMember
             self._last_code._original_rlc += code._original_rlc
             # noinspection PyProtectedMember
-            self._last_code._data['P'] = 2
+            self._last_code._set_params(P=2)
             return self._last_code
 
         if (
@@ -40,6 +40,8 @@ class PID0001(protocol_base.IrProtocolBase):
     frequency = 0
     bit_count = 5
     encoding = 'msb'
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_in = [24, -21148]
     _lead_out = [1, -28000]
@@ -27,7 +27,6 @@
 
 # Local imports
 from . import protocol_base
-from . import DecodeError
 
 
 TIMING = 389
@@ -55,6 +54,9 @@ class PID0003(protocol_base.IrProtocolBase):
         ['F', 0, 7],
         ['CHECKSUM', 8, 15],
     ]
+
+    _inverted_fields = [['CHECKSUM', 'F']]
+
     # [F:0..255]
     encode_parameters = [
         ['function', 0, 255],
@@ -69,11 +71,6 @@ class PID0003(protocol_base.IrProtocolBase):
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
 
-        checksum = self._calc_checksum(code.function)
-
-        if checksum != code.checksum:
-            raise DecodeError('Checksum failed')
-
         if self._last_code is not None:
             if self._last_code == code:
                 return self._last_code
@@ -47,6 +47,7 @@ class PID0083(protocol_base.IrProtocolBase):
     frequency = 42300
     bit_count = 5
     encoding = 'lsb'
+    _use_quick_reject = False
 
     _lead_in = []
     _lead_out = [TIMING, -TIMING * 27]
@@ -27,7 +27,6 @@
 
 # Local imports
 from . import protocol_base
-from . import DecodeError
 
 
 TIMING = 564
@@ -59,6 +58,9 @@ class Pioneer(protocol_base.IrProtocolBase):
         ['F', 16, 23],
         ['CHECKSUM', 24, 31],
     ]
+
+    _inverted_fields = [['CHECKSUM', 'F']]
+
     # [D:0..255,S:0..255=255-D,F:0..255]
     encode_parameters = [
         ['device', 0, 255],
@@ -75,11 +77,6 @@ class Pioneer(protocol_base.IrProtocolBase):
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
 
-        checksum = self._calc_checksum(code.function)
-
-        if checksum != code.checksum:
-            raise DecodeError('Checksum failed')
-
         if self._last_code is not None:
             if self._last_code == code:
                 return self._last_code
@@ -29,7 +29,7 @@ from typing import Sequence
 
 # Local imports
 from . import protocol_base
-from . import DecodeError, RepeatLeadInError
+from . import RepeatLeadInError
 
 
 TIMING = 564
@@ -47,6 +47,7 @@ class PioneerMix(protocol_base.IrProtocolBase):
     frequency = 40000
     bit_count = 32
     encoding = 'lsb'
+    _cache_decode = False
 
     _lead_in = [TIMING * 16, -TIMING * 8]
     _lead_out = [TIMING, 108000]
@@ -64,6 +65,12 @@ class PioneerMix(protocol_base.IrProtocolBase):
         ['F', 16, 23],
         ['F_CHECKSUM', 24, 31]
     ]
+
+    _inverted_fields = [
+        ['D_CHECKSUM', 'D'],
+        ['F_CHECKSUM', 'F']
+    ]
+
     # [D0:0..255,F0:0..255,D:0..255=D0,F:0..255=F0]
     encode_parameters = [
         ['device', 0, 255],
@@ -80,13 +87,6 @@ class PioneerMix(protocol_base.IrProtocolBase):
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
 
-        d_checksum, f_checksum = (
-            self._calc_checksum(code.device, code.function)
-        )
-
-        if d_checksum != code.d_checksum or f_checksum != code.f_checksum:
-            raise DecodeError('Checksum failed')
-
         if self._last_code is not None:
             if hasattr(self._last_code, 'd0'):
                 if (
@@ -27,7 +27,7 @@
 
 # Local imports
 from . import protocol_base
-from . import DecodeError, RepeatLeadOutError
+from . import RepeatLeadOutError
 
 
 TIMING = 444
@@ -68,6 +68,12 @@ class RC6(protocol_base.IrProtocolBase):
         ['D', 5, 12],
         ['F', 13, 20],
     ]
+
+    _constant_fields = [
+        ['C0', 1],
+        ['M', 0]
+    ]
+
     # [D:0..255,F:0..255,T@:0..1=0]
     encode_parameters = [
         ['device', 0, 255],
@@ -77,9 +83,6 @@ class RC6(protocol_base.IrProtocolBase):
     def decode(self, data, frequency=0):
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
 
-        if code.c0 != 1 or code.mode != 0:
-            raise DecodeError('Checksum failed')
-
         if self._last_code is not None:
             if (
                 self._last_code == code and
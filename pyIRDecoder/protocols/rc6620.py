@@ -73,6 +73,9 @@ class RC6620(protocol_base.IrProtocolBase):
         ['S', 13, 16],
         ['F', 17, 24],
     ]
+
+    _constant_fields = [['C0', 1]]
+
     # [D:0..255,S:0..15,F:0..255,T@:0..1=0]
     encode_parameters = [
         ['device', 0, 255],
@@ -83,9 +86,6 @@ class RC6620(protocol_base.IrProtocolBase):
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
 
-        if code.c0 != 1:
-            raise DecodeError('Checksum failed')
-
         if code.mode != 6:
             raise DecodeError('Incorrect Mode')
 
@@ -69,6 +69,9 @@ class RC6632(protocol_base.IrProtocolBase):
         ['D', 21, 27],
         ['F', 28, 35],
     ]
+
+    _constant_fields = [['C0', 1]]
+
     # [D:0..127,S:0..255,F:0..255,T@:0..1=0]
     encode_parameters = [
         ['device', 0, 127],
@@ -79,9 +82,6 @@ class RC6632(protocol_base.IrProtocolBase):
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
 
-        if code.c0 != 1:
-            raise DecodeError('Checksum failed')
-
         if code.mode != 6:
             raise DecodeError('Incorrect Mode')
 
@@ -27,7 +27,7 @@
 
 # Local imports
 from . import protocol_base
-from . import DecodeError, RepeatLeadOutError
+from . import RepeatLeadOutError
 
 
 TIMING = 444
@@ -70,6 +70,9 @@ class RC6M16(protocol_base.IrProtocolBase):
         ['D', 5, 12],
         ['F', 13, 20],
     ]
+
+    _constant_fields = [['C0', 1]]
+
     # [D:0..255,F:0..255,M:0..7,T@:0..1=0]
     encode_parameters = [
         ['mode', 1, 7],
@@ -80,9 +83,6 @@ class RC6M16(protocol_base.IrProtocolBase):
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
 
-        if code.c0 != 1:
-            raise DecodeError('Checksum failed')
-
         if self._last_code is not None:
             if (
                 self._last_code == code and
@@ -75,6 +75,9 @@ class RC6M32(protocol_base.IrProtocolBase):
         ['D', 21, 28],
         ['F', 29, 36],
     ]
+
+    _constant_fields = [['C0', 1]]
+
     # [OEM1:0..255,OEM2:0..255,D:0..255,F:0..255,M:0..7,T@:0..1=0]
     encode_parameters = [
         ['mode', 0, 7],
@@ -86,8 +89,6 @@ class RC6M32(protocol_base.IrProtocolBase):
 
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
-        if code.c0 != 1:
-            raise DecodeError('Checksum failed')
 
         if code.mode == 6 and code.oem1 == 128:
             raise DecodeError('RC6632 protocol')
@@ -27,7 +27,7 @@
 
 # Local imports
 from . import protocol_base
-from . import DecodeError, RepeatLeadOutError
+from . import RepeatLeadOutError
 
 
 TIMING = 444
@@ -69,6 +69,9 @@ class RC6M56(protocol_base.IrProtocolBase):
         ['T', 4, 4],
         ['F', 5, 60],
     ]
+
+    _constant_fields = [['C0', 1]]
+
     # [M:0..7,T@:0..1=0,C:0..72057594037927935]
     encode_parameters = [
         ['mode', 0, 7],
@@ -78,9 +81,6 @@ class RC6M56(protocol_base.IrProtocolBase):
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
 
-        if code.c0 != 1:
-            raise DecodeError('Checksum failed')
-
         if self._last_code is not None:
             if (
                 self._last_code == code and
@@ -48,6 +48,7 @@ class RC6MBIT(protocol_base.IrProtocolBase):
     frequency = 36000
     bit_count = 64
     encoding = 'msb'
+    _use_quick_reject = False
 
     _lead_in = [TIMING * 6, -TIMING * 2]
     _lead_out = [-999999999999]
@@ -29,7 +29,6 @@ from typing import Sequence
 
 # Local imports
 from . import protocol_base
-from . import DecodeError
 
 
 TIMING = 460
@@ -60,6 +59,12 @@ class RCA(protocol_base.IrProtocolBase):
         ['D_CHECKSUM', 12, 15],
         ['F_CHECKSUM', 16, 23]
     ]
+
+    _inverted_fields = [
+        ['D_CHECKSUM', 'D'],
+        ['F_CHECKSUM', 'F']
+    ]
+
     # [D:0..15,F:0..255]
     encode_parameters = [
         ['device', 0, 15],
@@ -75,12 +80,6 @@ class RCA(protocol_base.IrProtocolBase):
 
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
-        d_checksum, f_checksum = (
-            self._calc_checksum(code.device, code.function)
-        )
-
-        if f_checksum != code.f_checksum or d_checksum != code.d_checksum:
-            raise DecodeError('Checksum failed')
 
         if self._last_code is not None:
             if self._last_code == code:
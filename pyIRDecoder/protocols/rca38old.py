@@ -43,10 +43,14 @@ class RCA38Old(protocol_base.IrProtocolBase):
     frequency = 38700
     bit_count = 24
     encoding = 'msb'
+    _cache_decode = False
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_in = []
     _lead_in1 = [TIMING * 40, -TIMING * 8]
     _lead_in2 = [TIMING * 8, -TIMING * 8]
+    _index_lead_in = False
     _lead_out = [TIMING * 2, -TIMING * 16]
     _middle_timings = []
     _bursts = [[TIMING, -TIMING * 2], [TIMING, -TIMING * 4]]
@@ -45,6 +45,7 @@ class Roku(protocol_base.IrProtocolBase):
     frequency = 38000
     bit_count = 32
     encoding = 'lsb'
+    _cache_decode = False
 
     _lead_in = [TIMING * 16, -TIMING * 8]
     _lead_out = [TIMING, 108000]
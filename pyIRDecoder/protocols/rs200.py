@@ -55,6 +55,7 @@ class Rs200(protocol_base.IrProtocolBase):
     frequency = 35700
     bit_count = 26
     encoding = 'msb'
+    _use_quick_reject = False
 
     _lead_in = []
     _lead_out = [-35854]
@@ -27,7 +27,6 @@
 
 # Local imports
 from . import protocol_base
-from . import DecodeError
 
 
 TIMING = 560
@@ -64,6 +63,9 @@ class Samsung36(protocol_base.IrProtocolBase):
         ['F', 20, 27],
         ['CHECKSUM', 28, 35],
     ]
+
+    _inverted_fields = [['CHECKSUM', 'F']]
+
     # [D:0..255,S:0..255,F:0..255,E:0..15]
     encode_parameters = [
         ['device', 0, 255],
@@ -81,11 +83,6 @@ class Samsung36(protocol_base.IrProtocolBase):
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
 
-        checksum = self._calc_checksum(code.function)
-
-        if checksum != code.checksum:
-            raise DecodeError('Checksum failed')
-
         if self._last_code is not None:
             if self._last_code == code:
                 return self._last_code
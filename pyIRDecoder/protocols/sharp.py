@@ -41,6 +41,8 @@ class Sharp(protocol_base.IrProtocolBase):
     frequency = 38000
     bit_count = 30
     encoding = 'lsb'
+    _cache_decode = False
+    _use_quick_reject = False
 
     _lead_in = []
     _lead_out = [TIMING,  -TIMING * 165]
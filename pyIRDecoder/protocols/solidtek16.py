@@ -43,6 +43,7 @@ class SolidTek16(protocol_base.IrProtocolBase):
     frequency = 38000
     bit_count = 18
     encoding = 'lsb'
+    _cache_decode = False
 
     _lead_in = [1820, -590]
     _lead_out = [-143000]
@@ -49,6 +49,9 @@ class SonyDSP(protocol_base.IrProtocolBase):
     _bit_count2 = 8
 
     encoding = 'lsb'
+    _cache_decode = False
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_in = [TIMING * 4, -TIMING]
     _lead_out = [45000]
@@ -116,9 +119,7 @@ class SonyDSP(protocol_base.IrProtocolBase):
             function = code6.function
             code = code1 + code2 + code3 + code4 + code5 + code6 + code
             # noinspection PyProtectedMember
-            code._data['F'] = function
-            # noinspection PyProtectedMember
-            code._data['CHECKSUM'] = checksum
+            code._set_params(F=function, CHECKSUM=checksum)
 
             if self._last_code is not None:
                 if self._last_code == code:
@@ -36,6 +36,7 @@ class Universal(protocol_base.IrProtocolBase):
     """
     IR decoder for unknown protocols.
     """
+    _use_quick_reject = False
 
     def __decode_1(self, norm_data):
         bit_encoding = 'pulsetime'
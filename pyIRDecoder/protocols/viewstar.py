@@ -62,7 +62,7 @@ class Viewstar(protocol_base.IrProtocolBase):
         code = protocol_base.IrProtocolBase.decode(self, data, frequency)
 
         # noinspection PyProtectedMember
-        code._data['F'] = code.function[True:5:0]
+        code._set_params(F=code.function[True:5:0])
 
         if self._last_code is not None:
             if self._last_code == code:
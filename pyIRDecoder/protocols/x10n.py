@@ -46,6 +46,9 @@ class X10n(protocol_base.IrProtocolBase):
     _bit_count1 = 9
     _bit_count2 = 10
     encoding = 'lsb'
+    _cache_decode = False
+    _check_frame_bounds = False
+    _use_quick_reject = False
 
     _lead_in = []
     _lead_out = [TIMING * 21, -TIMING * 7]
@@ -111,11 +114,9 @@ class X10n(protocol_base.IrProtocolBase):
         if self._first_code is not None:
             self._first_code += code
 
-            # noinspection PyProtectedMember
-            self._first_code._data['CHECKSUM'] = code.checksum
             n = self._first_code.n[:-4:0]
             # noinspection PyProtectedMember
-            self._first_code._data['N'] = n
+            self._first_code._set_params(CHECKSUM=code.checksum, N=n)
             code = self._first_code
             self._first_code = None
 
@@ -157,7 +158,9 @@ class X10n(protocol_base.IrProtocolBase):
             N=n_
         )
         self.__class__._parameters = self.__class__._parameters1
-        del self.__class__._lead_in[:]
+        # _lead_in ends up being _repeat_lead_in from the last encode,
+        # emptying it in place would empty _repeat_lead_in as well
+        self.__class__._lead_in = []
 
         packet = self._build_packet(**params1)
 
@@ -166,7 +169,7 @@ class X10n(protocol_base.IrProtocolBase):
             CHECKSUM=checksum
         )
         self.__class__._parameters = self.__class__._parameters2
-        self.__class__._lead_in = self.__class__._repeat_lead_in
+        self.__class__._lead_in = self.__class__._repeat_lead_in[:]
 
         repeat = self._build_packet(**params2)
 
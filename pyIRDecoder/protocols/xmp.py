@@ -63,6 +63,9 @@ class XMP(protocol_base.IrProtocolBase):
     _bit_count2 = 32
 
     encoding = 'msb'
+    _cache_decode = False
+    _check_frame_bounds = False
+    _use_quick_reject = False
     _lead_out1 = [210, -80400]
     _lead_out2 = [210, -13800]
 
@@ -233,8 +236,8 @@ class XMP(protocol_base.IrProtocolBase):
         return code
 
     def decode(self, data: list, frequency: int = 0) -> protocol_base.IRCode:
-        tolerance = self.tolerance
-        self.tolerance = 2
+        tolerance = self._tolerance
+        self._tolerance = 2
 
         self.bit_count = self._bit_count1
         self._parameters = self._parameters1[:]
@@ -243,7 +246,7 @@ class XMP(protocol_base.IrProtocolBase):
 
         try:
             code = self._process_code(data[:], self._lead_out[:])
-            self.tolerance = tolerance
+            self._tolerance = tolerance
         except LeadOutError:
             self.bit_count = self._bit_count2
             self._parameters = self._parameters2[:]
@@ -252,11 +255,11 @@ class XMP(protocol_base.IrProtocolBase):
             try:
                 code = self._process_code(data[:], self._lead_out[:])
             except IRException:
-                self.tolerance = tolerance
+                self._tolerance = tolerance
                 raise
 
             self._prefix_code = code
-            self.tolerance = tolerance
+            self._tolerance = tolerance
             raise RepeatLeadInError
 
         except NotEnoughBitsError:
@@ -269,10 +272,10 @@ class XMP(protocol_base.IrProtocolBase):
             try:
                 code = self._process_code(data[:], self._lead_out[:])
             except IRException:
-                self.tolerance = tolerance
+                self._tolerance = tolerance
                 raise
 
-            self.tolerance = tolerance
+            self._tolerance = tolerance
             self._prefix_code += code
             code = self._prefix_code
             self._prefix_code = None
@@ -287,7 +290,7 @@ class XMP(protocol_base.IrProtocolBase):
             raise DecodeError('Invalid checksum')
 
         # noinspection PyProtectedMember
-        code._data['S'] = code.s1 << 4 | code.s2
+        code._set_params(S=code.s1 << 4 | code.s2)
 
         c1, c2 = self._calc_checksum(
             code.function,
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# ****************************************************************************
+
+# Every decoder matches the pulses of a frame against the windows of its own
+# timings, the dispatcher ends up comparing the same pulse against the same
+# handful of windows over and over again.
+#
+# The pulse alphabet is built from the windows of every enabled decoder. The
+# edges of all of those windows get sorted and cut the durations up into
+# classes that do not overlap, a window is then a range of classes. When a
+# frame comes in each pulse is turned into its class once using bisect, the
+# same way the timing tree does it. A decoder turns a class into the timing
+# it matches with a table that is built once for its spec, so parsing the
+# stream becomes a list lookup for each pulse instead of a window compare
+# for each timing of the spec.
+#
+# Only streams the pure Python parser handles with a simple loop get
+# classified here: pulse distance and manchester streams that have no middle
+# timings. Anything that is out of the ordinary, a pulse that does not match
+# a timing, a burst pair that is not known or a window that is not part of
+# the alphabet, returns `None` and the frame is left to the pure Python
+# parser, which then raises the same error it always has.
+
+from bisect import bisect_right
+
+
+def can_classify(spec):
+    if spec.stream_encoding == 'bit' or not spec.bursts:
+        return False
+
+    if spec.middle_timings:
+        return False
+
+    return all(
+        isinstance(pair, list) and len(pair) == 2
+        for pair in spec.bursts
+    )
+
+
+class PulseAlphabet(object):
+    """
+    Cuts durations up into classes using the windows passed in.
+
+    :param windows: `(low, high)` windows, both ends are part of the window.
+    """
+
+    def __init__(self, windows=()):
+        edges = set()
+
+        for low, high in windows:
+            edges.add(low)
+            edges.add(high + 1)
+
+        self._edges = frozenset(edges)
+        self.boundaries = sorted(edges)
+        # tables by (FrameSpec.key, tolerance)
+        self._tables = {}
+
+    def __len__(self):
+        # number of classes
+        return len(self.boundaries) + 1
+
+    def get_class(self, pulse):
+        return bisect_right(self.boundaries, pulse)
+
+    def classify(self, pulses):
+        """
+        Turns the pulses of a frame into classes.
+
+        :return: list of classes or `None` if one of the pulses is not an int.
+            The windows hold whole numbers so a class is only able to stand in
+            for a whole number.
+        """
+        boundaries = self.boundaries
+        classes = []
+
+        for pulse in pulses:
+            if type(pulse) is not int:
+                return None
+
+            classes.append(bisect_right(boundaries, pulse))
+
+        return classes
+
+    def get_range(self, low, high):
+        """
+        Classes a window is made of.
+
+        :return: `(first, last)` or `None` if the window is not part of the
+            alphabet.
+        """
+        if low not in self._edges or high + 1 not in self._edges:
+            return None
+
+        return (
+            bisect_right(self.boundaries, low),
+            bisect_right(self.boundaries, high)
+        )
+
+    def _build_table(self, spec, windows):
+        if spec.stream_encoding == 'manchester':
+            mark, space = spec.bursts[0]
+            # a pulse is able to be 1 or 2 half bits
+            half_bits = [(mark,), (space,), (mark, mark), (space, space)]
+        else:
+            half_bits = [(timing,) for pair in spec.bursts for timing in pair]
+
+        table = [None] * len(self)
+
+        # a class that is part of more then one window stands for the timing
+        # that is tried first
+        for timings in half_bits:
+            class_range = self.get_range(*windows[sum(timings)])
+
+            if class_range is None:
+                return None
+
+            first, last = class_range
+            for cls in range(first, last + 1):
+                if table[cls] is None:
+                    table[cls] = timings
+
+        return table
+
+    def get_table(self, spec, windows):
+        """
+        Table that maps a class to the half bits it stands for in a stream
+        built from `spec`.
+
+        :return: list or `None` if the spec is not able to be classified.
+        """
+        key = (spec.key, windows.tolerance)
+
+        try:
+            return self._tables[key]
+        except KeyError:
+            pass
+
+        if can_classify(spec):
+            table = self._build_table(spec, windows)
+        else:
+            table = None
+
+        self._tables[key] = table
+        return table
+
+    def classify_stream(self, spec, windows, classes, cleaned_code):
+        """
+        Turns the stream of a frame into burst pairs and bits.
+
+        :param spec: :class:`code_wrapper.FrameSpec`
+        :param windows: :class:`timing_windows.TimingWindows`
+        :param classes: the classes of the pulses between the lead in and the
+            lead out.
+        :param cleaned_code: gets the normalized half bits added to it.
+
+        :return: `(pairs, value, num_bits)` or `None` if the stream has to be
+            parsed by the pure Python parser. The first bit of the stream is
+            the most significant bit of `value`.
+        """
+        if not classes:
+            return None
+
+        table = self.get_table(spec, windows)
+
+        if table is None:
+            return None
+
+        half_bits = []
+
+        for cls in classes:
+            timings = table[cls]
+
+            if timings is None:
+                return None
+
+            half_bits += timings
+
+        symbol_values = spec.symbol_values
+        pairs = []
+        value = 0
+        num_bits = 0
+
+        if len(half_bits) % 2:
+            # the last space of the stream is allowed to be missing. The space
+            # of the first burst pair with the same mark gets added.
+            mark = half_bits[-1]
+            for burst_mark, space in spec.bursts:
+                if burst_mark == mark:
+                    half_bits.append(space)
+                    break
+            else:
+                return None
+
+        for i in range(0, len(half_bits), 2):
+            pair = half_bits[i:i + 2]
+
+            try:
+                bits, count = symbol_values[tuple(pair)]
+            except KeyError:
+                return None
+
+            pairs.append(pair)
+            value = value << count | bits
+            num_bits += count
+
+        cleaned_code += half_bits
+
+        return pairs, value, num_bits
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+# Every decoder checks an incoming frame against the codes that have been
+# saved for it before it decodes the frame. Comparing the frame against each
+# saved code gets slow once there are a lot of saved codes.
+#
+# The normalized rlc of a saved code is made up of the handful of timings
+# the protocol uses. The index stores the saved codes by their normalized
+# rlc. A frame gets turned into the normalized rlc it would match by rounding
+# each duration to the resolution of the index, the same thing the decode
+# cache does to build a signature, and looking up the timings whose window
+# covers that bucket. The windows in a bucket get checked so a duration that
+# sits close to the edge of a window is not mapped to a timing it does not
+# match. The normalized rlc is then looked up in the index and the code that
+# is found gets compared to the frame. A duration that falls inside of the
+# tolerance of more then one timing gives more then one normalized rlc to
+# look up.
+#
+# Only codes that have a single normalized rlc get indexed, those are the
+# only ones a frame is able to match.
+
+import itertools
+import threading
+from collections import Counter
+
+
+# the number of normalized rlc's a frame is allowed to expand to before the
+# saved codes get compared to the frame one at a time.
+MAX_CANDIDATES = 64
+
+# durations are rounded to this many microseconds
+RESOLUTION = 50
+
+
+class SavedCodeIndex(object):
+
+    def __init__(self, decoder):
+        self._decoder = decoder
+        self._lock = threading.RLock()
+        self._codes = {}
+        self._timings = Counter()
+        self._count = 0
+        # (tolerance, {bucket: [(low, high, timing)]})
+        self._buckets = None
+
+    def __len__(self):
+        return sum(len(codes) for codes in self._codes.values())
+
+    @staticmethod
+    def _get_key(code):
+        # noinspection PyProtectedMember
+        normalized_rlc = code._normalized_rlc
+
+        if len(normalized_rlc) != 1:
+            return None
+
+        return tuple(normalized_rlc[0])
+
+    def add(self, code):
+        key = self._get_key(code)
+        if key is None:
+            return
+
+        with self._lock:
+            self._count += 1
+            self._codes.setdefault(key, []).append((self._count, code))
+            self._timings.update(key)
+            self._buckets = None
+
+    def remove(self, code):
+        key = self._get_key(code)
+        if key is None:
+            return
+
+        with self._lock:
+            codes = self._codes.get(key, [])
+
+            for i, (_, saved_code) in enumerate(codes):
+                if saved_code is code:
+                    codes.pop(i)
+                    break
+            else:
+                return
+
+            if not codes:
+                del self._codes[key]
+
+            self._timings.subtract(key)
+
+            for timing in key:
+                if self._timings[timing] <= 0:
+                    del self._timings[timing]
+
+            self._buckets = None
+
+    def clear(self):
+        with self._lock:
+            self._codes.clear()
+            self._timings.clear()
+            self._buckets = None
+
+    def _get_buckets(self):
+        # noinspection PyProtectedMember
+        windows = self._decoder._get_timing_windows()
+        buckets = self._buckets
+
+        # the windows change with the tolerance of the decoder
+        if buckets is None or buckets[0] != windows.tolerance:
+            table = {}
+
+            for timing in self._timings:
+                low, high = windows[timing]
+
+                for bucket in range(
+                    low // RESOLUTION,
+                    high // RESOLUTION + 1
+                ):
+                    table.setdefault(bucket, []).append((low, high, timing))
+
+            buckets = (windows.tolerance, table)
+            self._buckets = buckets
+
+        return buckets[1]
+
+    def find(self, data):
+        """
+        Finds the saved code that matches a frame.
+
+        :param data: frame of rlc data.
+        :type data: list
+
+        :return: the saved code that was saved first out of the saved codes
+            that match `data` or `None`.
+        :rtype: Optional[ir_code.IRCode]
+        """
+        with self._lock:
+            if not self._codes:
+                return None
+
+            buckets = self._get_buckets()
+
+            options = []
+            count = 1
+
+            for item in data:
+                windows = buckets.get(item // RESOLUTION, None)
+
+                if windows is None:
+                    return None
+
+                matches = list(
+                    timing for low, high, timing in windows
+                    if low <= item <= high
+                )
+
+                if not matches:
+                    return None
+
+                count *= len(matches)
+                options.append(matches)
+
+            if count == 1:
+                candidates = self._codes.get(
+                    tuple(timings[0] for timings in options),
+                    []
+                )
+            elif count > MAX_CANDIDATES:
+                candidates = (
+                    entry for key, codes in self._codes.items()
+                    if len(key) == len(data)
+                    for entry in codes
+                )
+            else:
+                candidates = (
+                    entry for key in itertools.product(*options)
+                    for entry in self._codes.get(key, [])
+                )
+
+            found = None
+            for order, code in candidates:
+                if (found is None or order < found[0]) and code == data:
+                    found = (order, code)
+
+            if found is not None:
+                return found[1]
@@ -49,6 +49,7 @@ class TimerThreadWorker(object):
     def __init__(self):
         self.stop_event = threading.Event()
         self.queue_event = threading.Event()
+        self.queue_lock = threading.Lock()
         self.queue = []
         self.thread = None
 
@@ -60,7 +61,9 @@ class TimerThreadWorker(object):
 
     def stop(self):
         if self.thread is not None:
-            del self.queue[:]
+            with self.queue_lock:
+                del self.queue[:]
+
             self.stop_event.set()
             self.queue_event.set()
             self.thread.join(3.0)
@@ -70,9 +73,10 @@ class TimerThreadWorker(object):
                 self.thread = None
 
     def add(self, timer):
-        if timer not in self.queue:
-            self.queue.append(timer)
-            self.queue_event.set()
+        with self.queue_lock:
+            if timer not in self.queue:
+                self.queue.append(timer)
+                self.queue_event.set()
 
     def run(self):
         del self.queue[:]
@@ -97,7 +101,9 @@ class TimerThreadWorker(object):
 
             for timer in self.queue[:]:
                 if timer.run_func():
-                    self.queue.remove(timer)
+                    with self.queue_lock:
+                        if timer in self.queue:
+                            self.queue.remove(timer)
 
         self.queue_event.clear()
         self.stop_event.clear()
@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# ****************************************************************************
+
+# The timing tree is used by the dispatcher to narrow down the decoders that
+# get handed a frame. It is compiled from the lead in, bursts, middle timings
+# and lead out of every decoder. Each level of the tree is one pulse of the
+# lead in. The windows (expected timing widened by the tolerance) of every
+# decoder at a level are cut into non overlapping intervals and each interval
+# holds a bit mask of the decoders that accept a pulse in that interval.
+#
+# When a frame comes in each pulse of the frame is looked up once in the
+# level for its position using bisect and the masks get and'ed together.
+# What is left are the decoders that are able to decode the frame. Protocols
+# that share a lead in (the NEC family, the Sony variants) end up in the same
+# set of decoders and it is up to the decoder to sort out which one it is.
+#
+# A decoder that is not able to state what the lead in of a frame is going to
+# be (bit encoded streams, decoders that parse the lead in themselves) sits
+# in every interval so it always gets tried.
+#
+# A compiled tree never changes so trees that are built from the same
+# protocols using the same settings share the compiled levels. Each
+# `protocols.Decoder` instance has its own tree and this keeps them from all
+# compiling the same thing.
+
+import threading
+from bisect import bisect_right
+
+from .timing_windows import get_window
+
+
+MAX_SHARED = 16
+
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def _in_windows(value, windows):
+    return any(low <= value <= high for low, high in windows)
+
+
+def lead_in_levels(spec, tolerance):
+    """
+    Builds the windows each pulse of the lead in has to fall into.
+
+    This follows what :class:`code_wrapper.CodeWrapper` accepts for the lead
+    in. A lead in pulse is allowed to have the first mark of a burst or a
+    middle timing merged into it. If that merged mark could also be taken as
+    the next pulse of the lead in the pulses of the frame no longer line up
+    with the levels so the levels stop there.
+
+    If the lead in is not able to be determined `None` is returned.
+    """
+    encoding = spec.stream_encoding
+    lead_in = spec.lead_in
+    bursts = spec.bursts
+    lead_out = spec.lead_out
+
+    if encoding == 'bit':
+        return None
+
+    if not lead_in:
+        if encoding == 'manchester':
+            return None
+
+        if bursts:
+            timings = [timing for burst in bursts for timing in burst]
+        elif lead_out and lead_out[0] != -999999999999:
+            timings = [lead_out[0]]
+        else:
+            return None
+
+        return [
+            tuple(set(get_window(timing, tolerance) for timing in timings))
+        ]
+
+    marks = [burst[0] for burst in bursts]
+    marks += [
+        timing[0] for timing in spec.middle_timings if isinstance(timing, list)
+    ]
+
+    def windows(e_burst):
+        timings = [e_burst] + [e_burst + mark for mark in marks]
+        return tuple(
+            set(get_window(timing, tolerance) for timing in timings)
+        )
+
+    levels = []
+
+    for i, e_burst in enumerate(lead_in):
+        if e_burst == -999999999999:
+            break
+
+        levels += [windows(e_burst)]
+
+        if i + 1 < len(lead_in):
+            next_windows = windows(lead_in[i + 1])
+            if any(_in_windows(mark, next_windows) for mark in marks):
+                break
+
+    return levels
+
+
+def decoder_levels(decoder):
+    """
+    Builds the windows for each level of the tree for a decoder.
+
+    Both the lead in and the repeat lead in are taken into account. `None` is
+    returned if the decoder has to be handed every frame.
+    """
+    # noinspection PyProtectedMember
+    if not decoder._index_lead_in:
+        return None
+
+    # noinspection PyProtectedMember
+    levels = lead_in_levels(decoder._get_frame_spec(), decoder.tolerance)
+
+    if levels is None:
+        return None
+
+    # noinspection PyProtectedMember
+    if decoder._repeat_lead_in or decoder._repeat_lead_out:
+        # noinspection PyProtectedMember
+        repeat_levels = lead_in_levels(
+            decoder._get_repeat_frame_spec(),
+            decoder.tolerance
+        )
+
+        if repeat_levels is None:
+            return None
+
+        levels = [
+            tuple(set(windows + repeat_windows))
+            for windows, repeat_windows in zip(levels, repeat_levels)
+        ]
+
+    return levels
+
+
+class _Level(object):
+
+    def __init__(self, entries, wildcard_mask):
+        # entries is a list of (low, high, bit)
+        counts = {}
+        events = {}
+
+        for low, high, bit in entries:
+            events.setdefault(low, []).append((bit, 1))
+            events.setdefault(high + 1, []).append((bit, -1))
+
+        self.boundaries = sorted(events.keys())
+        self.masks = [wildcard_mask]
+
+        mask = 0
+        for boundary in self.boundaries:
+            for bit, count in events[boundary]:
+                counts[bit] = counts.get(bit, 0) + count
+
+                if counts[bit]:
+                    mask |= bit
+                else:
+                    mask &= ~bit
+
+            self.masks += [wildcard_mask | mask]
+
+    def __call__(self, pulse):
+        return self.masks[bisect_right(self.boundaries, pulse)]
+
+
+class TimingTree(object):
+
+    def __init__(self):
+        self._decoders = []
+        self._levels = None
+        self._mask = 0
+        self._wildcard_mask = 0
+        self._lock = threading.Lock()
+
+    def build(self, decoders):
+        """
+        Sets the decoders the tree is compiled from.
+
+        The order of the decoders is the order they get returned in when
+        doing a lookup.
+        """
+        with self._lock:
+            self._decoders = list(decoders)
+            self._levels = None
+
+    def invalidate(self):
+        with self._lock:
+            self._levels = None
+
+    def _compile(self):
+        key = tuple(
+            (decoder.__class__, decoder.enabled, decoder.tolerance)
+            for decoder in self._decoders
+        )
+
+        with _shared_lock:
+            compiled = _shared.get(key, None)
+
+        if compiled is None:
+            compiled = self._compile_levels()
+
+            with _shared_lock:
+                if len(_shared) >= MAX_SHARED:
+                    _shared.clear()
+
+                _shared[key] = compiled
+
+        levels, self._mask, self._wildcard_mask = compiled
+        # set last, lookups do not take the lock once the levels are set
+        self._levels = levels
+
+    def _compile_levels(self):
+        entries = []
+        wildcard_mask = 0
+        mask = 0
+
+        for i, decoder in enumerate(self._decoders):
+            if not decoder.enabled:
+                continue
+
+            bit = 1 << i
+            mask |= bit
+
+            levels = decoder_levels(decoder)
+
+            if levels is None:
+                wildcard_mask |= bit
+                continue
+
+            for depth, windows in enumerate(levels):
+                if depth == len(entries):
+                    entries += [[]]
+
+                for low, high in windows:
+                    entries[depth] += [(low, high, bit)]
+
+        # a decoder that has fewer levels then the depth of the tree accepts
+        # anything for the levels it does not have
+        levels = []
+        for depth, level_entries in enumerate(entries):
+            depth_bits = 0
+            for _, _, bit in level_entries:
+                depth_bits |= bit
+
+            levels += [_Level(level_entries, mask & ~depth_bits)]
+
+        return levels, mask, wildcard_mask
+
+    def _get_levels(self):
+        levels = self._levels
+
+        if levels is None:
+            with self._lock:
+                if self._levels is None:
+                    self._compile()
+
+                levels = self._levels
+
+        return levels
+
+    def get_mask(self, frame):
+        """
+        Walks the frame through the tree and returns the bit mask of the
+        decoders that are able to decode it.
+        """
+        levels = self._get_levels()
+        mask = self._mask
+
+        for level, pulse in zip(levels, frame):
+            mask &= level(pulse)
+            if not mask:
+                break
+
+        return mask
+
+    def get_decoders(self, frame):
+        """
+        Returns the enabled decoders that are able to decode `frame`.
+        """
+        mask = self.get_mask(frame)
+        decoders = self._decoders
+        res = []
+
+        while mask:
+            bit = mask & -mask
+            res += [decoders[bit.bit_length() - 1]]
+            mask ^= bit
+
+        return res
+
+    @property
+    def depth(self):
+        return len(self._get_levels())
+
+    @property
+    def wildcard_decoders(self):
+        """
+        The enabled decoders that get handed every frame.
+        """
+        self._get_levels()
+        mask = self._wildcard_mask
+
+        return list(
+            decoder for i, decoder in enumerate(self._decoders)
+            if mask >> i & 1
+        )
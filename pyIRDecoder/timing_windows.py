@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+
+# A timing matches when it falls inside of a window around the expected
+# timing, the size of the window is set by the tolerance of the decoder.
+# Working out that window takes a couple of floating point operations and
+# a decode ends up doing it hundreds of times for the same handful of
+# timings.
+#
+# A decoder compiles the windows for all of the timings in its spec once for
+# each tolerance it gets used with. Matching a timing is then a dict lookup
+# and 2 integer compares.
+
+import math
+
+
+def get_window(timing, tolerance):
+    """
+    Works out the window a duration has to fall in to match `timing`.
+
+    The window never crosses 0 so a mark is not able to match a space.
+
+    :return: `(low, high)`
+    """
+    high = math.floor(timing + (timing * (tolerance / 100.0)))
+    low = math.floor(timing - (timing * (tolerance / 100.0)))
+
+    # do a flip flop of the high and low so the same expression can
+    # be used when evaluating a raw timing
+    if timing < 0:
+        return high, min(low, 0)
+
+    if timing > 0:
+        return max(low, 0), high
+
+    return low, high
+
+
+def get_timings(spec):
+    """
+    Collects the timings from lead ins, lead outs, middle timings and bursts.
+    """
+    if isinstance(spec, dict):
+        return get_timings(spec.get('bursts', []))
+
+    if isinstance(spec, (list, tuple)):
+        timings = set()
+        for item in spec:
+            timings.update(get_timings(item))
+
+        return timings
+
+    if isinstance(spec, (int, float)):
+        return {spec}
+
+    return set()
+
+
+class TimingWindows(dict):
+    """
+    Table of `timing: (low, high)` windows for a single tolerance.
+
+    Timings that are not in the table, like a lead out that gets worked out
+    from the length of a frame, have their window worked out when they are
+    looked up. Those windows do not get added so the table does not grow.
+    """
+
+    def __init__(self, tolerance, timings=()):
+        dict.__init__(self)
+        self.tolerance = tolerance
+
+        for timing in timings:
+            self[timing] = get_window(timing, tolerance)
+
+    def __missing__(self, timing):
+        return get_window(timing, self.tolerance)
+
+    def match(self, value, timing):
+        low, high = self[timing]
+        return low <= value <= high
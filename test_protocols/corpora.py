@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+# The frames and parameters of the protocol tests are used as a corpus by the
+# tests that check the decoders as a whole.
+
+import os
+import importlib
+
+from pyIRDecoder import protocols, EncodeError
+
+
+def _frames(rlc):
+    # a code that is made up of more than one frame is a list of frames
+    if rlc and isinstance(rlc[0], list):
+        return [frame[:] for frame in rlc]
+
+    return [rlc[:]]
+
+
+def get_corpora():
+    """
+    Collects the frames from every protocol test.
+
+    The codes for the parameters get encoded using a decoder instance of
+    their own, encoding changes the state of some of the decoders.
+
+    :return: list of `(test name, protocol name, list of codes)`, each code
+        is a list of frames.
+    """
+    res = []
+
+    path = os.path.dirname(__file__)
+    decoder = protocols.Decoder()
+
+    try:
+        for file_name in sorted(os.listdir(path)):
+            if (
+                not file_name.startswith('test_') or
+                not file_name.endswith('.py')
+            ):
+                continue
+
+            name = file_name[:-3]
+            module = importlib.import_module(__package__ + '.' + name)
+
+            if not hasattr(module, 'protocol'):
+                continue
+
+            protocol = getattr(decoder, module.protocol.name)
+            corpus = getattr(module, protocol.name, None)
+
+            if corpus is None:
+                continue
+
+            codes = [_frames(rlc) for rlc in corpus.rlc]
+
+            for params in corpus.params:
+                if params is None:
+                    continue
+
+                try:
+                    code = protocol.encode(**params)
+                except (EncodeError, NotImplementedError):
+                    continue
+
+                codes += [[frame[:] for frame in code.normalized_rlc]]
+
+            res += [(name, protocol.name, codes)]
+    finally:
+        decoder.close()
+
+    return res
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+import pytest
+
+from pyIRDecoder import protocols, batch_decode, DecodeError
+from pyIRDecoder.batch_decode import DecodeResult
+
+
+NEC_RLC = [
+    9024, -4512, 564, -564, 564, -1692, 564, -1692, 564, -1692, 564,
+    -564, 564, -1692, 564, -564, 564, -564, 564, -564, 564, -564, 564,
+    -1692, 564, -564, 564, -1692, 564, -1692, 564, -564, 564, -564,
+    564, -1692, 564, -564, 564, -564, 564, -564, 564, -564, 564, -1692,
+    564, -1692, 564, -564, 564, -564, 564, -1692, 564, -1692, 564,
+    -1692, 564, -1692, 564, -564, 564, -564, 564, -1692, 564, -40884
+]
+
+UNKNOWN_RLC = [
+    3000, -3000, 1000, -7000, 3000, -1000, 1000, -3000, 2000, -60000
+]
+
+
+def test_decode_many():
+    frames = [NEC_RLC, UNKNOWN_RLC, NEC_RLC] * 5
+    results = list(
+        protocols.decode_many(frames, 38000, workers=2, chunk_size=4)
+    )
+
+    assert len(results) == len(frames)
+
+    for i, result in enumerate(results):
+        if i % 3 == 1:
+            assert result is None
+        else:
+            assert isinstance(result, DecodeResult)
+            assert result.decoder == 'NEC'
+            assert result.code == 'NEC.2E:34:61'
+            assert result.params['D'] == 0x2E
+            assert result.params['F'] == 0x61
+
+
+def test_decoder_settings():
+    protocols.NEC.enabled = False
+    try:
+        results = list(protocols.decode_many([NEC_RLC], 38000, workers=1))
+    finally:
+        protocols.NEC.enabled = True
+
+    assert results[0] is None or results[0].decoder != 'NEC'
+
+
+def test_errors(monkeypatch):
+    def _decode(data, frequency):
+        if data == UNKNOWN_RLC:
+            raise DecodeError
+        raise ValueError
+
+    monkeypatch.setattr(protocols, 'decode', _decode)
+    monkeypatch.setattr(batch_decode, '_decoder', protocols)
+
+    # a frame a decoder falls over on does not stop the rest of the chunk
+    # noinspection PyProtectedMember
+    results = batch_decode._decode_chunk([NEC_RLC, UNKNOWN_RLC], 38000)
+    assert len(results) == 2
+    assert results[0].decoder is None
+    assert 'ValueError' in results[0].error
+    assert results[1] is None
+
+
+def test_decoder_instance():
+    decoder = protocols.Decoder()
+    try:
+        code = decoder.decode(NEC_RLC[:], 38000)
+        # noinspection PyProtectedMember
+        decoder._reset_state()
+        code.name = 'Power'
+        code.save()
+
+        expected = str(decoder.decode(NEC_RLC[:], 38000))
+        assert expected == 'Power'
+
+        results = list(decoder.decode_many([NEC_RLC], 38000, workers=1))
+        assert results[0].code == expected
+        assert results[0].error is None
+
+        decoder.NEC.enabled = False
+        results = list(decoder.decode_many([NEC_RLC], 38000, workers=1))
+        assert results[0] is None or results[0].decoder != 'NEC'
+    finally:
+        decoder.close()
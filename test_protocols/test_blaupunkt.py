@@ -24,10 +24,13 @@
 # THE SOFTWARE.
 # ****************************************************************************
 
+import pytest
+
 from pyIRDecoder import (
     RepeatLeadInError, 
     RepeatLeadOutError,
-    IRException
+    IRException,
+    DecodeError
 )
 from pyIRDecoder import protocols
 
@@ -105,3 +108,17 @@ def test_encode():
         assert new_ir_code == ir_code
 
         break
+
+
+def test_start_frame_twice():
+    decoder = protocols.Decoder()
+
+    try:
+        with pytest.raises(RepeatLeadInError):
+            decoder.Blaupunkt.decode(Blaupunkt.rlc[0][:], protocol.frequency)
+
+        # a second start frame without a code in between is turned away
+        with pytest.raises(DecodeError):
+            decoder.Blaupunkt.decode(Blaupunkt.rlc[0][:], protocol.frequency)
+    finally:
+        decoder.close()
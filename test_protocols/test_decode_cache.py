@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+from pyIRDecoder import protocols
+from pyIRDecoder.decode_cache import DecodeCache, NegativeCache
+
+
+NEC_RLC = [
+    9024, -4512, 564, -564, 564, -1692, 564, -1692, 564, -1692, 564,
+    -564, 564, -1692, 564, -564, 564, -564, 564, -564, 564, -564, 564,
+    -1692, 564, -564, 564, -1692, 564, -1692, 564, -564, 564, -564,
+    564, -1692, 564, -564, 564, -564, 564, -564, 564, -564, 564, -1692,
+    564, -1692, 564, -564, 564, -564, 564, -1692, 564, -1692, 564,
+    -1692, 564, -1692, 564, -564, 564, -564, 564, -1692, 564, -40884
+]
+
+UNKNOWN_RLC = [
+    3000, -3000, 1000, -7000, 3000, -1000, 1000, -3000, 2000, -60000
+]
+
+
+def _reset():
+    protocols._last_code = None
+    protocols._last_decoder = None
+    protocols.NEC._last_code = None
+
+
+def test_signature():
+    cache = DecodeCache(resolution=50)
+
+    assert (
+        cache.signature([560, -1690], 38000) ==
+        cache.signature([570, -1700], 37800)
+    )
+    assert (
+        cache.signature([560, -1690], 38000) !=
+        cache.signature([600, -1690], 38000)
+    )
+
+
+def test_hit():
+    cache = DecodeCache()
+    protocols.decode_cache = cache
+    try:
+        _reset()
+        code1 = protocols.decode(NEC_RLC[:], protocols.NEC.frequency)
+        assert len(cache) == 1
+
+        assert protocols.last_used_decoder == protocols.NEC
+
+        protocols._last_code = None
+        protocols.NEC._last_code = None
+        protocols.decode(NEC_RLC[:], protocols.NEC.frequency)
+        assert cache.hits == 1
+
+        code2 = protocols._last_code
+        assert code2 is not code1
+        assert code2.decoder == protocols.NEC
+        assert str(code2) == str(code1)
+        assert code2.original_rlc == NEC_RLC
+    finally:
+        protocols.decode_cache = None
+        _reset()
+
+
+def test_max_size():
+    code = protocols.NEC.decode(NEC_RLC[:], protocols.NEC.frequency)
+    protocols.NEC._last_code = None
+
+    cache = DecodeCache(max_size=1)
+    cache.add(NEC_RLC, 38000, code)
+    cache.add(NEC_RLC, 40000, code)
+
+    assert len(cache) == 1
+    assert cache.evictions == 1
+    assert cache.get_code(NEC_RLC, 38000, protocols.NEC) is None
+    assert cache.get_code(NEC_RLC, 40000, protocols.NEC) is not None
+    assert cache.get_code(NEC_RLC, 40000, protocols.RC6) is None
+
+
+def test_settings_changed():
+    cache = DecodeCache()
+    protocols.decode_cache = cache
+    tolerance = protocols.NEC.tolerance
+    try:
+        _reset()
+        protocols.decode(NEC_RLC[:], protocols.NEC.frequency)
+        assert len(cache) == 1
+
+        protocols.NEC.tolerance = tolerance + 1
+        assert len(cache) == 0
+    finally:
+        protocols.NEC.tolerance = tolerance
+        protocols.decode_cache = None
+        _reset()
+
+
+def test_negative_cache():
+    cache = NegativeCache()
+    protocols.negative_cache = cache
+    tolerance = protocols.NEC.tolerance
+    try:
+        _reset()
+        assert protocols.decode(UNKNOWN_RLC[:], 38000) is None
+        assert cache.misses == 1
+        assert len(cache) == 1
+
+        assert protocols.decode(UNKNOWN_RLC[:], 38000) is None
+        assert cache.hits == 1
+
+        protocols.NEC.tolerance = tolerance + 1
+        assert len(cache) == 0
+    finally:
+        protocols.NEC.tolerance = tolerance
+        protocols.negative_cache = None
+        _reset()
+
+
+def test_frequency_tolerance_changed():
+    cache = NegativeCache()
+    protocols.negative_cache = cache
+    frequency_tolerance = protocols.NEC.frequency_tolerance
+    frequency = int(protocols.NEC.frequency * 1.1)
+    try:
+        _reset()
+        assert protocols.decode(NEC_RLC[:], frequency) is None
+        assert len(cache) == 1
+
+        protocols.NEC.frequency_tolerance = 15
+        assert len(cache) == 0
+
+        code = protocols.decode(NEC_RLC[:], frequency)
+        assert code is not None
+        assert code.decoder == protocols.NEC
+    finally:
+        protocols.NEC.frequency_tolerance = frequency_tolerance
+        protocols.negative_cache = None
+        _reset()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+import asyncio
+import threading
+import time
+
+from pyIRDecoder import protocols
+
+
+NEC_RLC1 = protocols.NEC.encode(1, 2, 3).original_rlc
+NEC_RLC2 = protocols.NEC.encode(1, 2, 4).original_rlc
+
+
+def _reset():
+    protocols._reset_state()
+
+
+def test_async_decode():
+    _reset()
+
+    async def run():
+        return await protocols.async_decode(NEC_RLC1[:])
+
+    code = asyncio.run(run())
+    assert str(code) == 'NEC.01:02:03'
+
+
+def test_async_decode_off_loop(monkeypatch):
+    _reset()
+    threads = []
+    decode = protocols.decode
+
+    def _decode(*args):
+        threads.append(threading.get_ident())
+        return decode(*args)
+
+    monkeypatch.setattr(protocols, 'decode', _decode)
+
+    async def run():
+        await protocols.async_decode(NEC_RLC1[:])
+        return threading.get_ident()
+
+    # the frame does not get decoded on the thread the loop runs on
+    loop_thread = asyncio.run(run())
+    assert threads and loop_thread not in threads
+
+
+def test_stream():
+    _reset()
+
+    async def run():
+        async with protocols.stream() as stream:
+            await stream.send(NEC_RLC1[:])
+
+            event = await asyncio.wait_for(stream.__anext__(), 1.0)
+            assert str(event.code) == 'NEC.01:02:03'
+            assert not event.released
+
+            event = await asyncio.wait_for(stream.__anext__(), 2.0)
+            assert str(event.code) == 'NEC.01:02:03'
+            assert event.released
+
+        events = [event async for event in stream]
+        assert events == []
+        assert stream.closed
+
+    asyncio.run(run())
+
+
+def test_stream_send_off_loop(monkeypatch):
+    _reset()
+    decode = protocols.decode
+
+    def _decode(*args):
+        time.sleep(0.2)
+        return decode(*args)
+
+    monkeypatch.setattr(protocols, 'decode', _decode)
+
+    async def tick(ticks):
+        while True:
+            await asyncio.sleep(0.01)
+            ticks.append(None)
+
+    async def run():
+        ticks = []
+
+        async with protocols.stream() as stream:
+            ticker = asyncio.ensure_future(tick(ticks))
+            try:
+                code = await stream.send(NEC_RLC1[:])
+            finally:
+                ticker.cancel()
+
+            assert str(code) == 'NEC.01:02:03'
+
+            event = await asyncio.wait_for(stream.__anext__(), 1.0)
+            assert event.code is code
+
+        # the loop kept running while the frame was being decoded
+        assert len(ticks) > 5
+
+    asyncio.run(run())
+
+
+def test_backpressure():
+    _reset()
+
+    async def run():
+        async with protocols.stream(maxsize=1) as stream:
+            await stream.send(NEC_RLC1[:])
+
+            # the queue is full so this waits until it gets cancelled
+            try:
+                await asyncio.wait_for(stream.send(NEC_RLC2[:]), 0.1)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                raise AssertionError('send did not wait')
+
+            event = await stream.__anext__()
+            assert str(event.code) == 'NEC.01:02:03'
+            assert not event.released
+
+            # the cancelled send never decoded the frame
+            assert str(protocols._last_code) == 'NEC.01:02:03'
+
+            code = await asyncio.wait_for(stream.send(NEC_RLC2[:]), 1.0)
+            assert str(code) == 'NEC.01:02:04'
+
+    asyncio.run(run())
+    _reset()
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+import threading
+
+import pytest
+
+from pyIRDecoder import protocols, RepeatLeadInError
+
+
+NEC_RLC1 = protocols.NEC.encode(1, 2, 3).original_rlc
+NEC_RLC2 = protocols.NEC.encode(1, 2, 4).original_rlc
+
+BLAUPUNKT_START_RLC = [
+    +512, -2560, +512, -512, +512, -512, +512, -512, +512, -512, +512,
+    -512, +512, -512, +512, -512, +512, -512, +512, -512, +512, -23040
+]
+BLAUPUNKT_RLC = [
+    +512, -2560, +512, -512, +512, -1024, +1024, -1024, +512, -512, +512,
+    -512, +1024, -512, +512, -1024, +512, -120832
+]
+
+
+def test_independent_state():
+    decoder1 = protocols.Decoder()
+    decoder2 = protocols.Decoder()
+
+    try:
+        assert decoder1.NEC is not decoder2.NEC
+        assert decoder1.NEC is not protocols.NEC
+
+        code = decoder1.decode(NEC_RLC1[:])
+        assert str(code) == 'NEC.01:02:03'
+        assert decoder1.last_used_decoder == decoder1.NEC
+        assert decoder2.last_used_decoder is None
+
+        code = decoder2.decode(NEC_RLC2[:])
+        assert str(code) == 'NEC.01:02:04'
+
+        # the same frame again on the first instance is a repeat
+        assert decoder1.decode(NEC_RLC1[:]) is None
+    finally:
+        decoder1.close()
+        decoder2.close()
+
+    # closing the instances leaves the module working
+    protocols._reset_state()
+    assert str(protocols.decode(NEC_RLC1[:])) == 'NEC.01:02:03'
+    protocols._reset_state()
+
+
+def test_stored_codes():
+    decoder1 = protocols.Decoder()
+    decoder2 = protocols.Decoder()
+
+    try:
+        with pytest.raises(RepeatLeadInError):
+            decoder1.Blaupunkt.decode(BLAUPUNKT_START_RLC[:])
+
+        # the start frame belongs to the first instance, the second instance
+        # decodes the frame without it
+        code = decoder2.Blaupunkt.decode(BLAUPUNKT_RLC[:])
+        assert str(code) == 'Blaupunkt.05:03'
+        assert decoder2.Blaupunkt._stored_codes == []
+        assert len(decoder1.Blaupunkt._stored_codes) == 1
+    finally:
+        decoder1.close()
+        decoder2.close()
+
+
+def test_settings():
+    decoder1 = protocols.Decoder()
+    decoder2 = protocols.Decoder()
+
+    try:
+        decoder1.timing_tree.depth
+        decoder2.timing_tree.depth
+
+        # same settings so the compiled tree gets shared
+        assert decoder1.timing_tree._levels is decoder2.timing_tree._levels
+
+        decoder1.NEC.enabled = False
+        assert decoder2.NEC.enabled
+
+        decoder1.timing_tree.depth
+        assert decoder1.timing_tree._levels is not decoder2.timing_tree._levels
+
+        code = decoder1.decode(NEC_RLC1[:])
+        assert code is None or code.decoder.name != 'NEC'
+        assert str(decoder2.decode(NEC_RLC1[:])) == 'NEC.01:02:03'
+    finally:
+        decoder1.close()
+        decoder2.close()
+
+
+def test_threads():
+    decoders = list(protocols.Decoder() for _ in range(4))
+    frames = list(
+        [
+            protocols.NEC.encode(i, 0, 0).original_rlc,
+            protocols.NEC.encode(i, 0, 1).original_rlc
+        ]
+        for i in range(4)
+    )
+    results = {}
+
+    def run(index):
+        decoder = decoders[index]
+        res = set()
+
+        for i in range(20):
+            code = decoder.decode(frames[index][i % 2][:])
+            if code is not None:
+                res.add(str(code))
+
+        results[index] = res
+
+    threads = list(
+        threading.Thread(target=run, args=(i,)) for i in range(4)
+    )
+
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        for decoder in decoders:
+            decoder.close()
+
+    for i in range(4):
+        # a code that gets released while the threads are busy makes
+        # the next frame come back as None so only the codes that did
+        # come back get checked
+        assert results[i]
+        assert results[i] <= {
+            'NEC.%02X:00:00' % i,
+            'NEC.%02X:00:01' % i
+        }
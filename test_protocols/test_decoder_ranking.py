@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+from pyIRDecoder import protocols, IRException
+from pyIRDecoder.config import Config
+from pyIRDecoder.decoder_ranking import DecoderRanking, can_overlap
+
+from . import corpora
+
+
+NEC_RLC = [
+    9024, -4512, 564, -564, 564, -1692, 564, -1692, 564, -1692, 564,
+    -564, 564, -1692, 564, -564, 564, -564, 564, -564, 564, -564, 564,
+    -1692, 564, -564, 564, -1692, 564, -1692, 564, -564, 564, -564,
+    564, -1692, 564, -564, 564, -564, 564, -564, 564, -564, 564, -1692,
+    564, -1692, 564, -564, 564, -564, 564, -1692, 564, -1692, 564,
+    -1692, 564, -1692, 564, -564, 564, -564, 564, -1692, 564, -40884
+]
+
+
+def _decode_corpora(decoder):
+    res = []
+
+    for name, protocol, codes in corpora.get_corpora():
+        frequency = getattr(decoder, protocol).frequency
+
+        for frames in codes:
+            # noinspection PyProtectedMember
+            decoder._reset_state()
+            names = set()
+
+            for frame in frames:
+                try:
+                    code = decoder.decode(frame, frequency)
+                except IRException as err:
+                    names.add(err.__class__.__name__)
+                    continue
+
+                # a repeat comes back as None
+                if code is not None:
+                    names.add(code.decoder.name)
+
+            res.append((name, names))
+
+    return res
+
+
+def _get_candidates(frame):
+    # the decoders the dispatcher hands to the ranking for a frame
+    return [
+        decoder for decoder in protocols.timing_tree.get_decoders(frame)
+        if decoder.name != 'Universal'
+    ]
+
+
+def test_sort():
+    frame = protocols.RC6.encode(0, 1, 0).normalized_rlc[0]
+    decoders = _get_candidates(frame)
+    assert decoders.index(protocols.Dyson) < decoders.index(protocols.RC6)
+
+    ranking = DecoderRanking()
+
+    for _ in range(10):
+        ranking.hit(protocols.RC6)
+
+    ranking.hit(protocols.Dyson)
+
+    sorted_decoders = ranking.sort(decoders)
+    assert sorted(sorted_decoders, key=decoders.index) == decoders
+
+    # Dyson is not able to decode an RC6 frame
+    rc6_index = sorted_decoders.index(protocols.RC6)
+    assert rc6_index < sorted_decoders.index(protocols.Dyson)
+
+    # the decoders in front of RC6 that are able to decode the same frame
+    # are still tried first
+    for decoder in decoders[:decoders.index(protocols.RC6)]:
+        if can_overlap(decoder, protocols.RC6):
+            assert sorted_decoders.index(decoder) < rc6_index
+
+
+def test_sort_dispatcher():
+    frame = protocols.Sony20.encode(1, 2, 3).normalized_rlc[0]
+
+    decoder = protocols.Decoder()
+    try:
+        decoder.adaptive_ordering = True
+        # noinspection PyProtectedMember
+        decoder._ranking.set_hit_count('Sony20', 10.0)
+        # noinspection PyProtectedMember
+        decoder._ranking.set_hit_count('Sony12', 1.0)
+
+        decoder.Sony12.reset_reject_counts()
+        code = decoder.decode(frame[:], protocols.Sony20.frequency)
+        assert code.decoder.name == 'Sony20'
+
+        # Sony20 got the frame before Sony12 did
+        assert not any(decoder.Sony12.reject_counts.values())
+    finally:
+        decoder.close()
+
+
+def test_decay():
+    ranking = DecoderRanking(decay=0.5)
+    ranking.hit(protocols.RC6)
+    ranking.hit(protocols.NEC)
+
+    assert ranking.get_hit_count('RC6') == 0.5
+    assert ranking.get_hit_count('NEC') == 1.0
+    assert ranking.ranking == [('NEC', 1.0), ('RC6', 0.5)]
+
+
+def test_adaptive_ordering():
+    protocols.adaptive_ordering = True
+    try:
+        protocols.decode(NEC_RLC, protocols.NEC.frequency)
+        assert protocols.decoder_ranking[0][0] == 'NEC'
+        assert protocols.NEC.hit_count > 0
+        assert protocols.NEC.xml.hit_count == protocols.NEC.hit_count
+    finally:
+        protocols.adaptive_ordering = False
+        # noinspection PyProtectedMember
+        protocols._ranking.clear()
+
+
+def test_overlapping_decoders():
+    ranking = DecoderRanking()
+    ranking.hit(protocols.NECf16)
+
+    # NECf16 decodes the same frames as NEC, NEC has to be tried first
+    decoders = [protocols.NEC, protocols.NECf16]
+    assert ranking.sort(decoders) == decoders
+
+
+def test_warmed_ranking():
+    decoder = protocols.Decoder()
+    try:
+        expected = _decode_corpora(decoder)
+    finally:
+        decoder.close()
+
+    decoder = protocols.Decoder()
+    try:
+        decoder.adaptive_ordering = True
+
+        # the decoders that get tried last have the most hits
+        for i, protocol in enumerate(decoder):
+            # noinspection PyProtectedMember
+            decoder._ranking.set_hit_count(protocol.name, i + 1.0)
+
+        assert _decode_corpora(decoder) == expected
+    finally:
+        decoder.close()
+
+
+def test_config_reload(tmp_path):
+    path = str(tmp_path / 'config.xml')
+
+    decoder = protocols.Decoder(Config(path))
+    try:
+        decoder.adaptive_ordering = True
+        decoder.decode(NEC_RLC[:], protocols.NEC.frequency)
+        hit_count = decoder.NEC.hit_count
+    finally:
+        decoder.close()
+
+    decoder = protocols.Decoder(Config(path))
+    try:
+        assert decoder.adaptive_ordering is True
+        assert isinstance(decoder.NEC.hit_count, float)
+        assert decoder.NEC.hit_count == hit_count
+        assert decoder.decoder_ranking[0][0] == 'NEC'
+    finally:
+        decoder.close()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import pytest
+
+from pyIRDecoder import protocols, LeadInError
+from pyIRDecoder.demodulation_cache import DemodulationCache
+
+
+def test_groups():
+    groups = protocols.demodulation_groups
+
+    for names in (
+        ['NEC', 'NECf16', 'Pioneer'],
+        ['RC6', 'RC6M16', 'RC6M32'],
+        ['Sky', 'SkyHD', 'SkyPlus'],
+    ):
+        group = [group for group in groups if names[0] in group][0]
+        assert set(names).issubset(group)
+
+    # NECx has a shorter lead in then NEC
+    group = [group for group in groups if 'NEC' in group][0]
+    assert 'NECx' not in group
+
+
+# noinspection PyProtectedMember
+def test_shared_stream():
+    cache = DemodulationCache()
+    nec = protocols.NEC
+    pioneer = protocols.Pioneer
+
+    data = nec.encode(1, 2, 3).normalized_rlc[0]
+    spec = nec._get_frame_spec()
+    windows = nec._get_timing_windows()
+    assert spec.key == pioneer._get_frame_spec().key
+
+    cache.start(data)
+    try:
+        frame_match = cache.match_frame(spec, windows, data)
+        assert cache.match_frame(spec, windows, data) is frame_match
+
+        code = cache.parse(spec, nec.tolerance, data, windows, frame_match)
+        assert cache.parse(
+            pioneer._get_frame_spec(),
+            pioneer.tolerance,
+            data,
+            pioneer._get_timing_windows(),
+            frame_match
+        ) is code
+
+        assert cache.hits == 2
+        assert cache.misses == 2
+
+        # a different list is not the frame that is being dispatched
+        other = cache.parse(spec, nec.tolerance, data[:], windows, None)
+        assert other is not code
+        assert other.bits == code.bits
+    finally:
+        cache.stop()
+
+    assert cache.parse(spec, nec.tolerance, data, windows, None) is not code
+    assert cache.hits == 2
+
+
+# noinspection PyProtectedMember
+def test_shared_error():
+    cache = DemodulationCache()
+    nec = protocols.NEC
+    spec = nec._get_frame_spec()
+    windows = nec._get_timing_windows()
+
+    data = nec.encode(1, 2, 3).normalized_rlc[0]
+    data[0] = data[0] // 2
+
+    cache.start(data)
+    try:
+        for _ in range(2):
+            with pytest.raises(LeadInError):
+                cache.parse(spec, nec.tolerance, data, windows, None)
+    finally:
+        cache.stop()
+
+    assert cache.hits == 1
+
+
+def test_dispatcher():
+    cache = protocols.demodulation_cache
+    data = protocols.RC6M32.encode(1, 2, 3, 4, 5).normalized_rlc[0]
+
+    try:
+        protocols.demodulation_cache = None
+        # noinspection PyProtectedMember
+        protocols._reset_state()
+        expected = protocols.decode(data[:], 36000)
+
+        protocols.demodulation_cache = DemodulationCache()
+        # noinspection PyProtectedMember
+        protocols._reset_state()
+        code = protocols.decode(data[:], 36000)
+    finally:
+        protocols.demodulation_cache = cache
+        # noinspection PyProtectedMember
+        protocols._reset_state()
+
+    assert code.decoder.name == expected.decoder.name == 'RC6M32'
+    assert str(code) == str(expected)
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import pytest
+
+from pyIRDecoder import protocols, DecodeError
+from pyIRDecoder.field_checks import FieldChecks
+
+
+PARAMETERS = [
+    ['A', 0, 0],
+    ['B', 1, 3],
+    ['C', 4, 7],
+    ['D', 8, 11],
+]
+
+
+def test_constant_fields():
+    checks = FieldChecks('msb', 12, PARAMETERS, [['A', 1], ['B', 6]], [])
+    assert checks.check(0b1110_0000_0000)
+    assert checks.check(0b1110_1010_0101)
+    assert not checks.check(0b0110_0000_0000)
+    assert not checks.check(0b1111_0000_0000)
+
+    # the bits of an lsb field are in the stream in reverse order
+    checks = FieldChecks('lsb', 12, PARAMETERS, [['A', 1], ['B', 6]], [])
+    assert checks.check(0b1011_0000_0000)
+    assert not checks.check(0b1110_0000_0000)
+
+    with pytest.raises(ValueError):
+        FieldChecks('msb', 12, PARAMETERS, [['B', 8]], [])
+
+
+def test_inverted_fields():
+    for encoding in ('lsb', 'msb'):
+        checks = FieldChecks(encoding, 12, PARAMETERS, [], [['D', 'C']])
+        assert checks.check(0b0000_0110_1001)
+        assert checks.check(0b1111_0000_1111)
+        assert not checks.check(0b0000_0110_1000)
+        assert not checks.check(0b0000_0000_0000)
+
+    with pytest.raises(ValueError):
+        FieldChecks('msb', 12, PARAMETERS, [], [['B', 'C']])
+
+
+def test_decode():
+    # noinspection PyProtectedMember
+    protocols._reset_state()
+
+    decoder = protocols.NEC
+    decoder.reset_reject_counts()
+
+    data = decoder.encode(1, 2, 3).normalized_rlc[0]
+    code = decoder.decode(data[:])
+    decoder.reset(code)
+
+    # flip the first bit of the inverted function
+    data[51] = -564 if data[51] < -1000 else -1692
+
+    with pytest.raises(DecodeError) as exc:
+        decoder.decode(data)
+
+    assert str(exc.value) == 'Checksum failed'
+    assert decoder.reject_counts['fields'] == 1
+    assert decoder.reject_counts['parse'] == 0
+
+
+def test_rc6_family():
+    for decoder, params in (
+        (protocols.RC6, dict(device=1, function=2)),
+        (protocols.MCE, dict(function=0x0C)),
+    ):
+        code = decoder.encode(**params)
+        code = decoder.decode(code.normalized_rlc[0], decoder.frequency)
+        decoder.reset(code)
+
+        # noinspection PyProtectedMember
+        checks = decoder._get_field_checks()
+        # noinspection PyProtectedMember
+        bit_value = code._code.bit_value
+        num_bits = decoder.bit_count
+
+        assert checks.check(bit_value)
+        # C0 is the first bit of the stream
+        assert not checks.check(bit_value ^ 1 << (num_bits - 1))
+        # mode is bits 1 - 3
+        assert not checks.check(bit_value ^ 1 << (num_bits - 3))
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import pytest
+
+from pyIRDecoder import (
+    protocols,
+    LeadOutError,
+    NotEnoughBitsError,
+    TooManyBitsError
+)
+from pyIRDecoder import code_wrapper
+
+
+def _in_bounds(data, bounds):
+    duration = sum(abs(item) for item in data)
+
+    if len(data) < bounds.min_pulses:
+        return False
+    if bounds.max_pulses is not None and len(data) > bounds.max_pulses:
+        return False
+    if duration < bounds.min_duration:
+        return False
+    if bounds.max_duration is not None and duration > bounds.max_duration:
+        return False
+
+    return True
+
+
+def test_encoded_frames_in_bounds():
+    for decoder, params in (
+        (protocols.NEC, dict(device=1, sub_device=2, function=3)),
+        (protocols.RC5, dict(device=5, function=7)),
+        (protocols.RC6, dict(device=5, function=7)),
+        (protocols.Sony12, dict(device=1, function=3)),
+    ):
+        bounds = decoder.frame_bounds
+        assert bounds.max_pulses is not None
+
+        code = decoder.encode(**params)
+
+        for tolerance in (-0.1, 0.0, 0.1):
+            data = list(
+                int(item * (1 + tolerance))
+                for item in code.normalized_rlc[0]
+            )
+            assert _in_bounds(data, bounds), decoder.name
+
+
+def test_rejected_before_parse(monkeypatch):
+    def _code_wrapper(*_, **__):
+        raise AssertionError('frame should not have been parsed')
+
+    monkeypatch.setattr(code_wrapper, 'CodeWrapper', _code_wrapper)
+
+    # noinspection PyProtectedMember
+    protocols._reset_state()
+    data = protocols.Sony12.encode(1, 3).normalized_rlc[0]
+
+    assert len(data) < protocols.NEC.frame_bounds.min_pulses
+
+    # the frame bounds get checked for the frames the dispatcher hands out
+    # noinspection PyProtectedMember
+    rejection = protocols.NEC._try_decode(data[:12])
+    assert rejection.stage == 'frame_bounds'
+    assert isinstance(rejection.error(), NotEnoughBitsError)
+
+    # noinspection PyProtectedMember
+    rejection = protocols.Sony12._try_decode(data * 2)
+    assert rejection.stage == 'frame_bounds'
+    assert isinstance(rejection.error(), TooManyBitsError)
+
+
+def test_decode_errors():
+    # noinspection PyProtectedMember
+    protocols._reset_state()
+    data = protocols.Sony12.encode(1, 3).normalized_rlc[0]
+
+    # decode raises the same errors it did before there were frame bounds
+    with pytest.raises(LeadOutError):
+        protocols.NEC.decode(data[:12])
+
+    with pytest.raises(LeadOutError):
+        protocols.Sony12.decode(data * 2)
+
+
+def test_tolerance_changed():
+    bounds = protocols.NEC.frame_bounds
+    tolerance = protocols.NEC.tolerance
+
+    try:
+        protocols.NEC.tolerance = tolerance * 2
+        assert protocols.NEC.frame_bounds.max_duration > bounds.max_duration
+        assert protocols.NEC.frame_bounds.min_duration < bounds.min_duration
+    finally:
+        protocols.NEC.tolerance = tolerance
+
+    assert protocols.NEC.frame_bounds == bounds
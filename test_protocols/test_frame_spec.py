@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+from pyIRDecoder import protocols
+from pyIRDecoder.code_wrapper import FrameSpec, CodeWrapper
+
+
+def test_stream_encoding():
+    for decoder, stream_encoding in (
+        (protocols.NEC, 'halfbit'),
+        (protocols.RC5, 'manchester'),
+        (protocols.RC6, 'manchester'),
+    ):
+        # noinspection PyProtectedMember
+        spec = decoder._get_frame_spec()
+        assert spec.stream_encoding == stream_encoding
+
+        code = decoder.encode(*[
+            min_val for _, min_val, _ in decoder.encode_parameters
+        ])
+        code = decoder.decode(code.normalized_rlc[0], decoder.frequency)
+        # noinspection PyProtectedMember
+        assert code._code.stream_encoding == stream_encoding
+        decoder.reset(code)
+
+
+def test_symbols():
+    spec = FrameSpec('lsb', [], [], [], [[1, -1], [1, -3]])
+    assert spec.symbols == {(1, -1): [0], (1, -3): [1]}
+
+    spec = FrameSpec(
+        'msb', [], [], [], [[1, -1], [1, -2], [1, -3], [1, -4]]
+    )
+    assert spec.symbols[(1, -1)] == [0, 0]
+    assert spec.symbols[(1, -4)] == [1, 1]
+
+    spec = FrameSpec('lsb', [], [], [], [600, -600])
+    assert spec.stream_encoding == 'bit'
+    assert spec.symbols == {600: [0], -600: [1]}
+
+    spec = FrameSpec(
+        'msb', [], [], [], [[1, -1], [1, -2], [1, -3], [1, -4]]
+    )
+    assert spec.symbol_values[(1, -2)] == (1, 2)
+    assert spec.symbol_values[(1, -3)] == (2, 2)
+
+
+def test_spec_changed():
+    decoder = protocols.NEC
+    # noinspection PyProtectedMember
+    spec = decoder._get_frame_spec()
+    # noinspection PyProtectedMember
+    assert decoder._get_frame_spec() is spec
+
+    lead_in = decoder._lead_in[:]
+    try:
+        decoder._lead_in[1] = -2000
+        # noinspection PyProtectedMember
+        new_spec = decoder._get_frame_spec()
+        assert new_spec is not spec
+        assert new_spec.lead_in == (lead_in[0], -2000)
+    finally:
+        decoder._lead_in[:] = lead_in
+
+    # noinspection PyProtectedMember
+    assert decoder._get_frame_spec().lead_in == tuple(lead_in)
+
+
+def test_frame_not_copied_or_modified():
+    decoder = protocols.RC6
+    data = decoder.encode(5, 7).normalized_rlc[0]
+    expected = data[:]
+
+    # noinspection PyProtectedMember
+    spec = decoder._get_frame_spec()
+    # noinspection PyProtectedMember
+    windows = decoder._get_timing_windows()
+
+    code1 = CodeWrapper.from_spec(spec, decoder.tolerance, data, windows)
+    code2 = CodeWrapper.from_spec(
+        spec,
+        decoder.tolerance,
+        tuple(data),
+        windows
+    )
+
+    assert data == expected
+    assert code1.original_code == expected
+    assert code1.bits == code2.bits
+    assert list(code1) == list(code2)
+
+
+def test_get_value():
+    for decoder in (protocols.Fujitsu128, protocols.NEC48, protocols.RC6):
+        params = list(
+            (min_val + max_val) // 3
+            for _, min_val, max_val in decoder.encode_parameters
+        )
+        code = decoder.encode(*params)
+        code = decoder.decode(code.normalized_rlc[0], decoder.frequency)
+        decoder.reset(code)
+
+        # noinspection PyProtectedMember
+        wrapper = code._code
+        bits = wrapper.bits
+        assert len(bits) == wrapper.num_bits
+
+        # noinspection PyProtectedMember
+        for name, start, stop in decoder._parameters:
+            field = bits[start:stop + 1]
+            if decoder.encoding == 'lsb':
+                field = field[::-1]
+
+            expected = int(''.join(str(bit) for bit in field) or '0', 2)
+            assert wrapper.get_value(start, stop) == expected, name
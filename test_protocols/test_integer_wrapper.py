@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+import pytest
+
+from pyIRDecoder.integer_wrapper import IntegerWrapper
+
+
+def test_bits():
+    value = IntegerWrapper(0b10110001, 8)
+
+    assert list(value) == [1, 0, 0, 0, 1, 1, 0, 1]
+    assert value.bits == [1, 0, 1, 1, 0, 0, 0, 1]
+    assert value[0] == 1
+    assert value[1] == 0
+    assert value[-1] == 1
+
+    with pytest.raises(IndexError):
+        value[8]
+
+    assert int(value.num_one_bits) == 4
+
+    # the value gets cut down to the number of bits
+    assert int(IntegerWrapper(0x1FF, 8)) == 0xFF
+
+
+def test_slices():
+    value = IntegerWrapper(0b10110001, 8)
+
+    assert int(value[:4]) == 0b0001
+    assert len(value[:4]) == 4
+    assert int(value[:4:4]) == 0b1011
+    assert int(value[:-4]) == 0b1000
+    assert int(value[:-4:4]) == 0b1101
+    assert int(value[True:8:0]) == 0b01001110
+    assert value[0b1011:4:4] is True
+    assert value[0b1010:4:4] is False
+
+
+def test_reverse_and_invert():
+    value = IntegerWrapper(0b10110001, 8)
+
+    assert int(reversed(value)) == 0b10001101
+    assert int(value.reverse_bit_order(12)) == 0b100011010000
+    assert int(value.invert_bits(12)) == 0b111101001110
+
+    value = IntegerWrapper(1 << 70 | 2, 71)
+    assert int(reversed(value)) == 1 << 69 | 1
+    assert int(value.invert_bits()) == (1 << 71) - 1 - (1 << 70 | 2)
+
+
+def test_operations():
+    value = IntegerWrapper(0b1011, 4, None, 'lsb')
+    assert not hasattr(value, '__dict__')
+
+    other = IntegerWrapper(0b0110, 4)
+    assert value == 0b1011
+    assert value > other
+    assert hash(value) == hash(0b1011)
+
+    res = value << 4 | other
+    assert isinstance(res, IntegerWrapper)
+    assert int(res) == 0b10110110
+    assert len(res) == 8
+    assert res.encoding == 'lsb'
+
+    # the in place operations change the wrapper
+    alias = value
+    value |= 0b0100
+    assert alias is value
+    assert int(alias) == 0b1111
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from pyIRDecoder import protocols, protocol_base
+
+
+# noinspection PyProtectedMember
+def test_lazy_timer():
+    decoder = protocols.NEC
+    data = decoder.encode(1, 2, 3).normalized_rlc[0]
+    code = decoder.decode(data[:], decoder.frequency)
+    decoder.reset(code)
+
+    assert not hasattr(code, '__dict__')
+    assert code._repeat_timer is None
+    assert code._callbacks is None
+
+    timer = code.repeat_timer
+    assert code.repeat_timer is timer
+    assert timer.duration == sum(abs(item) for item in data)
+
+
+# noinspection PyProtectedMember
+def test_released():
+    decoder = protocols.NEC
+    data = decoder.encode(1, 2, 3).normalized_rlc[0]
+
+    code = decoder.decode(data[:], decoder.frequency)
+    decoder.reset(code)
+    new_code = decoder.decode(data[:], decoder.frequency)
+
+    assert new_code is not code
+    assert new_code == code
+
+    released = []
+    code.bind_released_callback(released.append)
+
+    # the decoder is told when a code is released but a code that is the same
+    # as the last code is not the last code
+    code._IRCode__repeat_reset()
+    assert released == [code]
+    assert decoder._last_code is new_code
+
+    new_code._IRCode__repeat_reset()
+    assert decoder._last_code is None
+
+
+def test_key():
+    decoder = protocols.NEC
+    data = decoder.encode(1, 2, 3).normalized_rlc[0]
+
+    code = decoder.decode(data[:], decoder.frequency)
+    decoder.reset(code)
+    same_code = decoder.decode(data[:], decoder.frequency)
+    decoder.reset(same_code)
+    other_code = decoder.encode(1, 2, 4)
+
+    assert code.key == (decoder.__class__, (1, 2, 3))
+    assert code == same_code
+    assert code != other_code
+    assert len({code, same_code, other_code}) == 2
+
+    # the codes of a different protocol are never the same
+    pioneer_code = protocols.Pioneer.encode(1, 2, 3)
+    assert str(pioneer_code).split('.', 1)[1] == str(code).split('.', 1)[1]
+    assert pioneer_code != code
+
+    same_code.name = 'Power'
+    assert same_code.key == (decoder.__class__, 'Power')
+    assert same_code != code
+
+
+# noinspection PyProtectedMember
+def test_set_params():
+    decoder = protocols.NEC
+    code = decoder.encode(1, 2, 3)
+    other_code = decoder.encode(1, 2, 4)
+
+    # get everything that is cached worked out before the function changes
+    assert code != other_code
+    assert str(code) != str(other_code)
+    assert int(code) != int(other_code)
+
+    code._set_params(F=4)
+    assert code.function == 4
+    assert code.key == other_code.key
+    assert code == other_code
+    assert str(code) == str(other_code)
+    assert int(code) == int(other_code)
+    assert code.hexadecimal == other_code.hexadecimal
+
+
+def test_decoder_sets_param(monkeypatch):
+    decode = protocol_base.IrProtocolBase.decode
+
+    # gets the key and the int of the code worked out before Viewstar
+    # reverses the function
+    def _decode(self, data, frequency=0):
+        code = decode(self, data, frequency)
+        hash(code)
+        int(code)
+        return code
+
+    monkeypatch.setattr(protocol_base.IrProtocolBase, 'decode', _decode)
+
+    decoder = protocols.Viewstar
+    expected = decoder.encode(5)
+    code = decoder.decode(expected.normalized_rlc[0][:], decoder.frequency)
+    decoder.reset(code)
+
+    assert code.function == 5
+    assert hash(code) == hash(expected)
+    assert int(code) == int(expected)
+    assert code == expected
+
+
+def test_int():
+    # NEC is sent lsb first, every field gets reversed
+    code = protocols.NEC.encode(1, 2, 3)
+    assert int(code) == 0x8040C0
+    assert code.hexadecimal == '0x8040C0'
+
+    # RC5 is sent msb first, D:5 then F:6
+    code = protocols.RC5.encode(1, 2, 0)
+    assert int(code) == 1 << 6 | 2
+    assert code.hexadecimal == '0x42'
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+import pytest
+
+from pyIRDecoder import protocols, code_wrapper
+
+from . import corpora
+
+
+# every corpus gets decoded by one decoder instance for each backend, some
+# decoders keep state from one code to the next
+@pytest.fixture(scope='module')
+def decoders():
+    decoders = (protocols.Decoder(), protocols.Decoder())
+    yield decoders
+
+    for decoder in decoders:
+        decoder.close()
+
+
+def _decode_corpus(decoder, protocol, codes):
+    ir_decoder = getattr(decoder, protocol)
+    res = []
+
+    for frames in codes:
+        # noinspection PyProtectedMember
+        decoder._reset_state()
+
+        for frame in frames:
+            # what matters is that both backends end up in the same place,
+            # a decoder that falls over has to fall over with both of them
+            try:
+                code = ir_decoder.decode(frame[:], ir_decoder.frequency)
+            except Exception as err:  # NOQA
+                res.append(err.__class__.__name__)
+                continue
+
+            # noinspection PyProtectedMember
+            params = sorted(
+                (key, int(value)) for key, value in code._data.items()
+            )
+            # noinspection PyProtectedMember
+            wrapper = code._code
+
+            if wrapper is None:
+                res.append(params)
+            else:
+                res.append((
+                    params,
+                    wrapper.bits,
+                    wrapper.stream_pairs,
+                    list(wrapper)
+                ))
+
+    return res
+
+
+def test_set_backend():
+    assert code_wrapper.get_backend() == 'python'
+
+    with pytest.raises(ValueError):
+        code_wrapper.set_backend('fortran')
+
+    assert code_wrapper.get_backend() == 'python'
+
+
+_corpora = corpora.get_corpora()
+
+
+@pytest.mark.parametrize(
+    'protocol, codes',
+    [(protocol, codes) for _, protocol, codes in _corpora],
+    ids=[name for name, _, _ in _corpora]
+)
+def test_numpy_matches_python(decoders, protocol, codes):
+    pytest.importorskip('numpy')
+
+    python_decoder, numpy_decoder = decoders
+
+    expected = _decode_corpus(python_decoder, protocol, codes)
+    code_wrapper.set_backend('numpy')
+    try:
+        assert _decode_corpus(numpy_decoder, protocol, codes) == expected
+    finally:
+        code_wrapper.set_backend('python')
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from pyIRDecoder import protocols
+from pyIRDecoder.code_wrapper import CodeWrapper
+from pyIRDecoder.pulse_alphabet import PulseAlphabet
+
+
+def test_classes():
+    alphabet = PulseAlphabet([(100, 200), (150, 300)])
+
+    assert alphabet.boundaries == [100, 150, 201, 301]
+    assert len(alphabet) == 5
+    assert alphabet.get_class(99) == 0
+    assert alphabet.get_class(100) == 1
+    assert alphabet.get_class(200) == 2
+    assert alphabet.get_class(301) == 4
+
+    assert alphabet.get_range(100, 200) == (1, 2)
+    assert alphabet.get_range(150, 300) == (2, 3)
+    assert alphabet.get_range(100, 300) == (1, 3)
+    assert alphabet.get_range(120, 200) is None
+
+    assert alphabet.classify([99, -200, 300]) == [0, 0, 3]
+    assert alphabet.classify([99, -200.5]) is None
+
+
+# noinspection PyProtectedMember
+def _check_stream(decoder, data):
+    alphabet = protocols.pulse_alphabet
+    spec = decoder._get_frame_spec()
+    windows = decoder._get_timing_windows()
+
+    assert alphabet.get_table(spec, windows) is not None
+
+    expected = CodeWrapper.from_spec(spec, decoder.tolerance, data, windows)
+    code = CodeWrapper.from_spec(
+        spec,
+        decoder.tolerance,
+        data,
+        windows,
+        None,
+        alphabet,
+        alphabet.classify(data)
+    )
+
+    assert code.bits == expected.bits
+    assert code.bit_value == expected.bit_value
+    assert code.num_bits == expected.num_bits
+    assert code.stream_pairs == expected.stream_pairs
+    assert code.lead_out == expected.lead_out
+
+
+def test_halfbit_stream():
+    data = protocols.NEC.encode(1, 2, 3).normalized_rlc[0]
+    _check_stream(protocols.NEC, data)
+
+
+def test_manchester_stream():
+    data = protocols.RC5.encode(1, 2, 0).normalized_rlc[0]
+    _check_stream(protocols.RC5, data)
+
+
+def test_rebuilt():
+    decoder = protocols.NEC
+    tolerance = decoder.tolerance
+    alphabet = protocols.pulse_alphabet
+
+    try:
+        decoder.tolerance = tolerance + 2
+        assert protocols.pulse_alphabet is not alphabet
+        assert protocols.pulse_alphabet is protocols.pulse_alphabet
+    finally:
+        decoder.tolerance = tolerance
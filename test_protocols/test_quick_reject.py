@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+
+
+import pytest
+
+from pyIRDecoder import (
+    protocols,
+    DecodeError,
+    LeadInError,
+    NotEnoughBitsError
+)
+from pyIRDecoder import code_wrapper
+
+
+def test_quick_reject():
+    nec = protocols.NEC.encode(1, 2, 3).normalized_rlc[0]
+    sony = protocols.Sony12.encode(1, 3).normalized_rlc[0]
+
+    assert not protocols.NEC.quick_reject(nec)
+    assert protocols.NEC.quick_reject(sony)
+    assert protocols.Sony12.quick_reject(nec)
+
+
+def test_lead_in_rejected_before_parse(monkeypatch):
+    def _from_spec(*_, **__):
+        raise AssertionError('frame should not have been parsed')
+
+    monkeypatch.setattr(code_wrapper.CodeWrapper, 'from_spec', _from_spec)
+
+    # a decoder that has a last code tries a frame as a repeat first
+    # noinspection PyProtectedMember
+    protocols._reset_state()
+    data = protocols.NEC.encode(1, 2, 3).normalized_rlc[0]
+    data[0] = data[0] // 2
+
+    with pytest.raises(LeadInError):
+        protocols.NEC.decode(data)
+
+
+def test_reject_counts():
+    decoder = protocols.NEC
+    decoder.reset_reject_counts()
+
+    data = protocols.NEC.encode(1, 2, 3).normalized_rlc[0]
+    sony = protocols.Sony12.encode(1, 3).normalized_rlc[0]
+
+    bad_lead_in = data[:]
+    bad_lead_in[0] = bad_lead_in[0] // 2
+
+    bad_stream = data[:]
+    bad_stream[3] = bad_stream[3] * 2
+
+    # noinspection PyProtectedMember
+    protocols._reset_state()
+
+    for frame in (sony, bad_lead_in, bad_stream):
+        decoder.quick_reject(frame)
+        # noinspection PyProtectedMember
+        decoder._try_decode(frame)
+
+    # quick_reject counts the frames it turns away as well
+    assert decoder.reject_counts == dict(
+        frame_bounds=2,
+        lead_in=2,
+        lead_out=0,
+        parse=1,
+        fields=0
+    )
+
+    assert protocols.reject_counts['NEC'] == decoder.reject_counts
+
+    protocols.reset_reject_counts()
+    assert not any(decoder.reject_counts.values())
+
+
+def test_reject_without_error():
+    # a decoder that has a last code has to see repeat frames
+    # noinspection PyProtectedMember
+    protocols._reset_state()
+
+    sony = protocols.Sony12.encode(1, 3).normalized_rlc[0]
+    nec = protocols.NEC.encode(1, 2, 3).normalized_rlc[0]
+
+    # noinspection PyProtectedMember
+    rejection = protocols.NEC._reject(sony)
+    assert isinstance(rejection, code_wrapper.Rejection)
+    assert rejection.stage == 'frame_bounds'
+
+    error = rejection.error()
+    assert isinstance(error, NotEnoughBitsError)
+    assert 'pulses' in str(error)
+
+    # noinspection PyProtectedMember
+    assert protocols.NEC._reject(nec) is None
+
+
+def test_try_decode():
+    # noinspection PyProtectedMember
+    protocols._reset_state()
+
+    data = protocols.NEC.encode(1, 2, 3).normalized_rlc[0]
+    sony = protocols.Sony12.encode(1, 3).normalized_rlc[0]
+
+    bad_stream = data[:]
+    bad_stream[3] = bad_stream[3] * 2
+
+    # noinspection PyProtectedMember
+    rejection = protocols.NEC._try_decode(sony)
+    assert rejection.stage == 'frame_bounds'
+
+    # noinspection PyProtectedMember
+    rejection = protocols.NEC._try_decode(bad_stream)
+    assert rejection.stage == 'parse'
+    assert isinstance(rejection.error(), DecodeError)
+
+    with pytest.raises(DecodeError):
+        protocols.NEC.decode(bad_stream)
+
+    # Sony12 uses the decode of IrProtocolBase
+    sony[3] = sony[3] * 3
+
+    # noinspection PyProtectedMember
+    rejection = protocols.Sony12._try_decode(sony)
+    assert rejection.stage == 'parse'
+
+    with pytest.raises(DecodeError):
+        protocols.Sony12.decode(sony)
+
+    # noinspection PyProtectedMember
+    code = protocols.NEC._try_decode(data)
+    assert str(code) == 'NEC.01:02:03'
+
+    # noinspection PyProtectedMember
+    protocols._reset_state()
+
+
+def test_dispatcher_rejects_once(monkeypatch):
+    # noinspection PyProtectedMember
+    protocols._reset_state()
+
+    data = protocols.NEC.encode(1, 2, 3).normalized_rlc[0]
+    data[3] = data[3] * 2
+
+    # noinspection PyProtectedMember
+    quick_reject = protocols.NEC._quick_reject
+    calls = []
+
+    def _quick_reject(*args):
+        calls.append(args)
+        return quick_reject(*args)
+
+    monkeypatch.setattr(protocols.NEC, '_quick_reject', _quick_reject)
+
+    protocols.decode(data, protocols.NEC.frequency)
+    assert len(calls) == 1
+
+    # noinspection PyProtectedMember
+    protocols._reset_state()
+
+
+def test_error_message():
+    assert str(DecodeError()) == DecodeError.__doc__
+    assert str(LeadInError(500, ':', [1, 2])) == '500 : [1, 2]'
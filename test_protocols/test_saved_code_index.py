@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+import random
+
+from pyIRDecoder import protocols
+
+
+def _linear_find(decoder, data):
+    for code in decoder:
+        if code == data:
+            return code
+
+
+def test_find():
+    codes = list(protocols.NEC.encode(1, 2, i) for i in range(64))
+    for code in codes:
+        code.save()
+
+    rnd = random.Random(0)
+
+    try:
+        assert len(protocols.NEC._saved_code_index) == 64
+
+        for code in codes:
+            data = list(
+                int(item * rnd.uniform(0.9, 1.1))
+                for item in code.original_rlc
+            )
+            saved_code = protocols.NEC.get_saved_code(data)
+            assert saved_code is code
+            assert saved_code is _linear_find(protocols.NEC, data)
+
+        data = codes[0].original_rlc[:]
+        data[0] = 3000
+        assert protocols.NEC.get_saved_code(data) is None
+    finally:
+        for code in codes:
+            code.delete()
+
+    assert len(protocols.NEC._saved_code_index) == 0
+    assert protocols.NEC.get_saved_code(codes[0].original_rlc[:]) is None
+
+
+def test_delete():
+    code1 = protocols.NEC.encode(1, 2, 3)
+    code2 = protocols.NEC.encode(1, 2, 4)
+    code1.save()
+    code2.save()
+
+    try:
+        code1.delete()
+        assert protocols.NEC.get_saved_code(code1.original_rlc[:]) is None
+        assert protocols.NEC.get_saved_code(code2.original_rlc[:]) is code2
+    finally:
+        code1.delete()
+        code2.delete()
+
+
+def test_single_lookup(monkeypatch):
+    codes = list(protocols.NEC.encode(1, 2, i) for i in range(64))
+    for code in codes:
+        code.save()
+
+    calls = []
+    match = protocols.NEC._match
+
+    def _match(*args, **kwargs):
+        calls.append(args)
+        return match(*args, **kwargs)
+
+    try:
+        monkeypatch.setattr(protocols.NEC, '_match', _match)
+
+        data = codes[10].original_rlc[:]
+        assert protocols.NEC.get_saved_code(data) is codes[10]
+
+        # only the code that was found gets compared to the frame
+        assert len(calls) == len(data)
+    finally:
+        for code in codes:
+            code.delete()
+
+
+def test_tolerance_changed():
+    code = protocols.NEC.encode(1, 2, 3)
+    code.save()
+    tolerance = protocols.NEC.tolerance
+
+    data = list(
+        int(item * (1 + (tolerance + 5) / 100.0))
+        for item in code.original_rlc
+    )
+
+    try:
+        assert protocols.NEC.get_saved_code(data) is None
+
+        protocols.NEC.tolerance = tolerance + 10
+        assert protocols.NEC.get_saved_code(data) is code
+    finally:
+        protocols.NEC.tolerance = tolerance
+        code.delete()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+# *****************************************************************************
+
+
+from pyIRDecoder import protocols
+
+NEC_LEAD_IN = [9024, -4512, 564, -564]
+NEC_REPEAT = [9024, -2256, 564, -96156]
+
+
+def test_lookup():
+    decoders = protocols.timing_tree.get_decoders(NEC_LEAD_IN)
+
+    assert protocols.NEC in decoders
+    assert protocols.NECx not in decoders
+    assert protocols.RC6 not in decoders
+    assert decoders[-1] == protocols.Universal
+
+
+def test_candidate_set():
+    decoders = protocols.timing_tree.get_decoders(NEC_LEAD_IN)
+
+    for decoder in (protocols.NEC48, protocols.NECf16, protocols.NECrnc):
+        assert decoder in decoders
+
+
+def test_repeat_lead_in():
+    assert protocols.NEC in protocols.timing_tree.get_decoders(NEC_REPEAT)
+
+
+def test_enabled_changed():
+    protocols.NEC.enabled = False
+    try:
+        assert protocols.NEC not in protocols.timing_tree.get_decoders(
+            NEC_LEAD_IN
+        )
+    finally:
+        protocols.NEC.enabled = True
+
+    assert protocols.NEC in protocols.timing_tree.get_decoders(NEC_LEAD_IN)
+
+
+def test_tolerance_changed():
+    frame = [12000, -4512]
+    tolerance = protocols.NEC.tolerance
+    protocols.NEC.tolerance = 40
+    try:
+        assert protocols.NEC in protocols.timing_tree.get_decoders(frame)
+    finally:
+        protocols.NEC.tolerance = tolerance
+
+    assert protocols.NEC not in protocols.timing_tree.get_decoders(frame)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+#
+# *****************************************************************************
+# MIT License
+#
+# Copyright (c) 2020 Kevin G. Schlosser
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+import math
+import random
+
+from pyIRDecoder import protocols
+from pyIRDecoder.timing_windows import TimingWindows
+
+
+def _match(value, expected_timing_value, tolerance):
+    if (
+        value < 0 < expected_timing_value or
+        value > 0 > expected_timing_value
+    ):
+        return False
+
+    high = math.floor(
+        expected_timing_value +
+        (expected_timing_value * (tolerance / 100.0))
+    )
+    low = math.floor(
+        expected_timing_value -
+        (expected_timing_value * (tolerance / 100.0))
+    )
+
+    if expected_timing_value < 0:
+        low, high = high, low
+
+    return low <= value <= high
+
+
+def test_match():
+    rnd = random.Random(0)
+
+    for tolerance in (0, 5, 12.5, 20, 100, 150):
+        timings = list(rnd.randint(-5000, 5000) for _ in range(20)) + [0]
+        windows = TimingWindows(tolerance, timings)
+
+        for _ in range(20000):
+            if rnd.random() < 0.5:
+                timing = rnd.choice(timings)
+            else:
+                # not in the table
+                timing = rnd.randint(-10000, 10000)
+
+            value = int(timing * rnd.uniform(-0.5, 2.0))
+            assert (
+                windows.match(value, timing) ==
+                _match(value, timing, tolerance)
+            ), (value, timing, tolerance)
+
+
+def test_compiled_per_tolerance():
+    decoder = protocols.NEC
+    tolerance = decoder.tolerance
+
+    # noinspection PyProtectedMember
+    windows = decoder._get_timing_windows()
+    assert windows.tolerance == tolerance
+    for timing in decoder._lead_in + decoder._lead_out:
+        assert timing in windows
+
+    try:
+        decoder.tolerance = 5
+        # noinspection PyProtectedMember
+        assert decoder._get_timing_windows().tolerance == 5
+        assert not decoder._match(564 * 1.1, 564)
+    finally:
+        decoder.tolerance = tolerance
+
+    assert decoder._match(564 * 1.1, 564)